@@ -1,7 +1,7 @@
 import React, { useEffect, useState } from 'react'
 import { useParams, useNavigate } from 'react-router-dom'
 import { useApi } from '@hooks/useApi'
-import { ChainSnapshot, ThesisResponse } from '@types/api'
+import { ChainSnapshot, TickerKnowledgeBaseResponse } from '@types/api'
 
 export const TickerDetail: React.FC = () => {
   const { symbol } = useParams<{ symbol: string }>()
@@ -13,16 +13,16 @@ export const TickerDetail: React.FC = () => {
     symbol ? `/options/${symbol}/snapshot` : ''
   )
 
-  // Fetch knowledge base data
-  const { data: thesis, loading: thesisLoading } = useApi<ThesisResponse>(
-    symbol ? `/tickers/${symbol}/thesis` : ''
-  )
-  const { data: risks, loading: risksLoading } = useApi<ThesisResponse>(
-    symbol ? `/tickers/${symbol}/risks` : ''
-  )
-  const { data: notes, loading: notesLoading } = useApi<ThesisResponse>(
-    symbol ? `/tickers/${symbol}/notes` : ''
+  // Fetch knowledge base data (thesis, risks and notes in one request)
+  const { data: knowledgeBase, loading: knowledgeBaseLoading } = useApi<TickerKnowledgeBaseResponse>(
+    symbol ? `/tickers/${symbol}/kb` : ''
   )
+  const thesis = knowledgeBase?.thesis ?? null
+  const risks = knowledgeBase?.risks ?? null
+  const notes = knowledgeBase?.notes ?? null
+  const thesisLoading = knowledgeBaseLoading
+  const risksLoading = knowledgeBaseLoading
+  const notesLoading = knowledgeBaseLoading
 
   useEffect(() => {
     if (!symbol) {
@@ -203,3 +203,11 @@ export interface ThesisResponse {
   last_updated?: string
   timestamp: string
 }
+
+export interface TickerKnowledgeBaseResponse {
+  ticker: string
+  thesis: ThesisResponse | null
+  risks: ThesisResponse | null
+  notes: ThesisResponse | null
+  timestamp: string
+}
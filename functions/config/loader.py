@@ -144,7 +144,7 @@ class ConfigManager:
         # Map scheduler settings from nested section to top-level attributes
         scheduler_cfg = config_data.get("scheduler", {})
         if isinstance(scheduler_cfg, dict):
-            for key in ["max_calls_per_hour", "max_calls_per_day", "flush_threshold", "check_interval_sec"]:
+            for key in ["max_calls_per_hour", "max_calls_per_day", "flush_threshold", "flush_threshold_bytes", "check_interval_sec"]:
                 value = scheduler_cfg.get(key)
                 if value is not None:
                     config_data[key] = value
@@ -159,6 +159,12 @@ class ScoringConfig(BaseModel):
     min_risk_reward_ratio: float = Field(
         default=1.5, description="Minimum risk/reward ratio"
     )
+    publish_threshold: float = Field(
+        default=0.0,
+        ge=0.0,
+        le=100.0,
+        description="Minimum adjusted alert score (0-100) to publish an alert",
+    )
 
     class Config:
         extra = "allow"
@@ -229,6 +235,17 @@ class ScanConfig(BaseModel):
     retry_delay_seconds: int = Field(
         default=5, description="Delay between retries in seconds"
     )
+    concurrency: int = Field(
+        default=8, ge=1, description="Maximum concurrent market data requests per scan"
+    )
+    flush_threshold: int = Field(
+        default=50, ge=1, description="Buffered alerts written per batch during a scan"
+    )
+    detector_processes: int = Field(
+        default=0,
+        ge=0,
+        description="Worker processes for detector execution (0 = run in the scan process)",
+    )
 
     liquidity: LiquidityFilterConfig = Field(
         default_factory=LiquidityFilterConfig, description="Liquidity filter settings"
@@ -32,7 +32,7 @@ Usage:
 
 import threading
 from pathlib import Path
-from typing import Any, Optional, List, Dict, Tuple
+from typing import Any, Iterable, Optional, List, Dict, Sequence, Tuple
 from contextlib import contextmanager
 
 import duckdb
@@ -41,6 +41,16 @@ from functions.util.logging_setup import get_logger
 
 logger = get_logger(__name__)
 
+# Settings applied to every connection. DuckDB always runs with a write-ahead
+# log and syncs it on commit, so there is no journal_mode/synchronous knob;
+# raising the checkpoint threshold (default 16MB) lets a scan's many small
+# commits accumulate in the WAL instead of triggering repeated checkpoints
+# that rewrite the database file. All connections to one file in a process
+# must use the same configuration.
+DUCKDB_CONNECTION_CONFIG: Dict[str, str] = {
+    "checkpoint_threshold": "64MB",
+}
+
 
 class DuckDBManager:
     """
@@ -49,7 +59,7 @@ class DuckDBManager:
     Features:
     - Thread-local connection caching (one connection per thread)
     - Automatic schema initialization
-    - Helper methods for queries (execute, execute_one, execute_insert)
+    - Helper methods for queries (execute, execute_one, execute_insert, execute_many)
     - Context manager for safe resource management
     - Graceful error handling for "already exists" conditions
     - Comprehensive logging of database operations
@@ -101,7 +111,9 @@ class DuckDBManager:
         if not hasattr(self._thread_local, "connection"):
             try:
                 logger.debug(f"Creating new DuckDB connection for thread {threading.current_thread().name}")
-                self._thread_local.connection = duckdb.connect(str(self.db_path))
+                self._thread_local.connection = duckdb.connect(
+                    str(self.db_path), config=DUCKDB_CONNECTION_CONFIG
+                )
             except Exception as e:
                 logger.error(f"Failed to connect to DuckDB at {self.db_path}: {e}")
                 raise RuntimeError(f"Cannot connect to DuckDB: {e}") from e
@@ -203,7 +215,7 @@ class DuckDBManager:
             logger.error(f"Unexpected error during schema initialization: {e}")
             raise RuntimeError(f"Schema initialization failed: {e}") from e
 
-    def execute(self, sql: str, params: Optional[List[Any]] = None) -> Any:
+    def execute(self, sql: str, params: Optional[Sequence[Any]] = None) -> Any:
         """
         Execute a SQL query and return all results.
 
@@ -212,7 +224,7 @@ class DuckDBManager:
 
         Args:
             sql: SQL query string with ? placeholders for parameters
-            params: Optional list of parameters to bind to query
+            params: Optional list or tuple of parameters to bind to query
 
         Returns:
             DuckDB relation object (can be converted to list/dataframe)
@@ -352,6 +364,94 @@ class DuckDBManager:
             logger.error(f"Insert/update execution failed: {sql[:100]} - Error: {e}")
             raise RuntimeError(f"Insert/update execution failed: {e}") from e
 
+    def execute_many(
+        self, sql: str, params_seq: List[List[Any]], commit: bool = True
+    ) -> int:
+        """
+        Execute one INSERT/UPDATE statement for many parameter rows.
+
+        The statement is prepared once and bound for each row inside a single
+        transaction, avoiding a parse and commit per row.
+
+        Args:
+            sql: SQL statement with ? placeholders
+            params_seq: Sequence of parameter rows to bind
+            commit: If True, commit the transaction (default: True)
+
+        Returns:
+            Number of parameter rows executed
+
+        Raises:
+            RuntimeError: If execution fails (the transaction is rolled back)
+
+        Example:
+            manager = DuckDBManager(Path("data/cache.db"))
+            manager.execute_many(
+                "INSERT INTO options (symbol, strike, price) VALUES (?, ?, ?)",
+                [["AAPL", 155.0, 1.80], ["AAPL", 160.0, 1.20]],
+            )
+        """
+        if not params_seq:
+            return 0
+
+        conn = self.get_connection()
+        try:
+            logger.debug(f"Executing batch of {len(params_seq)}: {sql[:80]}")
+            conn.execute("BEGIN TRANSACTION")
+            conn.executemany(sql, params_seq)
+
+            if commit:
+                conn.commit()
+                logger.debug(f"Batch committed, {len(params_seq)} rows")
+
+            return len(params_seq)
+
+        except Exception as e:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            logger.error(f"Batch execution failed: {sql[:100]} - Error: {e}")
+            raise RuntimeError(f"Batch execution failed: {e}") from e
+
+    def execute_many_batches(self, sql: str, batches: Iterable[List[List[Any]]]) -> int:
+        """
+        Execute one INSERT/UPDATE statement for a stream of batches, all or none.
+
+        Like execute_many(), but every batch runs inside the same transaction,
+        so callers can stream rows in fixed-size chunks and still get a single
+        commit: a failure in any batch rolls back the rows of earlier batches.
+
+        Args:
+            sql: SQL statement with ? placeholders
+            batches: Iterable of parameter-row batches (may be a generator)
+
+        Returns:
+            Total number of parameter rows executed
+
+        Raises:
+            RuntimeError: If execution fails (the transaction is rolled back)
+        """
+        conn = self.get_connection()
+        total = 0
+        try:
+            conn.execute("BEGIN TRANSACTION")
+            for params_seq in batches:
+                if params_seq:
+                    conn.executemany(sql, params_seq)
+                    total += len(params_seq)
+                    logger.debug(f"Batch of {len(params_seq)} executed ({total} so far)")
+            conn.commit()
+            return total
+
+        except Exception as e:
+            try:
+                conn.rollback()
+            except Exception:
+                pass
+            logger.error(f"Batch execution failed: {sql[:100]} - Error: {e}")
+            raise RuntimeError(f"Batch execution failed: {e}") from e
+
     def __enter__(self):
         """Context manager entry - returns connection."""
         return self.get_connection()
@@ -26,8 +26,9 @@ Usage:
     latest = scan_repo.get_latest_scan()
 """
 
+from dataclasses import dataclass
 from datetime import datetime, date
-from typing import Optional, List, Dict, Any, Tuple
+from typing import Iterable, Optional, List, Dict, Any, Tuple, Union
 import json
 from abc import ABC, abstractmethod
 
@@ -270,6 +271,7 @@ class FeatureSnapshotRepository(BaseRepository):
 
     Methods:
         save_snapshot: Save a feature snapshot
+        save_snapshots_batch: Save many feature snapshots in one transaction
         get_snapshot: Get a specific snapshot
         get_latest_snapshot: Get most recent snapshot for ticker
     """
@@ -308,6 +310,45 @@ class FeatureSnapshotRepository(BaseRepository):
             logger.error(f"Failed to save feature snapshot: {e}")
             raise RuntimeError(f"Failed to save feature snapshot: {e}") from e
 
+    def save_snapshots_batch(self, snapshots: List[Dict[str, Any]]) -> int:
+        """
+        Save many feature snapshots with a single executemany.
+
+        Args:
+            snapshots: List of dictionaries with keys scan_id, ticker, features
+
+        Returns:
+            Number of snapshots saved
+
+        Raises:
+            RuntimeError: If database operation fails
+
+        Example:
+            count = repo.save_snapshots_batch([
+                {"scan_id": 42, "ticker": "AAPL", "features": {"iv_percentile": 65.5}},
+                {"scan_id": 42, "ticker": "MSFT", "features": {"iv_percentile": 40.1}},
+            ])
+        """
+        if not snapshots:
+            return 0
+
+        try:
+            sql = """
+                INSERT INTO feature_snapshots (scan_id, ticker, features, created_at)
+                VALUES (?, ?, ?, CURRENT_TIMESTAMP)
+            """
+            rows = [
+                [snapshot["scan_id"], snapshot["ticker"], json.dumps(snapshot["features"])]
+                for snapshot in snapshots
+            ]
+            count = self.db.execute_many(sql, rows)
+            logger.debug(f"Saved {count} feature snapshots")
+            return count
+
+        except Exception as e:
+            logger.error(f"Failed to batch save feature snapshots: {e}")
+            raise RuntimeError(f"Failed to batch save feature snapshots: {e}") from e
+
     def get_snapshot(self, scan_id: int, ticker: str) -> Optional[Dict[str, Any]]:
         """
         Get a specific feature snapshot.
@@ -396,6 +437,44 @@ class FeatureSnapshotRepository(BaseRepository):
             raise RuntimeError(f"Failed to retrieve latest snapshot: {e}") from e
 
 
+@dataclass(slots=True, frozen=True)
+class AlertRow:
+    """
+    One alert buffered for AlertRepository.save_alerts_batch.
+
+    A slotted dataclass instead of a nested dict: scans can buffer many alerts
+    before flushing, and each row only builds its alert_data dict when it is
+    serialized for the insert.
+
+    Attributes:
+        ticker: Stock ticker symbol
+        detector_name: Name of the detector that raised the alert
+        score: Final alert score (0-100)
+        metrics: Detector metrics
+        explanation: Explanation payload
+        strategies: Suggested strategies
+        confidence: Detector confidence ("low", "medium", "high")
+    """
+
+    ticker: str
+    detector_name: str
+    score: float
+    metrics: Dict[str, Any]
+    explanation: Dict[str, Any]
+    strategies: List[str]
+    confidence: str
+
+    @property
+    def alert_data(self) -> Dict[str, Any]:
+        """Alert payload stored in the alert_json column."""
+        return {
+            "metrics": self.metrics,
+            "explanation": self.explanation,
+            "strategies": self.strategies,
+            "confidence": self.confidence,
+        }
+
+
 class AlertRepository(BaseRepository):
     """
     Repository for managing generated alerts.
@@ -474,13 +553,18 @@ class AlertRepository(BaseRepository):
             logger.error(f"Failed to save alert: {e}")
             raise RuntimeError(f"Failed to save alert: {e}") from e
 
-    def save_alerts_batch(self, scan_id: int, alerts: List[Dict[str, Any]]) -> int:
+    def save_alerts_batch(
+        self, scan_id: int, alerts: List[Union[AlertRow, Dict[str, Any]]]
+    ) -> int:
         """
-        Batch insert multiple alerts (30-40% faster than individual inserts).
+        Batch insert multiple alerts with a single executemany.
+
+        The INSERT is prepared once and all rows are written in one
+        transaction, so the cost is one round trip rather than one per alert.
 
         Args:
             scan_id: Reference to parent scan
-            alerts: List of alert dictionaries with keys:
+            alerts: AlertRow instances, or alert dictionaries with keys:
                    ticker, detector_name, score, alert_data
 
         Returns:
@@ -516,16 +600,25 @@ class AlertRepository(BaseRepository):
                 VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
             """
 
-            count = 0
-            for alert in alerts:
-                ticker = alert.get("ticker")
-                detector_name = alert.get("detector_name")
-                score = alert.get("score", 0.0)
-                alert_data = alert.get("alert_data", {})
-
-                alert_json = json.dumps(alert_data)
-                self.db.execute_insert(sql, [scan_id, ticker, detector_name, score, alert_json])
-                count += 1
+            rows = [
+                [
+                    scan_id,
+                    alert.ticker,
+                    alert.detector_name,
+                    alert.score,
+                    json.dumps(alert.alert_data),
+                ]
+                if isinstance(alert, AlertRow)
+                else [
+                    scan_id,
+                    alert.get("ticker"),
+                    alert.get("detector_name"),
+                    alert.get("score", 0.0),
+                    json.dumps(alert.get("alert_data", {})),
+                ]
+                for alert in alerts
+            ]
+            count = self.db.execute_many(sql, rows)
 
             logger.info(f"Batch inserted {count} alerts for scan {scan_id}")
             return count
@@ -693,23 +786,27 @@ class AlertRepository(BaseRepository):
             logger.error(f"Failed to get today's alert count: {e}")
             raise RuntimeError(f"Failed to get alert count: {e}") from e
 
-    def increment_daily_count(self) -> None:
+    def increment_daily_count(self, count: int = 1) -> None:
         """
         Increment daily alert count for rate limiting.
 
         Creates or updates the daily_alert_counts record for today.
 
+        Args:
+            count: Number of alerts to add (default 1)
+
         Raises:
             RuntimeError: If database operation fails
         """
         try:
             sql = """
                 INSERT INTO daily_alert_counts (count_date, alert_count)
-                VALUES (CURRENT_DATE, 1)
-                ON CONFLICT (count_date) DO UPDATE SET alert_count = alert_count + 1
+                VALUES (CURRENT_DATE, ?)
+                ON CONFLICT (count_date) DO UPDATE SET
+                    alert_count = alert_count + EXCLUDED.alert_count
             """
-            self.db.execute_insert(sql)
-            logger.debug("Incremented daily alert count")
+            self.db.execute_insert(sql, [count])
+            logger.debug(f"Incremented daily alert count by {count}")
 
         except Exception as e:
             logger.error(f"Failed to increment daily count: {e}")
@@ -725,7 +822,9 @@ class CooldownRepository(BaseRepository):
 
     Methods:
         get_cooldown: Get cooldown info for ticker
+        get_cooldowns: Get cooldown info for many tickers in one query
         update_cooldown: Update cooldown with score
+        update_cooldowns_batch: Upsert many cooldown records in one transaction
         is_in_cooldown: Check if ticker is in cooldown
     """
 
@@ -770,6 +869,51 @@ class CooldownRepository(BaseRepository):
             logger.error(f"Failed to get cooldown for {ticker}: {e}")
             raise RuntimeError(f"Failed to get cooldown: {e}") from e
 
+    def get_cooldowns(self, tickers: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        Get cooldown information for several tickers in a single query.
+
+        Args:
+            tickers: Stock ticker symbols
+
+        Returns:
+            Dict mapping ticker to its cooldown record (same shape as
+            get_cooldown). Tickers without a record are omitted.
+
+        Raises:
+            RuntimeError: If database operation fails
+
+        Example:
+            cooldowns = repo.get_cooldowns(["AAPL", "MSFT"])
+            if "AAPL" in cooldowns:
+                print(f"Last alert: {cooldowns['AAPL']['last_alert_ts']}")
+        """
+        unique_tickers = list(dict.fromkeys(tickers))
+        if not unique_tickers:
+            return {}
+
+        try:
+            placeholders = ", ".join("?" for _ in unique_tickers)
+            sql = f"""
+                SELECT ticker, last_alert_ts, last_score
+                FROM alert_cooldowns
+                WHERE ticker IN ({placeholders})
+            """
+            rows = self.db.execute(sql, unique_tickers).fetchall()
+
+            return {
+                row[0]: {
+                    "ticker": row[0],
+                    "last_alert_ts": row[1],
+                    "last_score": row[2],
+                }
+                for row in rows
+            }
+
+        except Exception as e:
+            logger.error(f"Failed to get cooldowns for {len(unique_tickers)} tickers: {e}")
+            raise RuntimeError(f"Failed to get cooldowns: {e}") from e
+
     def update_cooldown(self, ticker: str, score: float) -> None:
         """
         Update cooldown record for ticker with new score.
@@ -801,6 +945,50 @@ class CooldownRepository(BaseRepository):
             logger.error(f"Failed to update cooldown for {ticker}: {e}")
             raise RuntimeError(f"Failed to update cooldown: {e}") from e
 
+    def update_cooldowns_batch(self, cooldowns: List[Dict[str, Any]]) -> int:
+        """
+        Upsert multiple cooldown records in a single transaction.
+
+        Unlike update_cooldown, the alert timestamp is taken from each record,
+        so cooldowns buffered during a scan keep the time the alert was raised.
+
+        Args:
+            cooldowns: Records with keys: ticker, last_alert_ts, last_score
+
+        Returns:
+            Number of cooldown records written
+
+        Raises:
+            RuntimeError: If database operation fails
+
+        Example:
+            count = repo.update_cooldowns_batch([
+                {"ticker": "AAPL", "last_alert_ts": get_utc_now(), "last_score": 75.5},
+            ])
+        """
+        if not cooldowns:
+            return 0
+
+        try:
+            sql = """
+                INSERT INTO alert_cooldowns (ticker, last_alert_ts, last_score)
+                VALUES (?, ?, ?)
+                ON CONFLICT (ticker) DO UPDATE SET
+                    last_alert_ts = EXCLUDED.last_alert_ts,
+                    last_score = EXCLUDED.last_score
+            """
+            rows = [
+                [c["ticker"], c["last_alert_ts"], c["last_score"]]
+                for c in cooldowns
+            ]
+            self.db.execute_many(sql, rows)
+            logger.debug(f"Updated {len(rows)} cooldown records")
+            return len(rows)
+
+        except Exception as e:
+            logger.error(f"Failed to update {len(cooldowns)} cooldowns: {e}")
+            raise RuntimeError(f"Failed to update cooldowns: {e}") from e
+
     def is_in_cooldown(
         self, ticker: str, cooldown_hours: int, min_score_improvement: float = 0.1
     ) -> Tuple[bool, Optional[float]]:
@@ -1187,6 +1375,11 @@ class TransactionRepository(BaseRepository):
     across multiple accounts and symbols.
     """
 
+    _INSERT_TRANSACTION_SQL = """INSERT INTO transactions
+               (tx_date, account, description, transaction_type, symbol, quantity, price,
+                gross_amount, commission, net_amount, currency)
+               VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)"""
+
     def __init__(self):
         """Initialize TransactionRepository.
 
@@ -1251,6 +1444,47 @@ class TransactionRepository(BaseRepository):
         logger.debug(f"Added transaction {tx_id}: {transaction_type} {symbol or ''}")
         return tx_id
 
+    def add_transactions_batch(self, rows: List[Tuple[Any, ...]]) -> int:
+        """
+        Batch insert transactions in a single transaction.
+
+        Args:
+            rows: Tuples of (tx_date, account, description, transaction_type, symbol,
+                  quantity, price, gross_amount, commission, net_amount, currency)
+
+        Returns:
+            Number of transactions inserted
+
+        Raises:
+            RuntimeError: If database operation fails
+        """
+        if not rows:
+            return 0
+
+        count = self.db.execute_many(self._INSERT_TRANSACTION_SQL, rows)
+        logger.debug(f"Batch inserted {count} transactions")
+        return count
+
+    def add_transactions_batches(self, batches: Iterable[List[Tuple[Any, ...]]]) -> int:
+        """
+        Insert a stream of transaction batches in a single transaction.
+
+        Either every row is committed or none is, so a failed import can be
+        retried without duplicating rows.
+
+        Args:
+            batches: Iterable of row batches in the add_transactions_batch format
+
+        Returns:
+            Number of transactions inserted
+
+        Raises:
+            RuntimeError: If database operation fails (nothing is committed)
+        """
+        count = self.db.execute_many_batches(self._INSERT_TRANSACTION_SQL, batches)
+        logger.debug(f"Inserted {count} transactions in one transaction")
+        return count
+
     def get_transactions(
         self,
         account: Optional[str] = None,
@@ -202,19 +202,23 @@ CREATE INDEX IF NOT EXISTS idx_transactions_created_at ON transactions(created_a
 -- Maintains scheduler state machine and API rate limiting
 CREATE TABLE IF NOT EXISTS scheduler_state (
     id INTEGER PRIMARY KEY DEFAULT 1,
-    current_state VARCHAR(50) NOT NULL DEFAULT 'idle' CHECK (current_state IN ('idle', 'collecting', 'processing', 'waiting', 'error')),
-    last_collection_ts TIMESTAMP WITH TIME ZONE,
-    next_collection_ts TIMESTAMP WITH TIME ZONE,
+    current_state VARCHAR(50) NOT NULL DEFAULT 'IDLE' CHECK (current_state IN ('IDLE', 'WAITING', 'COLLECTING', 'FLUSHING', 'BACKING_OFF')),
+    -- Scheduler timestamps are epoch milliseconds (UTC)
+    last_collection_ts BIGINT,
+    next_collection_ts BIGINT,
     api_calls_today INTEGER DEFAULT 0,
     api_calls_this_hour INTEGER DEFAULT 0,
-    hour_window_start TIMESTAMP WITH TIME ZONE,
+    hour_window_start BIGINT,
     consecutive_failures INTEGER DEFAULT 0,
-    backoff_until TIMESTAMP WITH TIME ZONE,
+    backoff_until BIGINT,
+    -- Set to CURRENT_TIMESTAMP by the database on every save
+    last_state_change TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP,
     updated_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
 );
 
--- Ensure only one row exists
-CREATE UNIQUE INDEX IF NOT EXISTS idx_scheduler_state_singleton ON scheduler_state(id);
+-- Singleton table: the only row has id = 1 and is read by primary key.
+-- No separate unique index on id: it duplicates the primary key, and DuckDB
+-- rejects INSERT OR REPLACE on tables with more than one unique constraint.
 
 -- ============================================================================
 -- VIEWS FOR COMMON QUERIES
@@ -301,5 +305,5 @@ ON CONFLICT (version) DO NOTHING;
 
 -- Initialize scheduler state if not exists
 INSERT INTO scheduler_state (id, current_state)
-VALUES (1, 'idle')
+VALUES (1, 'IDLE')
 ON CONFLICT (id) DO NOTHING;
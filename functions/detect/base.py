@@ -68,7 +68,7 @@ Configuration Structure:
 import logging
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import Optional, Dict, List, Type, Any
+from typing import Optional, Dict, List, Tuple, Type, Any
 
 from functions.util.logging_setup import get_logger
 from functions.compute.feature_engine import FeatureSet
@@ -519,6 +519,8 @@ class DetectorRegistry:
 
     _instance: Optional['DetectorRegistry'] = None
     _detectors: Dict[str, Type[DetectorPlugin]] = {}
+    # Snapshot of _detectors.values(), rebuilt only after register()/clear()
+    _detector_classes: Optional[Tuple[Type[DetectorPlugin], ...]] = None
 
     def __new__(cls) -> 'DetectorRegistry':
         """Enforce singleton pattern - only one registry instance."""
@@ -591,6 +593,7 @@ class DetectorRegistry:
 
         # Register the detector
         cls._detectors[detector_name] = detector_class
+        cls._detector_classes = None
         logger.info(f"Registered detector: {detector_name}")
 
     @classmethod
@@ -631,13 +634,16 @@ class DetectorRegistry:
             return None
 
     @classmethod
-    def get_all_detectors(cls) -> List[Type[DetectorPlugin]]:
+    def get_all_detectors(cls) -> Tuple[Type[DetectorPlugin], ...]:
         """
         Get all registered detector classes.
 
+        The tuple is built once and reused until the registry changes, so
+        repeated calls do not copy the registry.
+
         Returns:
-            List[Type[DetectorPlugin]]: List of detector classes registered in the system
-                Returns empty list if no detectors registered
+            Tuple[Type[DetectorPlugin], ...]: Detector classes registered in the system
+                Returns empty tuple if no detectors registered
 
         Note:
             This returns the classes, not instances. Caller should instantiate
@@ -654,7 +660,9 @@ class DetectorRegistry:
             >>> for detector_class in detectors:
             ...     print(f"  - {detector_class.__name__}")
         """
-        return list(cls._detectors.values())
+        if cls._detector_classes is None:
+            cls._detector_classes = tuple(cls._detectors.values())
+        return cls._detector_classes
 
     @classmethod
     def get_registry(cls) -> 'DetectorRegistry':
@@ -687,6 +695,7 @@ class DetectorRegistry:
             This is for testing only. In production, use with caution.
         """
         cls._detectors.clear()
+        cls._detector_classes = None
         logger.debug("Cleared all detectors from registry")
 
 # ============================================================================
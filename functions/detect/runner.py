@@ -0,0 +1,122 @@
+"""
+Detector execution helpers shared by the scan orchestrator and its worker pool.
+
+run_detectors() evaluates every registered detector against one ticker's
+FeatureSet and returns the resulting AlertCandidates. It is a top-level
+function in a module without database side effects so it can be submitted to
+a ProcessPoolExecutor: worker processes import this module, which imports
+functions.detect and registers all detector plugins.
+
+Scoring, risk gates, throttling and persistence are not done here; they stay
+in the scan process so database access remains serialized.
+"""
+
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence
+
+from functions.compute.feature_engine import FeatureSet
+from functions.detect.base import AlertCandidate, DetectorPlugin, get_registry
+from functions.util.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Detector instances for the current process, built on first use. Each worker
+# process of the detector pool builds its own copy.
+_process_detectors: Optional[List[DetectorPlugin]] = None
+
+# Shared detector worker pool, created lazily and reused across scans
+_detector_pool: Optional[ProcessPoolExecutor] = None
+_detector_pool_workers: int = 0
+
+
+def build_detectors() -> List[DetectorPlugin]:
+    """
+    Instantiate every registered detector class once.
+
+    Detectors are stateless, so one instance per process serves all tickers.
+    Classes that fail to instantiate are logged and skipped.
+
+    Returns:
+        List of detector instances
+    """
+    detectors: List[DetectorPlugin] = []
+    for detector_class in get_registry().get_all_detectors():
+        try:
+            detectors.append(detector_class())
+        except Exception as e:
+            logger.error(
+                f"Failed to instantiate detector {detector_class.__name__}: {e}",
+                exc_info=True
+            )
+    return detectors
+
+
+def run_detectors(
+    features: FeatureSet, detectors: Optional[Sequence[DetectorPlugin]] = None
+) -> List[AlertCandidate]:
+    """
+    Run all detectors against one ticker's features.
+
+    Args:
+        features: Feature set for a single ticker
+        detectors: Detector instances to run. If None, uses this process's
+            cached instances (the case inside pool workers).
+
+    Returns:
+        AlertCandidates from detectors that fired, in registry order
+    """
+    global _process_detectors
+
+    if detectors is None:
+        if _process_detectors is None:
+            _process_detectors = build_detectors()
+        detectors = _process_detectors
+
+    candidates: List[AlertCandidate] = []
+    for detector in detectors:
+        candidate = detector.detect_safe(features)
+        if candidate is None:
+            logger.debug(f"No detection from {detector.name}")
+            continue
+        candidates.append(candidate)
+    return candidates
+
+
+def get_detector_pool(workers: int) -> ProcessPoolExecutor:
+    """
+    Get the shared detector process pool, creating it on first use.
+
+    Workers are started with the "spawn" method so they do not inherit the
+    scan process's threads or open DuckDB connections. The pool is kept for
+    later scans; it is recreated only if the worker count changes.
+
+    Args:
+        workers: Number of worker processes
+
+    Returns:
+        ProcessPoolExecutor for run_detectors()
+    """
+    global _detector_pool, _detector_pool_workers
+
+    if _detector_pool is None or _detector_pool_workers != workers:
+        if _detector_pool is not None:
+            _detector_pool.shutdown(wait=False)
+        _detector_pool = ProcessPoolExecutor(
+            max_workers=workers,
+            mp_context=multiprocessing.get_context("spawn"),
+        )
+        _detector_pool_workers = workers
+        logger.info(f"Started detector process pool with {workers} workers")
+
+    return _detector_pool
+
+
+def shutdown_detector_pool() -> None:
+    """Shut down the shared detector process pool, if one was started."""
+    global _detector_pool, _detector_pool_workers
+
+    if _detector_pool is not None:
+        _detector_pool.shutdown(wait=True)
+        _detector_pool = None
+        _detector_pool_workers = 0
@@ -24,6 +24,7 @@ Usage:
 
 Features:
     - Atomic writes (write to temp file, then rename)
+    - Each export is serialized once (orjson when installed) for both copies
     - Timestamped archives in data/exports/archive/
     - Latest exports in data/exports/ (for API to read)
     - Full type hints and comprehensive logging
@@ -38,6 +39,11 @@ from typing import Dict, List, Any, Optional
 from tempfile import NamedTemporaryFile
 import os
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used when unavailable
+    orjson = None
+
 from functions.util.logging_setup import get_logger
 from functions.db.repositories import (
     AlertRepository,
@@ -48,6 +54,25 @@ from functions.db.repositories import (
 
 logger = get_logger(__name__)
 
+# Datetimes go through default=str (as with json.dump) rather than orjson's RFC 3339 output
+_ORJSON_OPTIONS = (
+    orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+    if orjson is not None
+    else 0
+)
+
+
+def _dump_json_bytes(data: Dict[str, Any]) -> bytes:
+    """
+    Serialize an export document to indented JSON bytes.
+
+    Uses orjson (C extension) when installed, falling back to stdlib json.
+    Values json cannot encode natively are converted with str() either way.
+    """
+    if orjson is not None:
+        return orjson.dumps(data, default=str, option=_ORJSON_OPTIONS)
+    return json.dumps(data, indent=2, default=str).encode("utf-8")
+
 
 def _convert_to_json_serializable(obj: Any) -> Any:
     """
@@ -151,7 +176,7 @@ class JSONExporter:
         file_path: Path,
         data: Dict[str, Any],
         timestamp: Optional[str] = None,
-    ) -> None:
+    ) -> bytes:
         """
         Atomically write JSON data to file (write temp, then rename).
 
@@ -162,6 +187,9 @@ class JSONExporter:
             data: Dictionary to write as JSON
             timestamp: Optional timestamp to add to data
 
+        Returns:
+            The serialized JSON, for reuse by _create_archive_copy
+
         Raises:
             RuntimeError: If write operation fails
         """
@@ -170,21 +198,25 @@ class JSONExporter:
             if timestamp and "export_timestamp" not in data:
                 data["export_timestamp"] = timestamp
 
+            payload = _dump_json_bytes(data)
+
             # Write to temporary file first
             temp_fd, temp_path = None, None
             try:
-                temp_fd, temp_path = NamedTemporaryFile(
-                    mode='w',
+                temp_fd = NamedTemporaryFile(
+                    mode='wb',
                     dir=self.export_dir,
                     delete=False,
                     suffix='.json',
                 )
-                json.dump(data, temp_fd, indent=2, default=str)
+                temp_path = temp_fd.name
+                temp_fd.write(payload)
                 temp_fd.close()
 
                 # Atomic rename
                 os.replace(temp_path, file_path)
                 logger.debug(f"Wrote JSON file: {file_path}")
+                return payload
 
             except Exception as e:
                 if temp_fd:
@@ -197,7 +229,7 @@ class JSONExporter:
             logger.error(f"Failed to write JSON file {file_path}: {e}")
             raise RuntimeError(f"Failed to write JSON file: {e}") from e
 
-    def _create_archive_copy(self, filename: str, data: Dict[str, Any]) -> None:
+    def _create_archive_copy(self, filename: str, payload: bytes) -> None:
         """
         Create timestamped archive copy of exported data.
 
@@ -206,7 +238,7 @@ class JSONExporter:
 
         Args:
             filename: Base filename (e.g., "alerts.json")
-            data: Dictionary to archive
+            payload: Serialized JSON returned by _atomic_write_json
 
         Raises:
             RuntimeError: If archive write fails
@@ -220,8 +252,8 @@ class JSONExporter:
             archive_path = self.archive_dir / archive_filename
 
             # Write archive
-            with open(archive_path, 'w') as f:
-                json.dump(data, f, indent=2, default=str)
+            with open(archive_path, 'wb') as f:
+                f.write(payload)
 
             logger.debug(f"Created archive: {archive_path}")
 
@@ -274,10 +306,10 @@ class JSONExporter:
 
             # Write latest export
             alerts_path = self.export_dir / "alerts.json"
-            self._atomic_write_json(alerts_path, export_data, now.isoformat())
+            payload = self._atomic_write_json(alerts_path, export_data, now.isoformat())
 
-            # Create archive
-            self._create_archive_copy("alerts.json", export_data)
+            # Create archive from the same serialized bytes
+            self._create_archive_copy("alerts.json", payload)
 
             logger.info(f"Exported {len(alerts)} alerts to JSON")
             return export_data
@@ -368,10 +400,10 @@ class JSONExporter:
 
             # Write latest export
             chains_path = self.export_dir / "chains.json"
-            self._atomic_write_json(chains_path, export_data, now.isoformat())
+            payload = self._atomic_write_json(chains_path, export_data, now.isoformat())
 
-            # Create archive
-            self._create_archive_copy("chains.json", export_data)
+            # Create archive from the same serialized bytes
+            self._create_archive_copy("chains.json", payload)
 
             logger.info(f"Exported {len(chains)} chain snapshots to JSON")
             return export_data
@@ -440,10 +472,10 @@ class JSONExporter:
 
             # Write latest export
             scans_path = self.export_dir / "scans.json"
-            self._atomic_write_json(scans_path, export_data, now.isoformat())
+            payload = self._atomic_write_json(scans_path, export_data, now.isoformat())
 
-            # Create archive
-            self._create_archive_copy("scans.json", export_data)
+            # Create archive from the same serialized bytes
+            self._create_archive_copy("scans.json", payload)
 
             logger.info(f"Exported {len(scans)} scans to JSON")
             return export_data
@@ -523,10 +555,10 @@ class JSONExporter:
 
             # Write latest export
             features_path = self.export_dir / "features.json"
-            self._atomic_write_json(features_path, export_data, now.isoformat())
+            payload = self._atomic_write_json(features_path, export_data, now.isoformat())
 
-            # Create archive
-            self._create_archive_copy("features.json", export_data)
+            # Create archive from the same serialized bytes
+            self._create_archive_copy("features.json", payload)
 
             logger.info(f"Exported {len(features_list)} feature snapshots to JSON")
             return export_data
@@ -276,6 +276,37 @@ class MarketDataProvider(ABC):
                 result[ticker] = None
         return result
 
+    def get_full_snapshots(self, tickers: List[str]) -> Dict[str, Optional[MarketSnapshot]]:
+        """Fetch complete market data snapshots for multiple tickers.
+
+        Default implementation calls get_full_snapshot() for each ticker.
+        Subclasses backed by a multi-symbol API (e.g., a batch quote endpoint)
+        should override this to fetch the whole watchlist in one request;
+        callers detect the override and otherwise fetch tickers concurrently.
+
+        Args:
+            tickers: List of ticker symbols to fetch
+
+        Returns:
+            Dictionary mapping ticker -> snapshot (or None if fetch failed).
+            All input tickers are included in result dict.
+
+        Example:
+            >>> provider = YahooFinanceProvider()
+            >>> snapshots = provider.get_full_snapshots(["AAPL", "MSFT"])
+            >>> for ticker, snapshot in snapshots.items():
+            ...     if snapshot:
+            ...         print(f"{ticker}: ${snapshot.price}")
+        """
+        result: Dict[str, Optional[MarketSnapshot]] = {}
+        for ticker in tickers:
+            try:
+                result[ticker] = self.get_full_snapshot(ticker)
+            except Exception as e:
+                logger.warning(f"Error fetching snapshot for {ticker}: {e}")
+                result[ticker] = None
+        return result
+
     def get_full_snapshot(self, ticker: str) -> Optional[MarketSnapshot]:
         """Fetch complete market data snapshot for a ticker.
 
@@ -275,6 +275,32 @@ class RiskGate:
         logger.info(f"All risk gates PASSED for {ticker}")
         return (True, None)
 
+    def ticker_prefilter(self, ticker: str) -> tuple[bool, Optional[str]]:
+        """
+        Check the risk gates that depend only on the ticker.
+
+        The concentration gate looks at the existing position, not the alert,
+        so a ticker that fails it would fail passes_risk_gate() for every
+        detector. Callers can run this once per ticker and skip detection.
+
+        Args:
+            ticker: Stock ticker symbol
+
+        Returns:
+            tuple[bool, Optional[str]]: (passes, reason)
+                - (True, None) if the ticker can produce approved alerts
+                - (False, reason_string) if every alert would be rejected
+
+        Example:
+            >>> passes, reason = gate.ticker_prefilter("AAPL")
+            >>> if not passes:
+            ...     logger.debug(f"Skipping AAPL: {reason}")
+        """
+        conc_passes, conc_reason = self._check_concentration_gate(ticker)
+        if not conc_passes:
+            return (False, conc_reason)
+        return (True, None)
+
     def _check_margin_gate(self, alert: AlertCandidate, ticker: str) -> tuple[bool, str]:
         """
         Validate margin requirement against available margin.
@@ -51,7 +51,7 @@ All timestamps are UTC. Missing data is handled gracefully (assumes no prior coo
 """
 
 from datetime import datetime, timedelta, date
-from typing import Optional
+from typing import Any, Dict, List, Optional, Tuple
 from pathlib import Path
 
 from functions.util.logging_setup import get_logger
@@ -81,9 +81,16 @@ class AlertThrottler:
         max_alerts_per_day (int): Maximum alerts per day (from config)
         cooldown_repo (CooldownRepository): Repository for cooldown tracking
         alert_repo (AlertRepository): Repository for alert data
+        pending_updates (List[Dict[str, Any]]): Cooldown records buffered by
+            record_alert() when constructed with prefetched_cooldowns
     """
 
-    def __init__(self, db_connection: DuckDBManager, config: AppConfig) -> None:
+    def __init__(
+        self,
+        db_connection: DuckDBManager,
+        config: AppConfig,
+        prefetched_cooldowns: Optional[Dict[str, Dict[str, Any]]] = None
+    ) -> None:
         """
         Initialize AlertThrottler with database connection and configuration.
 
@@ -92,6 +99,11 @@ class AlertThrottler:
             config (AppConfig): Application configuration containing:
                 - "scoring.cooldown_hours" (default 24)
                 - "scoring.max_alerts_per_day" (default 5)
+            prefetched_cooldowns (Optional[Dict[str, Dict[str, Any]]]): Cooldown
+                records by ticker (as returned by CooldownRepository.get_cooldowns),
+                loaded once for a scan. When given, cooldown and daily-count
+                reads are served from memory and record_alert() buffers its
+                writes until flush_pending_updates() is called.
 
         Raises:
             TypeError: If db_connection is not a DuckDBManager or config is not AppConfig
@@ -139,6 +151,15 @@ class AlertThrottler:
         self.alert_repo = AlertRepository()
         self._last_throttle_reason: str = ""
 
+        # Scan-scoped cooldown cache (None = read through to the database)
+        self._cooldowns: Optional[Dict[str, Dict[str, Any]]] = None
+        if prefetched_cooldowns is not None:
+            self._cooldowns = {
+                ticker.upper(): cooldown for ticker, cooldown in prefetched_cooldowns.items()
+            }
+        self._daily_count: Optional[int] = None
+        self.pending_updates: List[Dict[str, Any]] = []
+
         logger.info(
             f"Initialized AlertThrottler: cooldown_hours={self.cooldown_hours}, "
             f"max_alerts_per_day={self.max_alerts_per_day}"
@@ -194,10 +215,19 @@ class AlertThrottler:
 
         try:
             # Check 1: Cooldown status
-            is_on_cooldown, hours_remaining = self.cooldown_repo.is_in_cooldown(
-                ticker=ticker,
-                cooldown_hours=self.cooldown_hours
-            )
+            if self._cooldowns is not None:
+                remaining = self._remaining_cooldown(
+                    self._cooldowns.get(ticker),
+                    get_utc_now(),
+                    timedelta(hours=self.cooldown_hours)
+                )
+                is_on_cooldown = remaining is not None
+                hours_remaining = remaining.total_seconds() / 3600.0 if remaining else None
+            else:
+                is_on_cooldown, hours_remaining = self.cooldown_repo.is_in_cooldown(
+                    ticker=ticker,
+                    cooldown_hours=self.cooldown_hours
+                )
 
             if is_on_cooldown:
                 self._last_throttle_reason = f"In cooldown ({hours_remaining:.1f}h remaining)"
@@ -207,7 +237,7 @@ class AlertThrottler:
                 return False
 
             # Check 2: Daily alert limit
-            daily_count = self.get_daily_count()
+            daily_count = self._current_daily_count()
 
             if daily_count >= self.max_alerts_per_day:
                 self._last_throttle_reason = f"Daily limit reached ({daily_count}/{self.max_alerts_per_day})"
@@ -231,10 +261,148 @@ class AlertThrottler:
             # Conservative: fail open (allow alert) if error occurs
             return True
 
+    def ticker_in_cooldown(self, ticker: str) -> bool:
+        """
+        Check whether a ticker is in its cooldown period.
+
+        Cooldown is per ticker, so while it is active every detector's alert
+        for that ticker would be throttled. Callers can check this once per
+        ticker before running detectors. Reads from prefetched cooldowns when
+        available, otherwise from the database. Errors fail open (False).
+
+        Args:
+            ticker (str): Stock ticker symbol (e.g., "AAPL")
+
+        Returns:
+            bool: True if the ticker is in cooldown
+
+        Example:
+            >>> if throttler.ticker_in_cooldown("AAPL"):
+            ...     print("Skipping AAPL detectors")
+        """
+        ticker = ticker.upper()
+
+        try:
+            if self._cooldowns is not None:
+                cooldown = self._cooldowns.get(ticker)
+            else:
+                cooldown = self.cooldown_repo.get_cooldown(ticker)
+        except Exception as e:
+            logger.error(f"Error checking cooldown for {ticker}: {e}", exc_info=True)
+            return False
+
+        remaining = self._remaining_cooldown(
+            cooldown, get_utc_now(), timedelta(hours=self.cooldown_hours)
+        )
+        return remaining is not None
+
     def get_last_throttle_reason(self) -> str:
         """Return the most recent throttling reason for logging."""
         return self._last_throttle_reason
 
+    def should_alert_bulk(
+        self, candidates: List[Tuple[str, str, float]]
+    ) -> List[Tuple[bool, str]]:
+        """
+        Evaluate throttling for many alert candidates with two queries in total.
+
+        Equivalent to calling should_alert() for each candidate in order and
+        record_alert() for each one allowed: cooldowns for all tickers are read
+        in one query and the daily count once, then each allowed candidate puts
+        its ticker into cooldown and counts toward the daily limit for the
+        candidates after it.
+
+        Args:
+            candidates (List[Tuple[str, str, float]]): (ticker, detector_name,
+                current_score) tuples, in evaluation order
+
+        Returns:
+            List[Tuple[bool, str]]: (allowed, throttle_reason) per candidate, in
+                input order; throttle_reason is "" for allowed candidates
+
+        Example:
+            >>> results = throttler.should_alert_bulk([
+            ...     ("AAPL", "low_iv", 72.0), ("MSFT", "rich_premium", 81.5)
+            ... ])
+            >>> [allowed for allowed, _ in results]
+            [True, True]
+        """
+        if not candidates:
+            return []
+
+        tickers = [ticker.upper() for ticker, _, _ in candidates]
+
+        try:
+            if self._cooldowns is not None:
+                cooldowns = self._cooldowns
+            else:
+                cooldowns = self.cooldown_repo.get_cooldowns(tickers)
+            daily_count = self._current_daily_count()
+        except Exception as e:
+            logger.error(
+                f"Error checking throttle status for {len(candidates)} candidates: {e}",
+                exc_info=True
+            )
+            # Conservative: fail open (allow alerts) if error occurs, as should_alert does
+            return [(True, "")] * len(candidates)
+
+        now_utc = get_utc_now()
+        cooldown_duration = timedelta(hours=self.cooldown_hours)
+        alerted_tickers = set()
+        results: List[Tuple[bool, str]] = []
+
+        for ticker in tickers:
+            if ticker in alerted_tickers:
+                results.append((False, "In cooldown (alerted earlier in this scan)"))
+                continue
+
+            remaining = self._remaining_cooldown(cooldowns.get(ticker), now_utc, cooldown_duration)
+            if remaining is not None:
+                hours_remaining = remaining.total_seconds() / 3600.0
+                results.append((False, f"In cooldown ({hours_remaining:.1f}h remaining)"))
+                continue
+
+            if daily_count >= self.max_alerts_per_day:
+                results.append(
+                    (False, f"Daily limit reached ({daily_count}/{self.max_alerts_per_day})")
+                )
+                continue
+
+            alerted_tickers.add(ticker)
+            daily_count += 1
+            results.append((True, ""))
+
+        logger.debug(
+            f"Bulk throttle check: {sum(allowed for allowed, _ in results)}/"
+            f"{len(results)} candidates allowed"
+        )
+        return results
+
+    def _current_daily_count(self) -> int:
+        """Return today's alert count, including buffered alerts when prefetched."""
+        if self._cooldowns is None:
+            return self.get_daily_count()
+        if self._daily_count is None:
+            self._daily_count = self.get_daily_count()
+        return self._daily_count + len(self.pending_updates)
+
+    @staticmethod
+    def _remaining_cooldown(
+        cooldown: Optional[Dict[str, Any]], now_utc: datetime, cooldown_duration: timedelta
+    ) -> Optional[timedelta]:
+        """Return time left on a cooldown record, or None if expired or missing."""
+        if not cooldown or cooldown.get("last_alert_ts") is None:
+            return None
+
+        last_alert_ts = cooldown["last_alert_ts"]
+        if isinstance(last_alert_ts, str):
+            last_alert_ts = datetime.fromisoformat(last_alert_ts.replace("Z", "+00:00"))
+        if last_alert_ts.tzinfo is None:
+            last_alert_ts = last_alert_ts.replace(tzinfo=now_utc.tzinfo)
+
+        remaining = cooldown_duration - (now_utc - last_alert_ts)
+        return remaining if remaining > timedelta(0) else None
+
     def record_alert(
         self, ticker: str, detector_name: str, score: float, alert_id: Optional[int] = None
     ) -> bool:
@@ -247,11 +415,15 @@ class AlertThrottler:
 
         Logs successful recording at INFO level. Returns False on database error.
 
+        When the throttler was constructed with prefetched_cooldowns, both
+        updates are applied in memory and buffered in pending_updates instead;
+        call flush_pending_updates() to write them.
+
         Args:
             ticker (str): Stock ticker symbol (e.g., "AAPL")
             detector_name (str): Name of detector that generated alert
             score (float): Alert score that was sent (0-100)
-            alert_id (int): Database ID of the generated alert
+            alert_id (Optional[int]): Database ID of the generated alert, if known
 
         Returns:
             bool: True on success, False if database error occurs
@@ -277,9 +449,9 @@ class AlertThrottler:
             raise ValueError(
                 f"score must be numeric, got {type(score).__name__}"
             )
-        if not isinstance(alert_id, int) or alert_id <= 0:
+        if alert_id is not None and (not isinstance(alert_id, int) or alert_id <= 0):
             raise ValueError(
-                f"alert_id must be positive integer, got {alert_id}"
+                f"alert_id must be positive integer or None, got {alert_id}"
             )
 
         ticker = ticker.upper()
@@ -289,6 +461,16 @@ class AlertThrottler:
             f"score={score:.1f}, alert_id={alert_id}"
         )
 
+        if self._cooldowns is not None:
+            cooldown = {"ticker": ticker, "last_alert_ts": get_utc_now(), "last_score": score}
+            self._cooldowns[ticker] = cooldown
+            self.pending_updates.append(cooldown)
+            logger.debug(
+                f"Alert buffered for throttling: ticker={ticker}, detector={detector_name}, "
+                f"score={score:.1f} ({len(self.pending_updates)} pending)"
+            )
+            return True
+
         try:
             # Update cooldown record
             self.cooldown_repo.update_cooldown(ticker=ticker, score=score)
@@ -310,6 +492,48 @@ class AlertThrottler:
             )
             return False
 
+    def flush_pending_updates(self) -> int:
+        """
+        Write cooldowns and daily counts buffered by record_alert().
+
+        Upserts the latest cooldown per ticker in one transaction and adds the
+        number of buffered alerts to today's count. Pending updates are kept
+        if the write fails, so a later call can retry.
+
+        Returns:
+            int: Number of alerts flushed (0 if nothing was pending or on error)
+
+        Example:
+            >>> throttler = AlertThrottler(db, config, prefetched_cooldowns={})
+            >>> throttler.record_alert("AAPL", "volume_spike", 75.5)
+            True
+            >>> throttler.flush_pending_updates()
+            1
+        """
+        if not self.pending_updates:
+            return 0
+
+        alert_count = len(self.pending_updates)
+        latest_by_ticker = {c["ticker"]: c for c in self.pending_updates}
+
+        try:
+            self.cooldown_repo.update_cooldowns_batch(list(latest_by_ticker.values()))
+            self.alert_repo.increment_daily_count(alert_count)
+        except Exception as e:
+            logger.error(
+                f"Failed to flush {alert_count} buffered throttle updates: {e}",
+                exc_info=True
+            )
+            return 0
+
+        self.pending_updates.clear()
+        self._daily_count = None
+        logger.info(
+            f"Flushed throttle state: {len(latest_by_ticker)} cooldowns, "
+            f"{alert_count} alerts"
+        )
+        return alert_count
+
     def get_cooldown_remaining(self, ticker: str) -> Optional[timedelta]:
         """
         Get time remaining on cooldown period for a ticker.
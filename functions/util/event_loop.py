@@ -0,0 +1,48 @@
+"""
+Event loop selection for the CLI entry points.
+
+Runs a coroutine on uvloop (libuv-based, faster for I/O-heavy workloads such
+as concurrent market data fetches) when it is installed, and on the default
+asyncio loop otherwise. uvloop ships with uvicorn[standard] on Linux/macOS;
+it is not available on Windows, where the default loop is used.
+
+Usage:
+    from functions.util.event_loop import run
+
+    exit_code = run(main())
+"""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+except ImportError:  # optional; e.g. Windows or a minimal install
+    uvloop = None
+
+from functions.util.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """
+    Run a coroutine to completion, using uvloop when available.
+
+    Equivalent to asyncio.run(main) apart from the loop implementation.
+
+    Args:
+        main: Coroutine to run (typically an async main())
+
+    Returns:
+        The coroutine's return value
+    """
+    if uvloop is None:
+        logger.debug("uvloop not installed, using default asyncio event loop")
+        return asyncio.run(main)
+
+    logger.debug("Using uvloop event loop")
+    with asyncio.Runner(loop_factory=uvloop.new_event_loop) as runner:
+        return runner.run(main)
@@ -1,17 +1,52 @@
 """Routes for per-ticker knowledge base endpoints."""
 
+import asyncio
+import os
+import re
+import stat
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
 from datetime import datetime, timezone
 from pathlib import Path as PathlibPath
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple, Union
 
-from fastapi import APIRouter, Path, HTTPException
+from fastapi import APIRouter, Path, HTTPException, Query, Request, Response
 from pydantic import BaseModel, Field
+from watchfiles import awatch
 
 from functions.util.logging_setup import get_logger
 
 logger = get_logger(__name__)
 router = APIRouter()
 
+# Knowledge base file name for each supported file type
+_THESIS_FILENAMES: Dict[str, str] = {"thesis": "theses.md", "risks": "risks.md", "notes": "notes.md"}
+_FILE_TYPES_BY_NAME: Dict[str, str] = {name: ft for ft, name in _THESIS_FILENAMES.items()}
+
+# Anything outside this set is stripped from ticker path components
+_TICKER_STRIP_RE = re.compile(r"[^A-Z0-9.\-]")
+
+# /tickers/list inventory cache, keyed by the tickers/ directory mtime
+TICKER_LIST_TTL_SECONDS: float = 30.0
+_ticker_list_cache: Dict[str, Any] = {"mtime_ns": None, "expires_at": 0.0, "tickers": []}
+
+# Open file descriptors for knowledge base files, keyed by path and validated
+# against (st_ino, st_mtime_ns) so replaced or edited files are reopened.
+# Used by the disk read path, which serves requests until
+# preload_knowledge_base() has run and again if watch_knowledge_base() stops
+# (the in-memory copy would otherwise go stale).
+FD_CACHE_MAX_ENTRIES: int = 64
+_fd_cache: "OrderedDict[str, Tuple[int, int, int]]" = OrderedDict()
+_fd_cache_lock = threading.Lock()
+
+# In-memory knowledge base: (ticker, file_type) -> (content, stat). Populated by
+# preload_knowledge_base() at API startup and kept current by
+# watch_knowledge_base(); until then lookups fall back to disk reads.
+_kb: Dict[Tuple[str, str], Tuple[str, os.stat_result]] = {}
+_kb_loaded: bool = False
+
 
 class ThesisResponse(BaseModel):
     """Response model for thesis/risks/notes content."""
@@ -23,140 +58,500 @@ class ThesisResponse(BaseModel):
     timestamp: str = Field(..., description="UTC ISO 8601 response timestamp")
 
 
+class TickerKnowledgeBaseResponse(BaseModel):
+    """Response model for all knowledge base files of a ticker."""
+
+    ticker: str = Field(..., description="Stock ticker symbol")
+    thesis: Optional[ThesisResponse] = Field(None, description="Investment thesis, if present")
+    risks: Optional[ThesisResponse] = Field(None, description="Known risks, if present")
+    notes: Optional[ThesisResponse] = Field(None, description="Trading notes, if present")
+    timestamp: str = Field(..., description="UTC ISO 8601 response timestamp")
+
+
 def get_utc_iso_timestamp() -> str:
     """Get current UTC time in ISO 8601 format with Z suffix."""
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
+@lru_cache(maxsize=1)
 def get_tickers_dir() -> PathlibPath:
-    """Get path to tickers/ directory containing per-ticker knowledge base."""
+    """Get path to tickers/ directory containing per-ticker knowledge base (resolved once)."""
     project_root = PathlibPath(__file__).resolve().parents[2]
     return project_root / "tickers"
 
 
+@lru_cache(maxsize=1)
+def get_tickers_dir_str() -> str:
+    """Get tickers/ directory as a plain string for os.path hot paths."""
+    return str(get_tickers_dir())
+
+
+def _sanitize_ticker(ticker: str) -> Optional[str]:
+    """
+    Normalize a ticker for use as a tickers/ directory name.
+
+    Uppercases, strips anything outside [A-Z0-9.-] and any '..' sequence.
+    Returns None for empty or over-long (>10 chars) results.
+    """
+    ticker_clean = _TICKER_STRIP_RE.sub("", str(ticker).upper()).replace("..", "")
+    if not ticker_clean or len(ticker_clean) > 10:
+        logger.warning(f"Invalid ticker requested: {ticker}")
+        return None
+    return ticker_clean
+
+
+def _thesis_path(ticker_clean: str, file_type: str) -> str:
+    """Build the knowledge base file path for a sanitized ticker."""
+    return os.path.join(get_tickers_dir_str(), ticker_clean, _THESIS_FILENAMES[file_type])
+
+
+def _read_file_cached(file_path: str, st: os.stat_result) -> bytes:
+    """
+    Read a whole file through the shared file-descriptor cache.
+
+    Uses os.pread so cached descriptors carry no seek state. Falls back to a
+    plain open/read on platforms without pread.
+    """
+    if not hasattr(os, "pread"):
+        with open(file_path, "rb") as f:
+            return f.read()
+
+    with _fd_cache_lock:
+        entry = _fd_cache.get(file_path)
+        if entry is not None and (entry[1], entry[2]) == (st.st_ino, st.st_mtime_ns):
+            _fd_cache.move_to_end(file_path)
+            fd = entry[0]
+        else:
+            if entry is not None:
+                os.close(entry[0])
+            fd = os.open(file_path, os.O_RDONLY)
+            _fd_cache[file_path] = (fd, st.st_ino, st.st_mtime_ns)
+            while len(_fd_cache) > FD_CACHE_MAX_ENTRIES:
+                _, (old_fd, _, _) = _fd_cache.popitem(last=False)
+                os.close(old_fd)
+
+        return os.pread(fd, st.st_size, 0)
+
+
+def close_fd_cache() -> None:
+    """Close all cached knowledge base file descriptors."""
+    with _fd_cache_lock:
+        while _fd_cache:
+            _, (fd, _, _) = _fd_cache.popitem(last=False)
+            os.close(fd)
+
+
+def _load_kb_entry(ticker_dir: str, file_type: str) -> None:
+    """Read one knowledge base file into _kb, or drop it if it no longer exists."""
+    key = (os.path.basename(ticker_dir), file_type)
+    file_path = os.path.join(ticker_dir, _THESIS_FILENAMES[file_type])
+    try:
+        st = os.stat(file_path)
+        if not stat.S_ISREG(st.st_mode):
+            raise FileNotFoundError(file_path)
+        with open(file_path, "rb") as f:
+            _kb[key] = (f.read().decode(), st)
+    except FileNotFoundError:
+        _kb.pop(key, None)
+    except (OSError, UnicodeDecodeError) as e:
+        # One unreadable file must not take down preload or the watcher
+        logger.warning(f"Skipping unreadable knowledge base file {file_path}: {e}")
+        _kb.pop(key, None)
+
+
+def preload_knowledge_base() -> int:
+    """
+    Load every tickers/<TICKER>/{theses,risks,notes}.md file into memory.
+
+    Returns:
+        Number of files loaded
+    """
+    global _kb_loaded
+
+    _kb.clear()
+    tickers_dir = get_tickers_dir_str()
+    try:
+        with os.scandir(tickers_dir) as it:
+            ticker_dirs = [entry.path for entry in it if entry.is_dir()]
+    except FileNotFoundError:
+        logger.warning(f"Tickers directory not found: {tickers_dir}")
+        ticker_dirs = []
+
+    for ticker_dir in ticker_dirs:
+        for file_type in _THESIS_FILENAMES:
+            _load_kb_entry(ticker_dir, file_type)
+
+    _kb_loaded = True
+    logger.info(f"Preloaded {len(_kb)} knowledge base files from {tickers_dir}")
+    return len(_kb)
+
+
+def _refresh_kb_path(changed_path: str) -> None:
+    """Apply one filesystem change under tickers/ to the in-memory knowledge base."""
+    rel_parts = os.path.relpath(changed_path, get_tickers_dir_str()).split(os.sep)
+
+    if len(rel_parts) == 1:
+        # A ticker directory itself was added or removed
+        ticker_dir = os.path.join(get_tickers_dir_str(), rel_parts[0])
+        if os.path.isdir(ticker_dir):
+            for file_type in _THESIS_FILENAMES:
+                _load_kb_entry(ticker_dir, file_type)
+        else:
+            for key in [k for k in _kb if k[0] == rel_parts[0]]:
+                del _kb[key]
+    elif len(rel_parts) == 2 and rel_parts[1] in _FILE_TYPES_BY_NAME:
+        ticker_dir = os.path.join(get_tickers_dir_str(), rel_parts[0])
+        _load_kb_entry(ticker_dir, _FILE_TYPES_BY_NAME[rel_parts[1]])
+
+
+async def watch_knowledge_base(stop_event: Optional[asyncio.Event] = None) -> None:
+    """
+    Keep the in-memory knowledge base in sync with tickers/ until stopped.
+
+    When the watch ends for any reason, lookups fall back to disk reads so
+    edits are never hidden behind a stale in-memory copy.
+
+    Args:
+        stop_event: Event that ends the watch when set (e.g. on API shutdown)
+    """
+    global _kb_loaded
+
+    tickers_dir = get_tickers_dir_str()
+    if not os.path.isdir(tickers_dir):
+        logger.warning(f"Tickers directory not found, not watching: {tickers_dir}")
+        return
+
+    logger.info(f"Watching knowledge base for changes: {tickers_dir}")
+    try:
+        async for changes in awatch(tickers_dir, stop_event=stop_event):
+            for _, changed_path in changes:
+                try:
+                    _refresh_kb_path(changed_path)
+                except Exception as e:
+                    logger.error(f"Failed to refresh knowledge base for {changed_path}: {e}")
+            logger.debug(f"Knowledge base refreshed: {len(changes)} change(s)")
+    except Exception as e:
+        logger.error(f"Knowledge base watcher failed: {e}")
+    finally:
+        _kb_loaded = False
+        logger.info("Knowledge base watcher stopped; serving files from disk")
+
+
+def _load_thesis_entry(ticker_clean: str, file_type: str) -> Optional[Tuple[str, os.stat_result]]:
+    """Return (content, stat) for a sanitized ticker's file, from memory or disk."""
+    if _kb_loaded:
+        return _kb.get((ticker_clean, file_type))
+
+    file_path = _thesis_path(ticker_clean, file_type)
+    try:
+        st = os.stat(file_path)
+    except FileNotFoundError:
+        st = None
+    if st is None or not stat.S_ISREG(st.st_mode):
+        logger.debug(f"Thesis file not found: {file_path}")
+        return None
+
+    return _read_file_cached(file_path, st).decode(), st
+
+
 def load_thesis_file(ticker: str, file_type: str) -> Optional[str]:
     """Load thesis/risks/notes markdown file for a ticker."""
     try:
-        valid_types = {"thesis": "theses.md", "risks": "risks.md", "notes": "notes.md"}
-        if file_type not in valid_types:
+        if file_type not in _THESIS_FILENAMES:
             logger.warning(f"Invalid file type requested: {file_type}")
             return None
 
-        ticker_clean = str(ticker).upper().replace("..", "").replace("/", "").replace("\\", "")
-        if not ticker_clean or len(ticker_clean) > 10:
-            logger.warning(f"Invalid ticker requested: {ticker}")
+        ticker_clean = _sanitize_ticker(ticker)
+        if ticker_clean is None:
             return None
 
-        tickers_dir = get_tickers_dir()
-        file_path = tickers_dir / ticker_clean / valid_types[file_type]
-
-        if not file_path.exists():
-            logger.debug(f"Thesis file not found: {file_path}")
+        entry = _load_thesis_entry(ticker_clean, file_type)
+        if entry is None:
             return None
 
-        with open(file_path, "r") as f:
-            content = f.read()
-            logger.debug(f"Loaded thesis file for {ticker_clean}/{file_type}: {len(content)} bytes")
-            return content
+        content = entry[0]
+        logger.debug(f"Loaded thesis file for {ticker_clean}/{file_type}: {len(content)} bytes")
+        return content
 
     except Exception as e:
         logger.error(f"Failed to load thesis file for {ticker}/{file_type}: {e}")
         return None
 
 
-@router.get("/tickers/{ticker}/thesis", response_model=ThesisResponse, tags=["Theses"])
-async def get_ticker_thesis(
-    ticker: str = Path(..., description="Stock ticker symbol (e.g., 'AAPL', 'SOFI')")
-) -> ThesisResponse:
-    """Get investment thesis for a ticker."""
-    try:
-        content = load_thesis_file(ticker, "thesis")
+def _last_updated_iso(st: os.stat_result) -> str:
+    """Format a file modification time as UTC ISO 8601 with Z suffix."""
+    return datetime.fromtimestamp(st.st_mtime, timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _thesis_etag(st: os.stat_result) -> str:
+    """Build a weak ETag from file modification time and size."""
+    return f'W/"{st.st_mtime_ns:x}-{st.st_size:x}"'
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag."""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in candidates or etag in candidates
 
-        if not content:
-            logger.info(f"Thesis not found for ticker: {ticker}")
+
+def _serve_thesis_file(
+    request: Request, response: Response, ticker: str, file_type: str, label: str
+) -> Union[ThesisResponse, Response]:
+    """
+    Serve a thesis/risks/notes file, honoring If-None-Match.
+
+    Serves from the preloaded knowledge base when available; otherwise stats
+    the file first so a matching ETag returns 304 without reading the file or
+    serializing a response body.
+    """
+    ticker_clean = _sanitize_ticker(ticker)
+    try:
+        content: Optional[str] = None
+        st: Optional[os.stat_result] = None
+        file_path = None
+        if _kb_loaded:
+            entry = _kb.get((ticker_clean, file_type)) if ticker_clean else None
+            if entry is not None:
+                content, st = entry
+        elif ticker_clean is not None:
+            file_path = _thesis_path(ticker_clean, file_type)
+            try:
+                st = os.stat(file_path)
+            except OSError:
+                st = None
+
+        if st is None or st.st_size == 0 or not stat.S_ISREG(st.st_mode):
+            shown = ticker_clean or ticker
+            logger.info(f"{label} not found for ticker: {shown}")
             raise HTTPException(
                 status_code=404,
-                detail=f"Thesis not found for ticker '{ticker}'. Create tickers/{ticker}/theses.md to add.",
+                detail=(
+                    f"{label} not found for ticker '{shown}'. "
+                    f"Create tickers/{shown}/{_THESIS_FILENAMES[file_type]} to add."
+                ),
             )
 
-        logger.debug(f"Retrieved thesis for ticker: {ticker}")
+        etag = _thesis_etag(st)
+        if _etag_matches(request.headers.get("if-none-match"), etag):
+            logger.debug(f"{label} not modified for ticker: {ticker_clean}")
+            return Response(status_code=304, headers={"ETag": etag})
+
+        if content is None:
+            content = _read_file_cached(file_path, st).decode()
+
+        logger.debug(f"Retrieved {file_type} for ticker: {ticker_clean}")
+        response.headers["ETag"] = etag
         return ThesisResponse(
-            ticker=ticker.upper(),
-            file_type="thesis",
+            ticker=ticker_clean,
+            file_type=file_type,
             content=content,
+            last_updated=_last_updated_iso(st),
             timestamp=get_utc_iso_timestamp(),
         )
 
     except HTTPException:
         raise
     except Exception as e:
-        logger.error(f"Failed to get thesis for {ticker}: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get thesis: {e}")
+        logger.error(f"Failed to get {file_type} for {ticker}: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to get {file_type}: {e}")
+
+
+async def _serve_thesis_file_async(
+    request: Request, response: Response, ticker: str, file_type: str, label: str
+) -> Union[ThesisResponse, Response]:
+    """
+    Serve a thesis/risks/notes file without blocking the event loop.
+
+    Preloaded content is served inline; the stat/read fallback used before
+    preload_knowledge_base() runs in a worker thread.
+    """
+    if _kb_loaded:
+        return _serve_thesis_file(request, response, ticker, file_type, label)
+    return await asyncio.to_thread(_serve_thesis_file, request, response, ticker, file_type, label)
+
+
+def _scan_ticker_inventory(tickers_dir: str) -> List[Dict[str, Any]]:
+    """Scan tickers/ in a single os.scandir pass, listing each ticker directory once."""
+    tickers = []
+    with os.scandir(tickers_dir) as it:
+        for entry in it:
+            if not entry.is_dir():
+                continue
+            with os.scandir(entry.path) as inner:
+                names = {e.name for e in inner if not e.is_dir()}
+            tickers.append(
+                {
+                    "ticker": entry.name.upper(),
+                    "has_thesis": "theses.md" in names,
+                    "has_risks": "risks.md" in names,
+                    "has_notes": "notes.md" in names,
+                }
+            )
 
+    tickers.sort(key=lambda t: t["ticker"])
+    return tickers
 
-@router.get("/tickers/{ticker}/risks", response_model=ThesisResponse, tags=["Theses"])
-async def get_ticker_risks(
-    ticker: str = Path(..., description="Stock ticker symbol (e.g., 'AAPL', 'SOFI')")
-) -> ThesisResponse:
-    """Get known risks for a ticker."""
-    try:
-        content = load_thesis_file(ticker, "risks")
 
-        if not content:
-            logger.info(f"Risks not found for ticker: {ticker}")
-            raise HTTPException(
-                status_code=404,
-                detail=f"Risks not found for ticker '{ticker}'. Create tickers/{ticker}/risks.md to add.",
-            )
+def _get_ticker_inventory(tickers_dir: str) -> List[Dict[str, Any]]:
+    """Return the cached ticker inventory, rescanning on TTL expiry or directory change.
 
-        logger.debug(f"Retrieved risks for ticker: {ticker}")
-        return ThesisResponse(
-            ticker=ticker.upper(),
-            file_type="risks",
-            content=content,
-            timestamp=get_utc_iso_timestamp(),
+    The returned list is shared between requests and must not be mutated.
+    """
+    mtime_ns = os.stat(tickers_dir).st_mtime_ns
+    now = time.monotonic()
+    cache = _ticker_list_cache
+
+    if cache["mtime_ns"] == mtime_ns and now < cache["expires_at"]:
+        return cache["tickers"]
+
+    tickers = _scan_ticker_inventory(tickers_dir)
+    cache["mtime_ns"] = mtime_ns
+    cache["expires_at"] = now + TICKER_LIST_TTL_SECONDS
+    cache["tickers"] = tickers
+    return tickers
+
+
+def _parse_expand(expand: Optional[str]) -> List[str]:
+    """Parse a comma-separated ?expand= value into known file types."""
+    if not expand:
+        return []
+    file_types = [ft.strip().lower() for ft in expand.split(",") if ft.strip()]
+    unknown = [ft for ft in file_types if ft not in _THESIS_FILENAMES]
+    if unknown:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Unknown expand value(s): {', '.join(unknown)}. "
+            f"Allowed: {', '.join(_THESIS_FILENAMES)}",
         )
+    return list(dict.fromkeys(file_types))
+
+
+def _expand_ticker_inventory(
+    tickers: List[Dict[str, Any]], file_types: List[str]
+) -> List[Dict[str, Any]]:
+    """
+    Copy inventory entries with the requested knowledge base files inlined.
+
+    Missing files are None. The cached inventory entries are left unchanged.
+    """
+    timestamp = get_utc_iso_timestamp()
+    expanded = []
+    for info in tickers:
+        item = dict(info)
+        for file_type in file_types:
+            entry = _load_thesis_entry(info["ticker"], file_type)
+            if entry is None or not entry[0]:
+                item[file_type] = None
+                continue
+            content, st = entry
+            item[file_type] = ThesisResponse(
+                ticker=info["ticker"],
+                file_type=file_type,
+                content=content,
+                last_updated=_last_updated_iso(st),
+                timestamp=timestamp,
+            )
+        expanded.append(item)
+    return expanded
 
-    except HTTPException:
-        raise
-    except Exception as e:
-        logger.error(f"Failed to get risks for {ticker}: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get risks: {e}")
 
+@router.get(
+    "/tickers/{ticker}/thesis", response_model=ThesisResponse, tags=["Theses"], deprecated=True
+)
+async def get_ticker_thesis(
+    request: Request,
+    response: Response,
+    ticker: str = Path(..., description="Stock ticker symbol (e.g., 'AAPL', 'SOFI')"),
+) -> Union[ThesisResponse, Response]:
+    """Get investment thesis for a ticker."""
+    return await _serve_thesis_file_async(request, response, ticker, "thesis", "Thesis")
+
+
+@router.get(
+    "/tickers/{ticker}/risks", response_model=ThesisResponse, tags=["Theses"], deprecated=True
+)
+async def get_ticker_risks(
+    request: Request,
+    response: Response,
+    ticker: str = Path(..., description="Stock ticker symbol (e.g., 'AAPL', 'SOFI')"),
+) -> Union[ThesisResponse, Response]:
+    """Get known risks for a ticker."""
+    return await _serve_thesis_file_async(request, response, ticker, "risks", "Risks")
 
-@router.get("/tickers/{ticker}/notes", response_model=ThesisResponse, tags=["Theses"])
+
+@router.get(
+    "/tickers/{ticker}/notes", response_model=ThesisResponse, tags=["Theses"], deprecated=True
+)
 async def get_ticker_notes(
-    ticker: str = Path(..., description="Stock ticker symbol (e.g., 'AAPL', 'SOFI')")
-) -> ThesisResponse:
+    request: Request,
+    response: Response,
+    ticker: str = Path(..., description="Stock ticker symbol (e.g., 'AAPL', 'SOFI')"),
+) -> Union[ThesisResponse, Response]:
     """Get trading notes and observations for a ticker."""
+    return await _serve_thesis_file_async(request, response, ticker, "notes", "Notes")
+
+
+@router.get("/tickers/{ticker}/kb", response_model=TickerKnowledgeBaseResponse, tags=["Theses"])
+async def get_ticker_kb(
+    ticker: str = Path(..., description="Stock ticker symbol (e.g., 'AAPL', 'SOFI')"),
+) -> TickerKnowledgeBaseResponse:
+    """
+    Get thesis, risks and notes for a ticker in one response.
+
+    Missing files are returned as null. Replaces three round trips to the
+    per-file endpoints, which are kept for backward compatibility.
+    """
+    ticker_clean = _sanitize_ticker(ticker)
+    if ticker_clean is None:
+        raise HTTPException(status_code=400, detail=f"Invalid ticker symbol: '{ticker}'")
+
     try:
-        content = load_thesis_file(ticker, "notes")
+        file_types = list(_THESIS_FILENAMES)
+        if _kb_loaded:
+            entries = [_load_thesis_entry(ticker_clean, ft) for ft in file_types]
+        else:
+            entries = await asyncio.gather(
+                *(asyncio.to_thread(_load_thesis_entry, ticker_clean, ft) for ft in file_types)
+            )
 
-        if not content:
-            logger.info(f"Notes not found for ticker: {ticker}")
-            raise HTTPException(
-                status_code=404,
-                detail=f"Notes not found for ticker '{ticker}'. Create tickers/{ticker}/notes.md to add.",
+        timestamp = get_utc_iso_timestamp()
+        files: Dict[str, Optional[ThesisResponse]] = {}
+        for file_type, entry in zip(file_types, entries):
+            if entry is None or not entry[0]:
+                files[file_type] = None
+                continue
+            content, st = entry
+            files[file_type] = ThesisResponse(
+                ticker=ticker_clean,
+                file_type=file_type,
+                content=content,
+                last_updated=_last_updated_iso(st),
+                timestamp=timestamp,
             )
 
-        logger.debug(f"Retrieved notes for ticker: {ticker}")
-        return ThesisResponse(
-            ticker=ticker.upper(),
-            file_type="notes",
-            content=content,
-            timestamp=get_utc_iso_timestamp(),
-        )
+        logger.debug(f"Retrieved knowledge base for ticker: {ticker_clean}")
+        return TickerKnowledgeBaseResponse(ticker=ticker_clean, timestamp=timestamp, **files)
 
-    except HTTPException:
-        raise
     except Exception as e:
-        logger.error(f"Failed to get notes for {ticker}: {e}")
-        raise HTTPException(status_code=500, detail=f"Failed to get notes: {e}")
+        logger.error(f"Failed to get knowledge base for {ticker}: {e}")
+        raise HTTPException(status_code=500, detail=f"Failed to get knowledge base: {e}")
 
 
 @router.get("/tickers/list", tags=["Theses"])
-async def list_tickers() -> Dict[str, Any]:
-    """List all available tickers with their knowledge base files."""
+async def list_tickers(
+    expand: Optional[str] = Query(
+        None, description="Comma-separated files to inline per ticker: thesis, risks, notes"
+    ),
+) -> Dict[str, Any]:
+    """
+    List all available tickers with their knowledge base files.
+
+    With ?expand=thesis,risks,notes each ticker entry also carries those files
+    (null when missing), replacing one request per ticker and file.
+    """
+    expand_types = _parse_expand(expand)
     try:
         tickers_dir = get_tickers_dir()
 
@@ -168,18 +563,12 @@ async def list_tickers() -> Dict[str, Any]:
                 "timestamp": get_utc_iso_timestamp(),
             }
 
-        tickers = []
-        for ticker_dir in sorted(tickers_dir.iterdir()):
-            if ticker_dir.is_dir():
-                ticker_name = ticker_dir.name.upper()
-                tickers.append(
-                    {
-                        "ticker": ticker_name,
-                        "has_thesis": (ticker_dir / "theses.md").exists(),
-                        "has_risks": (ticker_dir / "risks.md").exists(),
-                        "has_notes": (ticker_dir / "notes.md").exists(),
-                    }
-                )
+        tickers = _get_ticker_inventory(str(tickers_dir))
+        if expand_types:
+            if _kb_loaded:
+                tickers = _expand_ticker_inventory(tickers, expand_types)
+            else:
+                tickers = await asyncio.to_thread(_expand_ticker_inventory, tickers, expand_types)
 
         logger.debug(f"Listed {len(tickers)} tickers from knowledge base")
         return {
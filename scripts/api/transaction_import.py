@@ -0,0 +1,144 @@
+"""CSV import of transactions for POST /transactions/import."""
+
+import csv
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from pathlib import Path as PathlibPath
+from typing import Any, Dict, Iterator, List, Tuple
+
+from functions.db.repositories import TransactionRepository
+
+# CSV import streams rows and writes them in fixed-size batches so memory use
+# stays flat regardless of file size. All batches share one transaction.
+TRANSACTION_IMPORT_BATCH_SIZE: int = 1000
+TRANSACTION_CSV_BUFFER_BYTES: int = 1 << 20  # 1 MiB read buffer
+TRANSACTION_CSV_COLUMNS = ("timestamp", "ticker", "transaction_type", "quantity", "price")
+MAX_IMPORT_ERRORS_REPORTED: int = 100
+
+# Bounds of the transactions columns in schema.sql: quantity/price are
+# DECIMAL(12, 4) and the amounts DECIMAL(14, 2)
+_QUANTITY_PRICE_EXP = Decimal("0.0001")
+_QUANTITY_PRICE_LIMIT = Decimal("1e8")
+_AMOUNT_EXP = Decimal("0.01")
+_AMOUNT_LIMIT = Decimal("1e12")
+
+
+@lru_cache(maxsize=1)
+def get_import_dir() -> PathlibPath:
+    """Get the data/imports directory CSV files are imported from (resolved once)."""
+    project_root = PathlibPath(__file__).resolve().parents[2]
+    return project_root / "data" / "imports"
+
+
+def resolve_import_path(file_path: str) -> PathlibPath:
+    """
+    Resolve a client-supplied CSV name to a file inside get_import_dir().
+
+    Raises:
+        ValueError: If the path is absolute, contains '..' or escapes the directory
+        FileNotFoundError: If the file does not exist
+    """
+    candidate = PathlibPath(file_path)
+    if not file_path.strip() or candidate.is_absolute() or ".." in candidate.parts:
+        raise ValueError("file_path must be a relative path inside data/imports/")
+
+    import_dir = get_import_dir().resolve()
+    path = (import_dir / candidate).resolve()
+    if not path.is_relative_to(import_dir):  # e.g. through a symlink
+        raise ValueError("file_path must be a relative path inside data/imports/")
+    if not path.is_file():
+        raise FileNotFoundError(f"CSV file not found in data/imports/: {file_path}")
+    return path
+
+
+def _parse_decimal(value: str, name: str, exp: Decimal, limit: Decimal) -> Decimal:
+    """Parse a CSV number, rounded to exp, rejecting values its column can't hold."""
+    try:
+        number = Decimal(value.strip())
+    except InvalidOperation:
+        raise ValueError(f"invalid {name}: {value!r}") from None
+    if not number.is_finite():
+        raise ValueError(f"{name} must be finite: {value!r}")
+    if abs(number) < limit:
+        number = number.quantize(exp)
+    if abs(number) >= limit:
+        raise ValueError(f"{name} out of range: {value!r}")
+    return number
+
+
+def _transaction_row_from_csv(row: Dict[str, str]) -> Tuple[Any, ...]:
+    """Convert one CSV record into a TransactionRepository.add_transactions_batch row."""
+    tx_date = datetime.fromisoformat(row["timestamp"].strip())
+    quantity = _parse_decimal(row["quantity"], "quantity", _QUANTITY_PRICE_EXP, _QUANTITY_PRICE_LIMIT)
+    price = _parse_decimal(row["price"], "price", _QUANTITY_PRICE_EXP, _QUANTITY_PRICE_LIMIT)
+    amount = _parse_decimal(str(quantity * price), "amount", _AMOUNT_EXP, _AMOUNT_LIMIT)
+    return (
+        tx_date,
+        "csv_import",
+        (row.get("notes") or "").strip() or None,
+        row["transaction_type"].strip().upper(),
+        row["ticker"].strip().upper(),
+        quantity,
+        price,
+        amount,
+        Decimal("0.00"),
+        amount,
+        "USD",
+    )
+
+
+def import_transactions_csv(file_path: str) -> Dict[str, Any]:
+    """
+    Stream a transactions CSV from data/imports/ into the database.
+
+    Rows that fail to parse or don't fit their columns are skipped and
+    reported; the valid rows are written in one transaction, so either all of
+    them are committed or none are.
+
+    Args:
+        file_path: CSV file name, relative to data/imports/
+
+    Returns:
+        Dict with records_imported, error_count and per-line errors (first 100)
+
+    Raises:
+        FileNotFoundError: If the file does not exist
+        ValueError: If the path is not allowed or required CSV columns are missing
+        RuntimeError: If the database write fails (nothing is committed)
+    """
+    path = resolve_import_path(file_path)
+    errors: List[str] = []
+    error_count = 0
+
+    with open(path, newline="", buffering=TRANSACTION_CSV_BUFFER_BYTES) as f:
+        reader = csv.DictReader(f)
+        missing = [c for c in TRANSACTION_CSV_COLUMNS if c not in (reader.fieldnames or [])]
+        if missing:
+            raise ValueError(f"CSV missing required columns: {', '.join(missing)}")
+
+        def batches() -> Iterator[List[Tuple[Any, ...]]]:
+            nonlocal error_count
+            batch: List[Tuple[Any, ...]] = []
+            for line_no, row in enumerate(reader, start=2):
+                try:
+                    batch.append(_transaction_row_from_csv(row))
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    error_count += 1
+                    if len(errors) < MAX_IMPORT_ERRORS_REPORTED:
+                        errors.append(f"line {line_no}: {e}")
+                    continue
+
+                if len(batch) >= TRANSACTION_IMPORT_BATCH_SIZE:
+                    yield batch
+                    batch = []
+            if batch:
+                yield batch
+
+        records_imported = TransactionRepository().add_transactions_batches(batches())
+
+    return {
+        "records_imported": records_imported,
+        "error_count": error_count,
+        "errors": errors,
+    }
@@ -32,6 +32,7 @@ Usage:
     uvicorn scripts.run_api:app --host 0.0.0.0 --port 8061 --reload
 """
 
+import os
 import time
 import json
 import hashlib
@@ -43,12 +44,19 @@ from pathlib import Path as PathlibPath
 import yaml
 
 from fastapi import FastAPI, Query, Path, HTTPException, Request
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from pydantic import BaseModel, Field
 import uvicorn
 
-from scripts.api.routes_tickers import router as tickers_router
+from scripts.api.routes_tickers import (
+    router as tickers_router,
+    close_fd_cache,
+    preload_knowledge_base,
+    watch_knowledge_base,
+)
+from scripts.api.transaction_import import import_transactions_csv
 
 from functions.util.logging_setup import setup_logging, get_logger
 from functions.config.loader import get_config_manager
@@ -75,6 +83,7 @@ from functions.db.repositories import (
     FeatureSnapshotRepository,
     AlertRepository,
     ChainSnapshotRepository,
+    TransactionRepository,
 )
 from functions.market.models import OptionContract, OptionsChain
 
@@ -559,8 +568,10 @@ async def lifespan(app: FastAPI):
         - Create repository instances
         - Load configuration
         - Setup logging
+        - Preload tickers/ knowledge base and start its file watcher
 
     Shutdown:
+        - Stop knowledge base watcher
         - Close database connections
         - Cleanup resources
     """
@@ -591,6 +602,11 @@ async def lifespan(app: FastAPI):
         settings = get_settings()
         logger.info(f"Settings loaded: demo_mode={settings.demo_mode}")
 
+        # Serve thesis/risks/notes from memory, refreshed on file changes
+        preload_knowledge_base()
+        kb_watch_stop = asyncio.Event()
+        kb_watch_task = asyncio.create_task(watch_knowledge_base(kb_watch_stop))
+
         logger.info("Startup completed successfully")
 
     except Exception as e:
@@ -605,6 +621,9 @@ async def lifespan(app: FastAPI):
     logger.info("Shutting down Option Chain Dashboard API server...")
     try:
         # Cleanup - add any database cleanup here if needed
+        kb_watch_stop.set()
+        await kb_watch_task
+        close_fd_cache()
         logger.info("Shutdown completed")
     except Exception as e:
         logger.error(f"Shutdown error: {e}")
@@ -650,6 +669,11 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+# GZip Middleware - Compress responses above 500 bytes (markdown knowledge base
+# content, alert and chain lists). Level 1 keeps CPU cost low while still
+# shrinking text payloads several-fold.
+app.add_middleware(GZipMiddleware, minimum_size=500, compresslevel=1)
+
 
 @app.middleware("http")
 async def logging_middleware(request: Request, call_next):
@@ -754,7 +778,7 @@ async def general_exception_handler(request: Request, exc: Exception):
 
 
 @app.get("/health", response_model=HealthResponse, tags=["Health"])
-async def health_check() -> HealthResponse:
+def health_check() -> HealthResponse:
     """
     Health check endpoint with complete system status.
 
@@ -1009,7 +1033,7 @@ async def update_config(request: ConfigUpdateRequest) -> ConfigUpdateResponse:
 
 
 @app.post("/config/reload", response_model=ConfigReloadResponse, tags=["Config"])
-async def reload_config() -> ConfigReloadResponse:
+def reload_config() -> ConfigReloadResponse:
     """
     Reload configuration from disk.
 
@@ -1081,7 +1105,7 @@ async def get_watchlist() -> WatchlistResponse:
 
 
 @app.post("/config/watchlist", response_model=WatchlistUpdateResponse, tags=["Config"])
-async def update_watchlist(request: WatchlistUpdateRequest) -> WatchlistUpdateResponse:
+def update_watchlist(request: WatchlistUpdateRequest) -> WatchlistUpdateResponse:
     """
     Add or remove a ticker from the watchlist.
 
@@ -1213,7 +1237,7 @@ async def trigger_scan() -> ScanResponse:
         if not scan_repo:
             raise RuntimeError("Scan repository not initialized")
 
-        scan_id = scan_repo.create_scan(config_hash)
+        scan_id = await asyncio.to_thread(scan_repo.create_scan, config_hash)
         logger.info(f"Triggered new scan: id={scan_id}")
 
         return ScanResponse(
@@ -1252,7 +1276,7 @@ async def get_scan_status(scan_id: int) -> ScanStatusResponse:
         if not scan_repo:
             raise RuntimeError("Scan repository not initialized")
 
-        scan = scan_repo.get_scan(scan_id)
+        scan = await asyncio.to_thread(scan_repo.get_scan, scan_id)
         if not scan:
             logger.warning(f"Scan not found: id={scan_id}")
             raise HTTPException(status_code=404, detail=f"Scan {scan_id} not found")
@@ -1315,7 +1339,7 @@ async def get_latest_scans(
         if not scan_repo:
             raise HTTPException(status_code=500, detail="Scan repository not initialized")
 
-        scans = scan_repo.get_scan_history(days=365, limit=limit)
+        scans = await asyncio.to_thread(scan_repo.get_scan_history, days=365, limit=limit)
         logger.debug(f"Retrieved {len(scans)} scans from database")
 
         scan_summaries = [
@@ -1345,7 +1369,7 @@ async def get_latest_scans(
 
 
 @app.get("/alerts/latest", response_model=AlertsResponse, tags=["Alerts"])
-async def get_latest_alerts(
+def get_latest_alerts(
     limit: int = Query(50, ge=1, le=500, description="Number of alerts to return"),
     min_score: float = Query(0, ge=0, le=100, description="Minimum alert score"),
 ) -> AlertsResponse:
@@ -1424,7 +1448,7 @@ async def get_latest_alerts(
 
 
 @app.get("/alerts/latest/summary", response_model=AlertsSummaryResponse, tags=["Alerts"])
-async def get_latest_alerts_summary(
+def get_latest_alerts_summary(
     limit: int = Query(20, ge=1, le=100, description="Number of alerts to return"),
     min_score: float = Query(0, ge=0, le=100, description="Minimum alert score"),
 ) -> AlertsSummaryResponse:
@@ -1495,7 +1519,7 @@ async def get_latest_alerts_summary(
 
 
 @app.get("/alerts", response_model=AlertsResponse, tags=["Alerts"])
-async def filter_alerts(
+def filter_alerts(
     ticker: Optional[str] = Query(None, description="Filter by ticker symbol"),
     min_score: float = Query(0, ge=0, le=100, description="Minimum alert score"),
     detector: Optional[str] = Query(None, description="Filter by detector name"),
@@ -1575,7 +1599,7 @@ async def filter_alerts(
 
 
 @app.get("/alerts/ticker/{ticker}", response_model=AlertsResponse, tags=["Alerts"])
-async def get_ticker_alerts(
+def get_ticker_alerts(
     ticker: str = Path(..., description="Stock ticker symbol"),
     limit: int = Query(100, ge=1, le=500, description="Number of alerts to return"),
 ) -> AlertsResponse:
@@ -1644,7 +1668,7 @@ async def get_ticker_alerts(
 
 
 @app.get("/options/{ticker}/expirations", tags=["Options"])
-async def get_option_expirations(
+def get_option_expirations(
     ticker: str = Path(..., description="Stock ticker symbol")
 ) -> dict[str, list[str]]:
     """
@@ -1703,7 +1727,7 @@ async def get_option_expirations(
 
 
 @app.get("/options/{ticker}/snapshot", response_model=ChainSnapshotResponse, tags=["Options"])
-async def get_options_snapshot(
+def get_options_snapshot(
     ticker: str = Path(..., description="Stock ticker symbol"),
     expiration: Optional[str] = Query(None, description="Optional specific expiration date (YYYY-MM-DD)")
 ) -> ChainSnapshotResponse:
@@ -1821,7 +1845,7 @@ async def get_options_snapshot(
 
 
 @app.get("/options/{ticker}/history", response_model=List[ChainSnapshotResponse], tags=["Options"])
-async def get_options_history(
+def get_options_history(
     ticker: str = Path(..., description="Stock ticker symbol"),
     days: int = Query(30, ge=1, le=365, description="Number of days of history"),
     limit: int = Query(100, ge=1, le=1000, description="Maximum snapshots to return"),
@@ -1965,7 +1989,7 @@ async def get_latest_features(
     """
     try:
         # Load features from JSON file (Hybrid Approach - Option C)
-        features = load_features_from_json(ticker=ticker)
+        features = await asyncio.to_thread(load_features_from_json, ticker=ticker)
 
         if not features:
             logger.info(f"No features available for ticker: {ticker}")
@@ -2044,7 +2068,7 @@ async def compute_features_endpoint(
 
 @app.post("/transactions/import", tags=["Transactions"])
 async def import_transactions(
-    file_path: str = Query(..., description="Path to CSV file to import")
+    file_path: str = Query(..., description="CSV file name inside data/imports/")
 ) -> Dict[str, Any]:
     """
     Import transactions from CSV file.
@@ -2052,14 +2076,19 @@ async def import_transactions(
     CSV format expected:
         timestamp,ticker,transaction_type,quantity,price,notes
 
+    Only files inside data/imports/ can be imported. Rows that fail
+    validation are skipped and listed in errors; all other rows are committed
+    in one transaction, so a failed import (500) leaves nothing behind and can
+    be retried.
+
     Args:
-        file_path: Path to CSV file relative to project root
+        file_path: CSV file name relative to data/imports/
 
     Returns:
         Dict with import_status, records_imported, errors
 
     Raises:
-        HTTPException: 400 if file invalid, 500 if import fails
+        HTTPException: 400 if the path or file is invalid, 500 if the import fails
 
     Example:
         POST /transactions/import?file_path=transactions.csv
@@ -2071,13 +2100,21 @@ async def import_transactions(
     """
     try:
         logger.info(f"Transaction import started: file={file_path}")
-        # Note: Actual CSV parsing and import would be implemented here
+        # Parse and insert off the event loop so other requests keep being served
+        result = await asyncio.to_thread(import_transactions_csv, file_path)
+        logger.info(
+            f"Transaction import finished: {result['records_imported']} imported, "
+            f"{result['error_count']} rows rejected"
+        )
         return {
-            "status": "success",
-            "records_imported": 0,
-            "errors": [],
+            "status": "success" if result["error_count"] == 0 else "partial",
+            "records_imported": result["records_imported"],
+            "errors": result["errors"],
             "timestamp": get_utc_iso_timestamp(),
         }
+    except (FileNotFoundError, ValueError) as e:
+        logger.warning(f"Transaction import rejected: {e}")
+        raise HTTPException(status_code=400, detail=str(e))
     except Exception as e:
         logger.error(f"Transaction import failed: {e}")
         raise HTTPException(status_code=500, detail=f"Import failed: {e}")
@@ -2123,21 +2160,27 @@ async def get_transactions(
 # ============================================================================
 
 
-@app.get("/", tags=["Root"])
-async def root():
-    """
-    Root endpoint with API information.
-
-    Returns:
-        JSON object with API name and documentation links
-    """
-    return {
+# The root payload never changes, so serialize it once at import time
+_ROOT_PAYLOAD: bytes = json.dumps(
+    {
         "name": "Option Chain Dashboard API",
         "version": "1.0.0",
         "docs": "http://localhost:8061/docs",
         "redoc": "http://localhost:8061/redoc",
         "openapi": "http://localhost:8061/openapi.json",
     }
+).encode()
+
+
+@app.get("/", tags=["Root"])
+async def root() -> Response:
+    """
+    Root endpoint with API information.
+
+    Returns:
+        JSON object with API name and documentation links (pre-serialized)
+    """
+    return Response(content=_ROOT_PAYLOAD, media_type="application/json")
 
 
 # ============================================================================
@@ -2152,16 +2195,33 @@ if __name__ == "__main__":
     Configuration:
         - Host: 0.0.0.0 (all interfaces)
         - Port: 8061
-        - Reload: Enabled for development (disable in production)
-        - Workers: Auto-determined by uvicorn
+        - Development (default): single worker with auto-reload
+        - Production (ENV=prod): no reload, uvloop event loop, httptools parser,
+          and API_WORKERS worker processes (default: 1). Both libraries ship
+          with uvicorn[standard]. Each worker opens the DuckDB file read-write
+          on startup and DuckDB allows only one such process, so more than one
+          worker needs a cross-process database access scheme first.
     """
     logger.info("Starting Option Chain Dashboard FastAPI server")
     logger.info("API Documentation: http://localhost:8061/docs")
 
-    uvicorn.run(
-        "scripts.run_api:app",
-        host="0.0.0.0",
-        port=8061,
-        reload=True,
-        log_level="info",
-    )
+    if os.getenv("ENV", "").lower() == "prod":
+        workers = int(os.getenv("API_WORKERS", "1"))
+        logger.info(f"Production mode: {workers} workers, uvloop + httptools")
+        uvicorn.run(
+            "scripts.run_api:app",
+            host="0.0.0.0",
+            port=8061,
+            workers=workers,
+            loop="uvloop",
+            http="httptools",
+            log_level="info",
+        )
+    else:
+        uvicorn.run(
+            "scripts.run_api:app",
+            host="0.0.0.0",
+            port=8061,
+            reload=True,
+            log_level="info",
+        )
@@ -11,16 +11,17 @@ Core Components:
 1. async run_scan(config: AppConfig) -> ScanResult
    Main scanning orchestrator that:
    - Creates scan record in database
-   - For each ticker: fetches data, computes features, runs detectors,
-     scores alerts, checks risk gates, applies throttling, builds explanations
-   - Batch writes all alerts to database
+   - Fetches market snapshots for all tickers concurrently
+   - For each ticker: computes features, runs detectors, scores alerts,
+     checks risk gates, applies throttling, builds explanations
+   - Batch writes all feature snapshots and alerts to database
    - Updates scan record with results
    - Returns ScanResult with execution summary
 
 2. ScanResult dataclass
    Represents the output of a complete scan with metadata about execution
 
-3. collect_chains(config, provider) -> None
+3. collect_chains(config, provider, rate_limit=None) -> None
    Collects and historizes all options chains for watchlist tickers
 
 4. async main()
@@ -33,13 +34,16 @@ import asyncio
 import argparse
 import json
 import sys
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional, Dict, List, Any
+from typing import Optional, Dict, List, Any, Tuple
 
 from functions.util.logging_setup import setup_logging, get_logger
+from functions.util.event_loop import run as run_event_loop
 from functions.config.loader import get_config_manager
 from functions.config.models import AppConfig
 from functions.config.settings import get_settings
@@ -50,15 +54,27 @@ from functions.db.repositories import (
     AlertRepository,
     CooldownRepository,
     ChainSnapshotRepository,
+    AlertRow,
 )
 from functions.market.provider_base import MarketDataProvider
-from functions.compute.feature_engine import compute_features
-from functions.detect import DetectorRegistry, AlertCandidate, get_registry
+from functions.compute.feature_engine import FeatureSet, compute_features
+from functions.detect import AlertCandidate
+from functions.detect.runner import (
+    build_detectors,
+    get_detector_pool,
+    run_detectors,
+    shutdown_detector_pool,
+)
 from functions.scoring.scorer import AlertScorer
 from functions.scoring.throttler import AlertThrottler
 from functions.risk.gate import RiskGate
 from functions.explain.template_explain import ExplanationGenerator
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used when unavailable
+    orjson = None
+
 logger = get_logger(__name__)
 
 
@@ -67,7 +83,7 @@ logger = get_logger(__name__)
 # ============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ScanResult:
     """
     Represents the output of a complete scan operation.
@@ -133,18 +149,25 @@ async def run_scan(
     This is the main orchestration function that coordinates all components:
     1. Initializes database and repositories
     2. Creates scan record in database
-    3. For each ticker in watchlist:
-       a) Fetches current market snapshot via MarketDataProvider
-       b) Computes features via FeatureEngine
-       c) Runs all registered detectors via DetectorRegistry
-       d) Scores alerts via AlertScorer
-       e) Checks risk gates via RiskGate
-       f) Applies throttling via AlertThrottler
-       g) Generates explanations via ExplanationGenerator
-       h) Adds alerts to write buffer
-    4. Batch writes all alerts to database
-    5. Updates scan record with final status and results
-    6. Returns ScanResult with execution summary
+    3. Fetches market snapshots for all tickers via MarketDataProvider: one
+       get_full_snapshots() batch call if the provider implements it, else
+       concurrent get_full_snapshot() calls (up to config.scan.concurrency)
+    4. For each ticker in watchlist:
+       a) Computes features via FeatureEngine
+       b) Runs all registered detectors via DetectorRegistry, in a process
+          pool when config.scan.detector_processes > 0; skipped for tickers
+          in cooldown or over the concentration limit
+       c) Scores alerts via AlertScorer, dropping those below
+          config.scoring.publish_threshold
+       d) Checks risk gates via RiskGate
+       e) Applies throttling via AlertThrottler, in one bulk check for all
+          candidates that passed the risk gates
+       f) Generates explanations via ExplanationGenerator
+       g) Adds alerts to write buffer, flushing every config.scan.flush_threshold
+    5. Batch writes all feature snapshots, remaining alerts and buffered
+       throttle state (cooldowns, daily counts) to database
+    6. Updates scan record with final status and results
+    7. Returns ScanResult with execution summary
 
     Args:
         config (AppConfig): Application configuration containing:
@@ -177,10 +200,15 @@ async def run_scan(
         >>> print(f"Generated {result.alert_count} alerts for {result.ticker_count} tickers")
     """
     start_time = time.time()
+
+    # Resolved once; used for logging, the scan record, features and results
+    symbols = list(config.scan.symbols)
+    config_hash = getattr(config, 'config_hash', 'unknown')
+
     logger.info("=" * 80)
     logger.info("Starting scan orchestrator")
-    logger.info(f"Watchlist: {len(config.scan.symbols)} tickers")
-    logger.info(f"Config hash: {config.config_hash if hasattr(config, 'config_hash') else 'N/A'}")
+    logger.info(f"Watchlist: {len(symbols)} tickers")
+    logger.info(f"Config hash: {config_hash}")
 
     try:
         # ====================================================================
@@ -207,7 +235,15 @@ async def run_scan(
 
         # Get orchestration components
         alert_scorer = AlertScorer(config)
-        throttler = AlertThrottler(get_db(), config)
+        # Cooldowns for the whole watchlist are read once; the throttler serves
+        # checks from memory and buffers its writes until the end of the scan
+        throttler = AlertThrottler(
+            get_db(),
+            config,
+            prefetched_cooldowns=cooldown_repo.get_cooldowns(
+                [symbol.upper() for symbol in symbols]
+            )
+        )
         risk_gate = RiskGate(config)
         explanation_generator = ExplanationGenerator(config)
 
@@ -217,191 +253,303 @@ async def run_scan(
         # CREATE SCAN RECORD
         # ====================================================================
 
-        config_hash = getattr(config, 'config_hash', 'unknown')
         scan_id = scan_repo.create_scan(config_hash=config_hash)
         logger.info(f"Created scan record: id={scan_id}")
 
         # ====================================================================
-        # PROCESS EACH TICKER
+        # FETCH MARKET SNAPSHOTS
         # ====================================================================
 
-        alerts_buffer: List[Dict[str, Any]] = []
-        tickers_failed: List[str] = []
-        tickers_processed: int = 0
-
-        for ticker in config.scan.symbols:
+        base_batch_fetch = MarketDataProvider.get_full_snapshots
+        if getattr(type(provider), "get_full_snapshots", base_batch_fetch) is not base_batch_fetch:
+            # Provider has a multi-symbol endpoint: one request for the watchlist
+            logger.debug(f"Fetching {len(symbols)} market snapshots in one batch")
             try:
-                logger.info(f"\n--- Processing ticker: {ticker} ---")
+                snapshots_map = await asyncio.to_thread(provider.get_full_snapshots, symbols)
+            except Exception as e:
+                logger.error(f"Failed to fetch market snapshots batch: {e}")
+                snapshots_map = {}
+            snapshots = [snapshots_map.get(ticker) for ticker in symbols]
+        else:
+            # Provider calls are blocking network I/O: run them in worker threads
+            # so their latency overlaps, with the semaphore bounding requests
+            fetch_semaphore = asyncio.Semaphore(config.scan.concurrency)
+
+            async def _fetch_snapshot(ticker: str) -> Optional[Any]:
+                async with fetch_semaphore:
+                    logger.debug("Fetching market snapshot for %s", ticker)
+                    try:
+                        return await asyncio.to_thread(provider.get_full_snapshot, ticker)
+                    except Exception as e:
+                        logger.error(f"Failed to fetch market snapshot for {ticker}: {e}")
+                        return None
+
+            snapshots = await asyncio.gather(*[_fetch_snapshot(t) for t in symbols])
+        logger.info(
+            f"Fetched {sum(s is not None for s in snapshots)}/{len(symbols)} market snapshots"
+        )
+
+        # ====================================================================
+        # COMPUTE FEATURES
+        # ====================================================================
 
-                # Get current market snapshot
-                logger.debug(f"Fetching market snapshot for {ticker}")
-                snapshot = provider.get_full_snapshot(ticker)
+        features_buffer: List[Dict[str, Any]] = []
+        ticker_features: List[Optional[FeatureSet]] = []
 
+        for ticker, snapshot in zip(symbols, snapshots):
+            features = None
+            try:
                 if snapshot is None:
                     logger.warning(f"Failed to get market snapshot for {ticker}, skipping")
-                    tickers_failed.append(ticker)
-                    continue
+                else:
+                    logger.debug("Market snapshot retrieved for %s: price=$%.2f", ticker, snapshot.price)
+                    features = compute_features(
+                        snapshot=snapshot,
+                        config_hash=config_hash
+                    )
+                    # to_dict() walks every nested structure; build it once per ticker
+                    features_dict = features.to_dict()
+                    logger.debug("Features computed for %s: %d fields", ticker, len(features_dict))
 
-                logger.debug(f"Market snapshot retrieved: price=${snapshot.price:.2f}")
+                    # Buffer feature snapshot for the batched write after the scan
+                    features_buffer.append(
+                        {"scan_id": scan_id, "ticker": ticker, "features": features_dict}
+                    )
+            except Exception as e:
+                logger.error(f"Failed to compute features for {ticker}: {e}", exc_info=True)
+                features = None
+            ticker_features.append(features)
 
-                # Compute features
-                logger.debug(f"Computing features for {ticker}")
-                features = compute_features(
-                    snapshot=snapshot,
-                    config_hash=config_hash
-                )
-                logger.debug(f"Features computed: {len(features.to_dict())} fields")
+        # ====================================================================
+        # RUN DETECTORS
+        # ====================================================================
 
-                # Save feature snapshot to database
+        # Detectors are CPU-bound; with scan.detector_processes > 0 they run in
+        # a process pool across tickers, otherwise in this process. Scoring,
+        # gating, throttling and persistence below stay in this process.
+        detector_processes = config.scan.detector_processes
+        ticker_candidates: List[Optional[List[AlertCandidate]]] = [None] * len(symbols)
+        detect_indexes: List[int] = []
+
+        # Cooldown and concentration limits depend only on the ticker; a ticker
+        # blocked by either would have every detector hit rejected, so its
+        # detectors are skipped (features are still saved)
+        for i, (ticker, features) in enumerate(zip(symbols, ticker_features)):
+            if features is None:
+                continue
+            if throttler.ticker_in_cooldown(ticker):
+                logger.debug("Skipping detectors for %s: in cooldown", ticker)
+                ticker_candidates[i] = []
+                continue
+            passes_prefilter, prefilter_reason = risk_gate.ticker_prefilter(ticker)
+            if not passes_prefilter:
+                logger.debug("Skipping detectors for %s: %s", ticker, prefilter_reason)
+                ticker_candidates[i] = []
+                continue
+            detect_indexes.append(i)
+
+        if detector_processes > 0 and detect_indexes:
+            loop = asyncio.get_running_loop()
+            pool = get_detector_pool(detector_processes)
+            results = await asyncio.gather(
+                *[
+                    loop.run_in_executor(pool, run_detectors, ticker_features[i])
+                    for i in detect_indexes
+                ],
+                return_exceptions=True
+            )
+        else:
+            # Detectors are stateless, so instantiate each registered class once
+            # per scan rather than once per (ticker, detector) pair
+            detectors = build_detectors()
+            logger.debug(f"Running {len(detectors)} detectors in-process")
+            results = []
+            for i in detect_indexes:
                 try:
-                    feature_repo.save_snapshot(
-                        scan_id=scan_id,
-                        ticker=ticker,
-                        features=features.to_dict()
-                    )
-                    logger.debug(f"Feature snapshot saved for {ticker}")
+                    results.append(run_detectors(ticker_features[i], detectors))
                 except Exception as e:
-                    logger.error(f"Failed to save feature snapshot for {ticker}: {e}")
+                    results.append(e)
 
-        detector_registry = get_registry()
-
-        # Run all detectors
-        logger.debug(f"Running {len(detector_registry.get_all_detectors())} detectors")
-        detector_count = 0
-        for detector_class in detector_registry.get_all_detectors():
-                    try:
-                        detector = detector_class()
-                        alert_candidate = detector.detect_safe(features)
+        for i, result in zip(detect_indexes, results):
+            if isinstance(result, BaseException):
+                logger.error(f"Detector run failed for {symbols[i]}: {result}")
+                continue
+            ticker_candidates[i] = result
 
-                        if alert_candidate is None:
-                            logger.debug(f"No detection from {detector.name}")
-                            continue
+        # ====================================================================
+        # SCORE AND RISK-GATE CANDIDATES
+        # ====================================================================
 
-                        detector_count += 1
-                        logger.info(f"Detection: {detector.name} scored {alert_candidate.score:.1f}")
+        # Scoring and risk gates are in-memory checks; candidates that pass are
+        # collected across the whole scan so throttling can be evaluated for
+        # all of them with one cooldown query instead of one per candidate.
+        gated: List[Tuple[str, FeatureSet, AlertCandidate]] = []
+        tickers_failed: List[str] = []
+        tickers_processed: int = 0
+        publish_threshold = config.scoring.publish_threshold
 
-                        # ====================================================
-                        # APPLY SCORING ADJUSTMENTS
-                        # ====================================================
+        for ticker, features, candidates in zip(symbols, ticker_features, ticker_candidates):
+            if features is None or candidates is None:
+                tickers_failed.append(ticker)
+                continue
 
-                        adjusted_score = alert_scorer.score_alert(
-                            alert=alert_candidate,
-                            ticker=ticker,
-                            features=features
-                        )
-                        alert_candidate.score = adjusted_score
-                        logger.info(
-                            f"Score adjusted: {detector_count} -> "
-                            f"{adjusted_score:.1f} for {ticker}"
-                        )
+            passed = 0
+            for alert_candidate in candidates:
+                try:
+                    raw_score = alert_candidate.score
+                    logger.debug(
+                        "Detection: %s scored %.1f",
+                        alert_candidate.detector_name, raw_score
+                    )
 
-                        # ====================================================
-                        # CHECK RISK GATES
-                        # ====================================================
+                    adjusted_score = alert_scorer.score_alert(
+                        alert=alert_candidate,
+                        ticker=ticker,
+                        features=features
+                    )
+                    alert_candidate.score = adjusted_score
+                    logger.debug(
+                        "Score adjusted: %.1f -> %.1f for %s",
+                        raw_score, adjusted_score, ticker
+                    )
 
-                        passes_gate, gate_reason = risk_gate.passes_risk_gate(
-                            alert=alert_candidate,
-                            ticker=ticker
+                    # Cheapest rejection first: sub-threshold candidates never
+                    # reach the risk gates, throttler or explanation generator
+                    if adjusted_score < publish_threshold:
+                        logger.debug(
+                            "Below publish threshold for %s: %.1f < %.1f",
+                            ticker, adjusted_score, publish_threshold
                         )
+                        continue
 
-                        if not passes_gate:
-                            logger.info(f"Risk gate rejected {ticker}: {gate_reason}")
-                            continue
+                    passes_gate, gate_reason = risk_gate.passes_risk_gate(
+                        alert=alert_candidate,
+                        ticker=ticker
+                    )
+                    if not passes_gate:
+                        logger.debug("Risk gate rejected %s: %s", ticker, gate_reason)
+                        continue
 
-                        logger.info(f"Risk gate passed for {ticker}")
+                    logger.debug("Risk gate passed for %s", ticker)
+                    gated.append((ticker, features, alert_candidate))
+                    passed += 1
 
-                        # ====================================================
-                        # CHECK THROTTLES
-                        # ====================================================
+                except Exception as e:
+                    logger.error(
+                        f"Error processing detection for {ticker}: {e}",
+                        exc_info=True
+                    )
+                    continue
 
-                        should_throttle = throttler.should_alert(
-                            ticker=ticker,
-                            detector_name=alert_candidate.detector_name,
-                            current_score=alert_candidate.score
-                        )
+            logger.info(
+                "Completed processing %s: %d detections, %d passed risk gates",
+                ticker, len(candidates), passed
+            )
+            tickers_processed += 1
 
-                        if not should_throttle:
-                            throttle_reason = throttler.get_last_throttle_reason() or "throttled by policy"
-                            logger.info(f"Alert throttled for {ticker}: {throttle_reason}")
-                            continue
+        # ====================================================================
+        # CHECK THROTTLES (ONE PASS FOR ALL CANDIDATES)
+        # ====================================================================
 
-                        logger.info(f"Alert not throttled for {ticker}")
+        throttle_results = throttler.should_alert_bulk(
+            [(ticker, c.detector_name, c.score) for ticker, _, c in gated]
+        )
 
-                        # ====================================================
-                        # GENERATE EXPLANATIONS
-                        # ====================================================
+        # ====================================================================
+        # GENERATE EXPLANATIONS AND BUFFER ALERTS
+        # ====================================================================
 
-                        enriched_explanation = explanation_generator.generate_explanation(
-                            alert=alert_candidate,
-                            ticker=ticker,
-                            features=features
-                        )
-                        alert_candidate.explanation.update(enriched_explanation)
-                        logger.debug(f"Explanation generated for {ticker}")
-
-                        # ====================================================
-                        # ADD TO BUFFER
-                        # ====================================================
-
-                        alert_dict = {
-                            "ticker": ticker,
-                            "detector_name": alert_candidate.detector_name,
-                            "score": alert_candidate.score,
-                            "alert_data": {
-                                "metrics": alert_candidate.metrics,
-                                "explanation": alert_candidate.explanation,
-                                "strategies": alert_candidate.strategies,
-                                "confidence": alert_candidate.confidence,
-                            }
-                        }
-                        alerts_buffer.append(alert_dict)
-                        logger.info(
-                            f"Alert buffered for {ticker}: "
-                            f"{alert_candidate.detector_name} (score={alert_candidate.score:.1f})"
-                        )
+        # Alerts are flushed whenever the buffer reaches the threshold, so a long
+        # scan makes alerts visible early and a crash loses at most one batch
+        alerts_buffer: List[AlertRow] = []
+        alerts_written = 0
+        flush_threshold = config.scan.flush_threshold
 
-                        # Record alert for throttling
-                        throttler.record_alert(
-                            ticker=ticker,
-                            detector_name=alert_candidate.detector_name,
-                            score=alert_candidate.score,
-                            alert_id=None,
-                        )
+        def _flush_alerts() -> None:
+            nonlocal alerts_written
+            if not alerts_buffer:
+                return
+            logger.info(f"Batch writing {len(alerts_buffer)} alerts to database...")
+            try:
+                written = alert_repo.save_alerts_batch(
+                    scan_id=scan_id,
+                    alerts=alerts_buffer
+                )
+                alerts_written += written
+                logger.info(f"Successfully wrote {written} alerts to database")
+            except Exception as e:
+                logger.error(f"Failed to batch write alerts: {e}", exc_info=True)
+            alerts_buffer.clear()
+
+        for (ticker, features, alert_candidate), (allowed, throttle_reason) in zip(
+            gated, throttle_results
+        ):
+            if not allowed:
+                logger.debug(
+                    "Alert throttled for %s: %s",
+                    ticker, throttle_reason or "throttled by policy"
+                )
+                continue
 
-                    except Exception as e:
-                        logger.error(
-                            f"Error running detector for {ticker}: {e}",
-                            exc_info=True
-                        )
-                        continue
+            try:
+                enriched_explanation = explanation_generator.generate_explanation(
+                    alert=alert_candidate,
+                    ticker=ticker,
+                    features=features
+                )
+                alert_candidate.explanation.update(enriched_explanation)
+                logger.debug("Explanation generated for %s", ticker)
+
+                alerts_buffer.append(AlertRow(
+                    ticker=ticker,
+                    detector_name=alert_candidate.detector_name,
+                    score=alert_candidate.score,
+                    metrics=alert_candidate.metrics,
+                    explanation=alert_candidate.explanation,
+                    strategies=alert_candidate.strategies,
+                    confidence=alert_candidate.confidence,
+                ))
+                logger.debug(
+                    "Alert buffered for %s: %s (score=%.1f)",
+                    ticker, alert_candidate.detector_name, alert_candidate.score
+                )
 
-                logger.info(f"Completed processing {ticker}: {detector_count} detectors ran")
-                tickers_processed += 1
+                # Record alert for throttling
+                throttler.record_alert(
+                    ticker=ticker,
+                    detector_name=alert_candidate.detector_name,
+                    score=alert_candidate.score,
+                    alert_id=None,
+                )
 
             except Exception as e:
                 logger.error(
-                    f"Critical error processing ticker {ticker}: {e}",
+                    f"Error processing detection for {ticker}: {e}",
                     exc_info=True
                 )
-                tickers_failed.append(ticker)
-                continue
+
+            if len(alerts_buffer) >= flush_threshold:
+                _flush_alerts()
 
         # ====================================================================
-        # BATCH WRITE ALERTS TO DATABASE
+        # BATCH WRITE FEATURE SNAPSHOTS TO DATABASE
         # ====================================================================
 
-        logger.info(f"\nBatch writing {len(alerts_buffer)} alerts to database...")
-        alerts_written = 0
-        if alerts_buffer:
+        if features_buffer:
             try:
-                alerts_written = alert_repo.save_alerts_batch(
-                    scan_id=scan_id,
-                    alerts=alerts_buffer
-                )
-                logger.info(f"Successfully wrote {alerts_written} alerts to database")
+                features_written = feature_repo.save_snapshots_batch(features_buffer)
+                logger.info(f"Saved {features_written} feature snapshots")
             except Exception as e:
-                logger.error(f"Failed to batch write alerts: {e}", exc_info=True)
-                alerts_written = 0
+                logger.error(f"Failed to batch write feature snapshots: {e}", exc_info=True)
+
+        # ====================================================================
+        # FLUSH REMAINING ALERTS TO DATABASE
+        # ====================================================================
+
+        _flush_alerts()
+
+        # Persist cooldowns and daily counts buffered by the throttler
+        throttler.flush_pending_updates()
 
         # ====================================================================
         # UPDATE SCAN RECORD
@@ -428,7 +576,7 @@ async def run_scan(
         logger.info(f"SCAN COMPLETE")
         logger.info(f"  Scan ID: {scan_id}")
         logger.info(f"  Status: {status}")
-        logger.info(f"  Tickers processed: {tickers_processed}/{len(config.scan.symbols)}")
+        logger.info(f"  Tickers processed: {tickers_processed}/{len(symbols)}")
         if tickers_failed:
             logger.warning(f"  Failed tickers: {', '.join(tickers_failed)}")
         logger.info(f"  Alerts generated: {alerts_written}")
@@ -467,7 +615,29 @@ async def run_scan(
 # ============================================================================
 
 
-def collect_chains(config: AppConfig, provider: MarketDataProvider) -> None:
+def _dump_json_bytes(obj: Dict[str, Any]) -> bytes:
+    """
+    Serialize a chain snapshot document to indented JSON bytes.
+
+    Uses orjson (C extension) when installed, falling back to stdlib json.
+    Output is equivalent either way: two-space indentation, UTF-8.
+    """
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+    return json.dumps(obj, indent=2).encode("utf-8")
+
+
+def _write_chain_json(json_file: Path, payload: Dict[str, Any]) -> None:
+    """Serialize a ticker's chains document and write it to json_file."""
+    with open(json_file, "wb") as f:
+        f.write(_dump_json_bytes(payload))
+
+
+def collect_chains(
+    config: AppConfig,
+    provider: MarketDataProvider,
+    rate_limit: Optional[threading.Semaphore] = None
+) -> None:
     """
     Collect and historize all options chains for watchlist tickers.
 
@@ -477,13 +647,19 @@ def collect_chains(config: AppConfig, provider: MarketDataProvider) -> None:
 
     For each ticker:
     1. Fetches list of available option expirations
-    2. For each expiration, fetches the complete options chain
+    2. Fetches the complete options chain for every expiration concurrently
+       (up to config.scan.concurrency requests in flight)
     3. Saves chain to database via ChainSnapshotRepository
     4. Writes JSON file to historical_data/chains/{YYYY-MM-DD}/{TICKER}_chains.json
+       on a background I/O thread, so disk writes overlap the next ticker's
+       fetches; all files are written before the function returns
 
     Args:
         config (AppConfig): Application configuration containing watchlist
         provider (MarketDataProvider): Market data provider to fetch chains from
+        rate_limit (Optional[threading.Semaphore]): Shared semaphore acquired
+            around each chain request, so callers can apply an external
+            rate-limit budget (e.g. the scheduler's) on top of concurrency
 
     Returns:
         None
@@ -503,6 +679,19 @@ def collect_chains(config: AppConfig, provider: MarketDataProvider) -> None:
 
     chain_repo = ChainSnapshotRepository()
 
+    def _fetch_chain(ticker: str, expiration: Any) -> Any:
+        if rate_limit is None:
+            return provider.get_options_chain(ticker, expiration)
+        with rate_limit:
+            return provider.get_options_chain(ticker, expiration)
+
+    executor = ThreadPoolExecutor(
+        max_workers=config.scan.concurrency,
+        thread_name_prefix="chain-fetch"
+    )
+    io_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="chain-json")
+    json_writes = []
+
     for ticker in config.scan.symbols:
         try:
             logger.info(f"Collecting chains for {ticker}...")
@@ -513,11 +702,16 @@ def collect_chains(config: AppConfig, provider: MarketDataProvider) -> None:
                 logger.warning(f"No options chains available for {ticker}")
                 continue
 
-            # Collect chains for each expiration
+            # Fetch all expirations concurrently; results are consumed in
+            # expiration order so the JSON output stays deterministic
+            futures = [
+                (expiration, executor.submit(_fetch_chain, ticker, expiration))
+                for expiration in expirations
+            ]
             all_chains = {}
-            for expiration in expirations:
+            for expiration, future in futures:
                 try:
-                    chain = provider.get_options_chain(ticker, expiration)
+                    chain = future.result()
                     if chain:
                         all_chains[str(expiration)] = {
                             "expiration": str(expiration),
@@ -525,7 +719,8 @@ def collect_chains(config: AppConfig, provider: MarketDataProvider) -> None:
                             "puts_count": len(chain.puts) if chain.puts else 0,
                         }
                         logger.debug(
-                            f"  {expiration}: {len(chain.calls)} calls, {len(chain.puts)} puts"
+                            "  %s: %d calls, %d puts",
+                            expiration, len(chain.calls), len(chain.puts)
                         )
                 except Exception as e:
                     logger.error(f"Error fetching chain for {ticker} exp={expiration}: {e}")
@@ -542,27 +737,32 @@ def collect_chains(config: AppConfig, provider: MarketDataProvider) -> None:
                 except Exception as e:
                     logger.error(f"Error saving chains for {ticker}: {e}")
 
-                # Write JSON file
-                try:
-                    json_file = chains_dir / f"{ticker}_chains.json"
-                    with open(json_file, "w") as f:
-                        json.dump(
-                            {
-                                "ticker": ticker,
-                                "timestamp_utc": datetime.now(timezone.utc).isoformat(),
-                                "expirations": all_chains
-                            },
-                            f,
-                            indent=2
-                        )
-                    logger.debug(f"Wrote chains JSON: {json_file}")
-                except Exception as e:
-                    logger.error(f"Error writing JSON for {ticker}: {e}")
+                # Write JSON file in the background
+                json_file = chains_dir / f"{ticker}_chains.json"
+                payload = {
+                    "ticker": ticker,
+                    "timestamp_utc": datetime.now(timezone.utc).isoformat(),
+                    "expirations": all_chains
+                }
+                json_writes.append(
+                    (ticker, json_file, io_pool.submit(_write_chain_json, json_file, payload))
+                )
 
         except Exception as e:
             logger.error(f"Critical error collecting chains for {ticker}: {e}", exc_info=True)
             continue
 
+    executor.shutdown(wait=True)
+
+    # Wait for pending JSON writes so files are complete when we return
+    io_pool.shutdown(wait=True)
+    for ticker, json_file, future in json_writes:
+        try:
+            future.result()
+            logger.debug(f"Wrote chains JSON: {json_file}")
+        except Exception as e:
+            logger.error(f"Error writing JSON for {ticker}: {e}")
+
     logger.info(f"Chain collection complete. Files written to {chains_dir}")
 
 
@@ -717,8 +917,12 @@ async def main() -> int:
         logger.error(f"Scan execution failed: {e}", exc_info=True)
         return 1
 
+    finally:
+        # Stop the detector worker processes so the CLI exits cleanly
+        shutdown_detector_pool()
+
 
 if __name__ == "__main__":
-    # Run async main function
-    exit_code = asyncio.run(main())
+    # Run async main function (on uvloop when installed)
+    exit_code = run_event_loop(main())
     sys.exit(exit_code)
@@ -15,14 +15,15 @@ SchedulerEngine class:
 - Manages state transitions and rate limiting
 - Persists state to database for crash recovery
 - Implements adaptive delays based on budget percentage
-- Runs 24/7 with 10-second check intervals
+- Runs 24/7, sleeping until the next deadline (collection, backoff, flush, export)
 
 Configuration keys (from config.yaml):
 - scheduler.collection_times_et: List of times like ["16:15"] (post-close, in ET)
 - scheduler.max_calls_per_hour: 250 (conservative limit for API provider)
 - scheduler.max_calls_per_day: 2000
-- scheduler.flush_threshold: 50 (buffer items before bulk flush)
-- scheduler.check_interval_sec: 10 (how often state machine checks)
+- scheduler.flush_threshold: 1024 (buffer items before bulk flush)
+- scheduler.flush_threshold_bytes: 5 MiB (estimated buffer size before bulk flush)
+- scheduler.check_interval_sec: 10 (delay before retrying after a loop error)
 
 Rate Limiting Logic:
 - Track api_calls_this_hour and api_calls_today
@@ -32,7 +33,7 @@ Rate Limiting Logic:
 - Transition to BACKING_OFF when budget exhausted or rate limit hit
 
 Data Structures:
-- write_buffer: List[dict] of alerts to batch flush to database
+- write_buffer: deque of (scan_id, alert_count, timestamp) tuples to batch flush to database
 - scheduler_state: Dict with current_state, api_calls_today, api_calls_hour, etc.
 - backoff_until: datetime when safe to resume after rate limit
 
@@ -65,17 +66,27 @@ Persists state to enable crash recovery.
 """
 
 import asyncio
+import bisect
 import json
-from dataclasses import dataclass, field, asdict
-from datetime import datetime, timedelta, timezone
+import logging
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import date, datetime, time as dt_time, timedelta, timezone
 from enum import Enum
-from typing import Callable, Optional, List, Dict, Any
-from pathlib import Path
+from typing import Callable, ClassVar, Optional, List, Dict, Any, Tuple
+
+import duckdb
 
 from functions.util.logging_setup import setup_logging, get_logger
+from functions.util.event_loop import run as run_event_loop
+from functions.util.time_utils import ET
 from functions.config.models import AppConfig
-from functions.db.connection import init_db, get_db
+from functions.db.connection import init_db
 from functions.db.repositories import BaseRepository
+from functions.detect.runner import shutdown_detector_pool
 from functions.export import JSONExporter
 from functions.market.provider_base import MarketDataProvider
 from functions.market.demo_provider import DemoMarketDataProvider
@@ -100,18 +111,59 @@ class SchedulerState(str, Enum):
 DEFAULT_CHECK_INTERVAL_SEC: int = 10
 DEFAULT_MAX_CALLS_PER_HOUR: int = 250
 DEFAULT_MAX_CALLS_PER_DAY: int = 2000
-DEFAULT_FLUSH_THRESHOLD: int = 50
+DEFAULT_FLUSH_THRESHOLD: int = 1024
+DEFAULT_FLUSH_THRESHOLD_BYTES: int = 5 * 1024 * 1024  # Estimated JSON size of buffered items
+DEFAULT_FLUSH_MAX_AGE_SEC: int = 300  # Flush buffered items at most this long after the first
 DEFAULT_COLLECTION_TIMES_ET: List[str] = ["16:15"]  # Post-market close ET
+FALLBACK_COLLECTION_TIME_ET: dt_time = dt_time(16, 15)
+
+# Unchanged state is re-persisted at most this often (heartbeat for recovery)
+STATE_PERSIST_MAX_INTERVAL_SEC: int = 60
+
+# Bounds on the loop's sleep between checks; the cap keeps heartbeats and
+# externally changed deadlines responsive
+MIN_CHECK_INTERVAL_SEC: float = 0.1
+MAX_CHECK_INTERVAL_SEC: float = 60.0
+
+# A check with nothing due for at least this long skips the state machine
+NO_OP_TICK_MARGIN_SEC: float = 0.5
+
+# Write-behind flusher poll interval for SchedulerStateRepository
+STATE_FLUSH_INTERVAL_SEC: float = 0.1
+
+# Persisted state older than this is ignored on startup
+STATE_MAX_AGE_HOURS: float = 24.0
+
+# scheduler_state is a singleton table; its only row has this id
+SCHEDULER_STATE_ID: int = 1
+
+# Database failures handled by SchedulerStateRepository: DuckDBManager wraps
+# query errors in RuntimeError; fetches on a result raise duckdb.Error directly
+DB_ERRORS: Tuple[type, ...] = (RuntimeError, duckdb.Error)
 
 # Backoff strategy: exponential with max
 BACKOFF_SECONDS: List[int] = [60, 120, 240, 480, 960, 1800]  # 1, 2, 4, 8, 16, 30 min
 
+# Adaptive delay: budget % used above each threshold selects the next delay
+ADAPTIVE_DELAY_THRESHOLDS_PCT: Tuple[float, ...] = (25.0, 50.0, 75.0)
+ADAPTIVE_DELAYS_SEC: Tuple[float, ...] = (1.0, 2.0, 2.5, 3.0)
+
 
 # ============================================================================
 # DATA STRUCTURES
 # ============================================================================
 
-@dataclass
+def _to_epoch_ms(dt: datetime) -> int:
+    """Convert an aware datetime to integer milliseconds since the Unix epoch."""
+    return int(dt.timestamp() * 1000)
+
+
+def _from_epoch_ms(ms: int) -> datetime:
+    """Convert epoch milliseconds to a UTC datetime."""
+    return datetime.fromtimestamp(ms / 1000, tz=timezone.utc)
+
+
+@dataclass(slots=True, frozen=True)
 class SchedulerStateData:
     """
     Persisted scheduler state for crash recovery.
@@ -119,39 +171,92 @@ class SchedulerStateData:
     This dataclass captures the complete state of the scheduler at any moment,
     allowing it to recover gracefully from crashes or restarts.
 
+    Timestamps are stored as integer epoch milliseconds (UTC), 0 meaning
+    unset, and map directly to BIGINT columns.
+
+    Instances are immutable snapshots: the write-behind buffer may hold one
+    while the engine keeps changing its own state.
+
     Attributes:
         current_state: Current state machine state (IDLE, WAITING, COLLECTING, etc.)
         api_calls_today: Count of API calls made today (resets at midnight UTC)
         api_calls_this_hour: Count of API calls made this hour (resets every hour)
-        hour_window_start_utc: UTC datetime when current hour window started
-        day_window_start_utc: UTC datetime when current day window started
-        next_collection_utc: UTC datetime of next scheduled collection
+        hour_window_start_ms: When current hour window started
+        day_window_start_ms: When current day window started
+        next_collection_ms: Time of next scheduled collection
         consecutive_failures: Count of consecutive rate-limit failures
-        backoff_until_utc: UTC datetime when safe to resume after backoff
+        backoff_until_ms: When safe to resume after backoff
         write_buffer_count: Number of items in write buffer awaiting flush
-        last_state_change_utc: UTC datetime of last state transition
-        last_persisted_utc: UTC datetime when this state was saved to database
+        last_state_change_ms: Time of last state transition
+        last_persisted_ms: When this state was saved to database
     """
     current_state: str = SchedulerState.IDLE.value
     api_calls_today: int = 0
     api_calls_this_hour: int = 0
-    hour_window_start_utc: str = ""  # ISO format
-    day_window_start_utc: str = ""   # ISO format
-    next_collection_utc: str = ""    # ISO format
+    hour_window_start_ms: int = 0
+    day_window_start_ms: int = 0
+    next_collection_ms: int = 0
     consecutive_failures: int = 0
-    backoff_until_utc: str = ""      # ISO format
+    backoff_until_ms: int = 0
     write_buffer_count: int = 0
-    last_state_change_utc: str = ""  # ISO format
-    last_persisted_utc: str = ""     # ISO format
+    last_state_change_ms: int = 0
+    last_persisted_ms: int = 0
+
+    # Memoized to_dict() result; safe to reuse because instances are frozen
+    _dict_cache: Optional[Dict[str, Any]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
 
     def to_dict(self) -> Dict[str, Any]:
-        """Convert to dictionary for JSON serialization."""
-        return asdict(self)
+        """
+        Convert to dictionary for JSON serialization.
+
+        Built field by field: all fields are scalars, so asdict()'s recursive
+        deep copy is unnecessary. The dict is built once per instance and
+        shared between calls, so callers must not modify it.
+        """
+        if self._dict_cache is not None:
+            return self._dict_cache
+
+        data = {
+            "current_state": self.current_state,
+            "api_calls_today": self.api_calls_today,
+            "api_calls_this_hour": self.api_calls_this_hour,
+            "hour_window_start_ms": self.hour_window_start_ms,
+            "day_window_start_ms": self.day_window_start_ms,
+            "next_collection_ms": self.next_collection_ms,
+            "consecutive_failures": self.consecutive_failures,
+            "backoff_until_ms": self.backoff_until_ms,
+            "write_buffer_count": self.write_buffer_count,
+            "last_state_change_ms": self.last_state_change_ms,
+            "last_persisted_ms": self.last_persisted_ms,
+        }
+        # Concurrent first calls may both build it; either result is identical
+        object.__setattr__(self, "_dict_cache", data)
+        return data
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "SchedulerStateData":
-        """Create from dictionary."""
-        return cls(**data)
+        """
+        Create from dictionary (e.g. the output of to_dict()).
+
+        Fields are read explicitly rather than via cls(**data); missing keys
+        fall back to the field defaults and unknown keys are ignored.
+        """
+        get = data.get
+        return cls(
+            current_state=get("current_state", SchedulerState.IDLE.value),
+            api_calls_today=get("api_calls_today", 0),
+            api_calls_this_hour=get("api_calls_this_hour", 0),
+            hour_window_start_ms=get("hour_window_start_ms", 0),
+            day_window_start_ms=get("day_window_start_ms", 0),
+            next_collection_ms=get("next_collection_ms", 0),
+            consecutive_failures=get("consecutive_failures", 0),
+            backoff_until_ms=get("backoff_until_ms", 0),
+            write_buffer_count=get("write_buffer_count", 0),
+            last_state_change_ms=get("last_state_change_ms", 0),
+            last_persisted_ms=get("last_persisted_ms", 0),
+        )
 
 
 # ============================================================================
@@ -164,13 +269,81 @@ class SchedulerStateRepository(BaseRepository):
 
     Manages storage and retrieval of scheduler state to enable crash recovery.
     Creates scheduler_state table if it doesn't exist on first use.
+
+    Writes are write-behind: save_state() only records the latest state and
+    marks it dirty; a daemon flusher thread commits the most recent pending
+    state every STATE_FLUSH_INTERVAL_SEC. Since the table holds a single row,
+    intermediate states are simply superseded. Call flush() or close() on
+    shutdown to force the final commit.
+
+    API call counts can also be persisted between full state saves:
+    record_api_call() only accumulates in-memory deltas, which the flusher
+    applies in a single UPDATE. A newer save_state() supersedes them, since
+    its absolute counters already include those calls.
     """
 
+    # Statements are built once per class rather than per call. Column names
+    # MUST match functions/db/schema.sql. scheduler_state is a singleton table
+    # (only one row with id=1), so INSERT OR REPLACE handles insert and update.
+    # A plain UPDATE is avoided: DuckDB 0.9 rewrites a row whose VARCHAR
+    # column changes as delete+insert, which trips the primary key check on
+    # the next UPDATE of the same row.
+    _SAVE_SQL: ClassVar[str] = (
+        "INSERT OR REPLACE INTO scheduler_state ("
+        "id, current_state, api_calls_today, api_calls_this_hour, "
+        "hour_window_start, next_collection_ts, consecutive_failures, "
+        "backoff_until, last_state_change, updated_at"
+        f") VALUES ({SCHEDULER_STATE_ID}, ?, ?, ?, ?, ?, ?, ?, "
+        "CURRENT_TIMESTAMP, CURRENT_TIMESTAMP) "
+        "RETURNING id"
+    )  # Save times are stamped by the database, not formatted in Python
+    _ADD_API_CALLS_SQL: ClassVar[str] = (
+        "UPDATE scheduler_state SET "
+        "api_calls_today = api_calls_today + ?, "
+        "api_calls_this_hour = api_calls_this_hour + ?, "
+        "updated_at = CURRENT_TIMESTAMP "
+        f"WHERE id = {SCHEDULER_STATE_ID}"
+    )
+    # NULLs are mapped to 0 in SQL so rows load without per-field coercion
+    _LOAD_SQL: ClassVar[str] = (
+        "SELECT current_state, "
+        "COALESCE(api_calls_today, 0), COALESCE(api_calls_this_hour, 0), "
+        "COALESCE(hour_window_start, 0), COALESCE(next_collection_ts, 0), "
+        "COALESCE(consecutive_failures, 0), COALESCE(backoff_until, 0), "
+        "epoch_ms(last_state_change), epoch_ms(updated_at) "
+        f"FROM scheduler_state WHERE id = {SCHEDULER_STATE_ID}"
+    )
+    # Same row, only if it was saved within the given number of milliseconds
+    _LOAD_RECENT_SQL: ClassVar[str] = (
+        _LOAD_SQL
+        + " AND updated_at > CURRENT_TIMESTAMP - to_milliseconds(CAST(? AS BIGINT))"
+    )
+
+    # Set once the table check has succeeded in this process
+    _verified: ClassVar[bool] = False
+    _verify_lock: ClassVar[threading.Lock] = threading.Lock()
+
     def __init__(self) -> None:
-        """Initialize repository and ensure table exists."""
+        """Initialize repository, ensure table exists and start the flusher."""
         super().__init__()
         self._ensure_table_exists()
 
+        # Write-behind buffer: latest unsaved state, guarded by _lock
+        self._lock = threading.Lock()
+        self._pending: Optional[SchedulerStateData] = None
+        self._pending_day_delta: int = 0
+        self._pending_hour_delta: int = 0
+        self._dirty = threading.Event()
+
+        # Held while a flush is writing, so concurrent flushers don't race
+        self._flush_guard = threading.Lock()
+
+        self._stop = threading.Event()
+        self._flusher = threading.Thread(
+            target=self._flush_loop, name="scheduler-state-flusher", daemon=True
+        )
+        self._flusher.start()
+
     def _ensure_table_exists(self) -> None:
         """
         Verify scheduler_state table exists.
@@ -180,20 +353,131 @@ class SchedulerStateRepository(BaseRepository):
         Do NOT create the table here - this was causing schema mismatches between
         scheduler_engine.py and schema.sql. All schema creation goes through
         functions/db/migrations.py and the canonical schema.sql file.
+
+        The probe runs once per process; later instances skip it after a
+        successful check. A failed check is retried by the next instance.
         """
-        try:
-            # Verify table exists by querying it
-            self.db.execute("SELECT id FROM scheduler_state LIMIT 1")
-            logger.debug("scheduler_state table verified")
-        except Exception as e:
-            logger.warning(
-                f"scheduler_state table not found. "
-                f"Ensure schema.sql has been applied via migrations. Error: {e}"
-            )
+        if SchedulerStateRepository._verified:
+            return
+
+        with SchedulerStateRepository._verify_lock:
+            if SchedulerStateRepository._verified:
+                return
+            try:
+                # Verify table exists by querying it
+                self.db.execute("SELECT id FROM scheduler_state LIMIT 1")
+                SchedulerStateRepository._verified = True
+                logger.debug("scheduler_state table verified")
+            except Exception as e:
+                logger.warning(
+                    f"scheduler_state table not found. "
+                    f"Ensure schema.sql has been applied via migrations. Error: {e}"
+                )
 
     def save_state(self, state: SchedulerStateData) -> int:
         """
-        Save scheduler state to database.
+        Queue scheduler state for persistence.
+
+        Stores the state as the pending write and wakes the flusher; the
+        database write happens asynchronously (see flush()). Only the latest
+        state queued before a flush is written.
+
+        Args:
+            state: SchedulerStateData to persist
+
+        Returns:
+            ID of the state record (always SCHEDULER_STATE_ID; singleton table)
+        """
+        with self._lock:
+            self._pending = state
+            # The state's counters already include any recorded API calls
+            self._pending_day_delta = 0
+            self._pending_hour_delta = 0
+            self._dirty.set()
+        return SCHEDULER_STATE_ID
+
+    def record_api_call(self, count: int = 1) -> None:
+        """
+        Add API calls to the persisted daily and hourly counters.
+
+        Only bumps in-memory deltas; the flusher applies them in one UPDATE.
+
+        Args:
+            count: Number of API calls made (default 1)
+        """
+        with self._lock:
+            self._pending_day_delta += count
+            self._pending_hour_delta += count
+            self._dirty.set()
+
+    def flush(self, blocking: bool = True) -> bool:
+        """
+        Write the pending state and API call deltas to the database, if any.
+
+        Args:
+            blocking: Wait for a flush already in progress on another thread.
+                      If False and one is running, return immediately.
+
+        Returns:
+            True if anything was written, False if nothing was pending, another
+            flusher was busy (non-blocking) or the write failed
+        """
+        if not self._flush_guard.acquire(blocking=blocking):
+            return False
+
+        try:
+            with self._lock:
+                state = self._pending
+                day_delta = self._pending_day_delta
+                hour_delta = self._pending_hour_delta
+                self._pending = None
+                self._pending_day_delta = 0
+                self._pending_hour_delta = 0
+                self._dirty.clear()
+
+            if state is None and not (day_delta or hour_delta):
+                return False
+
+            try:
+                if state is not None:
+                    self._write_state(state)
+                if day_delta or hour_delta:
+                    self._add_api_calls(day_delta, hour_delta)
+                return True
+            except RuntimeError:
+                # Re-queue unless a newer state arrived meanwhile (it supersedes both)
+                with self._lock:
+                    if self._pending is None:
+                        self._pending = state
+                        self._pending_day_delta += day_delta
+                        self._pending_hour_delta += hour_delta
+                        self._dirty.set()
+                return False
+        finally:
+            self._flush_guard.release()
+
+    @property
+    def closed(self) -> bool:
+        """True once close() has been called."""
+        return self._stop.is_set()
+
+    def close(self) -> None:
+        """Stop the flusher thread and commit any pending state."""
+        self._stop.set()
+        self._flusher.join(timeout=5)
+        self.flush()
+
+    def _flush_loop(self) -> None:
+        """Background flusher: commit the pending state whenever it is dirty."""
+        while not self._stop.is_set():
+            if self._dirty.wait(timeout=STATE_FLUSH_INTERVAL_SEC):
+                self.flush(blocking=False)
+                # Coalesce bursts of save_state() calls into one write
+                self._stop.wait(STATE_FLUSH_INTERVAL_SEC)
+
+    def _write_state(self, state: SchedulerStateData) -> int:
+        """
+        Write scheduler state to database.
 
         Uses RETURNING id to properly get the inserted row ID (not INSERT statement count).
         Column names must match functions/db/schema.sql scheduler_state table definition.
@@ -209,96 +493,141 @@ class SchedulerStateRepository(BaseRepository):
         """
         try:
             # Map SchedulerStateData fields to canonical schema.sql column names
-            # IMPORTANT: These column names MUST match functions/db/schema.sql
-            # Since scheduler_state is a singleton table (only one row with id=1),
-            # use INSERT OR REPLACE to handle both insert and update cases
-            sql = """
-                INSERT OR REPLACE INTO scheduler_state (
-                    id, current_state, api_calls_today, api_calls_this_hour,
-                    hour_window_start, next_collection_ts, consecutive_failures,
-                    backoff_until, updated_at
-                ) VALUES (1, ?, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)
-                RETURNING id
-            """
-
-            result = self.db.execute(
-                sql,
-                [
-                    state.current_state,
-                    state.api_calls_today,
-                    state.api_calls_this_hour,
-                    state.hour_window_start_utc if state.hour_window_start_utc else None,
-                    state.next_collection_utc if state.next_collection_utc else None,
-                    state.consecutive_failures,
-                    state.backoff_until_utc if state.backoff_until_utc else None,
-                ],
-            )
+            row = self.db.execute(self._SAVE_SQL, self._save_params(state)).fetchone()
+        except DB_ERRORS as e:
+            logger.error("Failed to save scheduler state: %s", e)
+            raise RuntimeError(f"Failed to save scheduler state: {e}") from e
 
-            row = result.fetchone()
-            persisted_id = row[0] if row else None
+        persisted_id = row[0] if row else None
+        if persisted_id is None:
+            raise RuntimeError("Failed to retrieve persisted scheduler state ID")
 
-            if persisted_id is None:
-                raise RuntimeError("Failed to retrieve persisted scheduler state ID")
+        logger.debug(
+            "Persisted scheduler state: id=%s, state=%s, api_calls_today=%s",
+            persisted_id, state.current_state, state.api_calls_today,
+        )
+        return persisted_id
+
+    @staticmethod
+    def _save_params(state: SchedulerStateData) -> Tuple[Any, ...]:
+        """Parameters for _SAVE_SQL, in column order (unset timestamps -> NULL)."""
+        return (
+            state.current_state,
+            state.api_calls_today,
+            state.api_calls_this_hour,
+            state.hour_window_start_ms or None,
+            state.next_collection_ms or None,
+            state.consecutive_failures,
+            state.backoff_until_ms or None,
+        )
 
-            logger.debug(
-                f"Persisted scheduler state: id={persisted_id}, "
-                f"state={state.current_state}, api_calls_today={state.api_calls_today}"
-            )
-            return persisted_id
+    def _add_api_calls(self, day_delta: int, hour_delta: int) -> None:
+        """
+        Increment the persisted API call counters in place.
 
-        except Exception as e:
-            logger.error(f"Failed to save scheduler state: {e}")
-            raise RuntimeError(f"Failed to save scheduler state: {e}") from e
+        Args:
+            day_delta: Calls to add to api_calls_today
+            hour_delta: Calls to add to api_calls_this_hour
 
-    def get_latest_state(self) -> Optional[SchedulerStateData]:
+        Raises:
+            RuntimeError: If database operation fails
+        """
+        try:
+            self.db.execute(self._ADD_API_CALLS_SQL, [day_delta, hour_delta])
+        except DB_ERRORS as e:
+            logger.error("Failed to update scheduler API call counters: %s", e)
+            raise RuntimeError(f"Failed to update scheduler API call counters: {e}") from e
+
+    def get_latest_state(
+        self, max_age_hours: Optional[float] = None
+    ) -> Optional[SchedulerStateData]:
         """
         Recover latest persisted scheduler state.
 
+        Reads the singleton row by primary key. Only the columns in schema.sql
+        are restored; day_window_start_ms and write_buffer_count are not
+        persisted and come back as 0. last_state_change_ms and
+        last_persisted_ms are the database-assigned save times. API calls
+        recorded but not yet flushed are included in the counters.
+
+        Args:
+            max_age_hours: If given, a row last saved longer ago than this is
+                          filtered out in SQL and treated as missing
+
         Returns:
-            SchedulerStateData if found, None otherwise
+            SchedulerStateData if found (and recent enough), None otherwise
 
         Raises:
             RuntimeError: If database query fails
         """
         try:
-            sql = """
-                SELECT
-                    current_state, api_calls_today, api_calls_this_hour,
-                    hour_window_start_utc, day_window_start_utc,
-                    next_collection_utc, consecutive_failures, backoff_until_utc,
-                    write_buffer_count, last_state_change_utc
-                FROM scheduler_state
-                ORDER BY persisted_at DESC
-                LIMIT 1
-            """
-
-            result = self.db.execute(sql).fetchone()
-            if not result:
-                logger.debug("No persisted scheduler state found")
-                return None
-
-            state = SchedulerStateData(
-                current_state=result[0],
-                api_calls_today=result[1],
-                api_calls_this_hour=result[2],
-                hour_window_start_utc=str(result[3]) if result[3] else "",
-                day_window_start_utc=str(result[4]) if result[4] else "",
-                next_collection_utc=str(result[5]) if result[5] else "",
-                consecutive_failures=result[6],
-                backoff_until_utc=str(result[7]) if result[7] else "",
-                write_buffer_count=result[8],
-                last_state_change_utc=str(result[9]) if result[9] else "",
-            )
+            if max_age_hours is None:
+                result = self.db.execute(self._LOAD_SQL).fetchone()
+            else:
+                result = self.db.execute(
+                    self._LOAD_RECENT_SQL, [int(max_age_hours * 3_600_000)]
+                ).fetchone()
+        except DB_ERRORS as e:
+            logger.error("Failed to recover scheduler state: %s", e)
+            raise RuntimeError(f"Failed to recover scheduler state: {e}") from e
 
-            logger.info(
-                f"Recovered scheduler state from database: "
-                f"state={state.current_state}, api_calls_today={state.api_calls_today}"
-            )
-            return state
+        if not result:
+            logger.debug("No persisted scheduler state found")
+            return None
+
+        (
+            current_state, api_calls_today, api_calls_this_hour,
+            hour_window_start_ms, next_collection_ms, consecutive_failures,
+            backoff_until_ms, last_state_change_ms, last_persisted_ms,
+        ) = result
+
+        with self._lock:
+            api_calls_today += self._pending_day_delta
+            api_calls_this_hour += self._pending_hour_delta
+        state = SchedulerStateData(
+            current_state=current_state,
+            api_calls_today=api_calls_today,
+            api_calls_this_hour=api_calls_this_hour,
+            hour_window_start_ms=hour_window_start_ms,
+            next_collection_ms=next_collection_ms,
+            consecutive_failures=consecutive_failures,
+            backoff_until_ms=backoff_until_ms,
+            last_state_change_ms=last_state_change_ms,
+            last_persisted_ms=last_persisted_ms,
+        )
 
-        except Exception as e:
-            logger.error(f"Failed to recover scheduler state: {e}")
-            raise RuntimeError(f"Failed to recover scheduler state: {e}") from e
+        logger.info(
+            "Recovered scheduler state from database: state=%s, api_calls_today=%s",
+            state.current_state, state.api_calls_today,
+        )
+        return state
+
+
+# Process-wide repository, shared so construction (table check, flusher
+# thread) happens once rather than per caller
+_state_repo: Optional[SchedulerStateRepository] = None
+_state_repo_lock = threading.Lock()
+
+
+def get_scheduler_state_repo() -> SchedulerStateRepository:
+    """
+    Get the shared SchedulerStateRepository, creating it on first use.
+
+    A repository that has been closed is replaced with a new one.
+
+    Returns:
+        The process-wide SchedulerStateRepository instance
+    """
+    global _state_repo
+
+    repo = _state_repo
+    if repo is not None and not repo.closed:
+        return repo
+
+    with _state_repo_lock:
+        if _state_repo is None or _state_repo.closed:
+            _state_repo = SchedulerStateRepository()
+        return _state_repo
 
 
 # ============================================================================
@@ -315,11 +644,12 @@ class SchedulerEngine:
     - Exponential backoff on rate limit errors
     - Adaptive delays based on budget consumption
     - Crash recovery via persisted state
-    - 10-second check intervals for responsive state transitions
+    - Event-driven checks: sleeps until the next deadline or wake()
 
     Attributes:
         config: AppConfig with scheduler settings
         scan_runner: Async callable that runs a complete scan
+        provider: Market data provider passed to every scan
         state_repo: Repository for persisting scheduler state
         current_state: Current state machine state
         api_calls_today: Count of API calls made today (UTC)
@@ -329,8 +659,8 @@ class SchedulerEngine:
         next_collection_utc: Scheduled time of next collection
         consecutive_failures: Count of consecutive rate-limit failures
         backoff_until_utc: Time when safe to resume after backoff
-        write_buffer: List of alerts awaiting flush to database
-        check_interval_sec: Seconds between state machine checks (default 10)
+        write_buffer: FIFO of (scan_id, alert_count, epoch_sec) awaiting flush to database
+        check_interval_sec: Seconds before retrying after a loop error (default 10)
     """
 
     def __init__(
@@ -350,33 +680,77 @@ class SchedulerEngine:
         """
         self.config = config
         self.scan_runner = scan_runner
-        self.state_repo = SchedulerStateRepository()
+        self.provider = provider
+        self.state_repo = get_scheduler_state_repo()
 
         # Initialize JSON exporter for writing data to JSON files
         self.json_exporter = JSONExporter()
-        self.last_export_utc: datetime = datetime.now(timezone.utc)
+        now_utc = datetime.now(timezone.utc)
+        # Interval deadlines use time.monotonic(); wall clock is only used for
+        # collection times, counter windows and persisted/logged timestamps
+        now_mono = time.monotonic()
+        self._last_export_monotonic: float = now_mono
         self.export_interval_seconds: int = 300  # 5 minutes
+        # Exports run on a single worker so they never block the state machine
+        self._export_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="json-export")
+        self._export_future: Optional[Future] = None
+        # Bumped whenever exportable data changes; exports are skipped when unchanged
+        self._data_generation: int = 0
+        self._last_exported_generation: int = -1
 
         # Extract configuration with defaults
         self.max_calls_per_hour = getattr(config, "max_calls_per_hour", DEFAULT_MAX_CALLS_PER_HOUR)
         self.max_calls_per_day = getattr(config, "max_calls_per_day", DEFAULT_MAX_CALLS_PER_DAY)
-        self.flush_threshold = getattr(config, "flush_threshold", DEFAULT_FLUSH_THRESHOLD)
+        # Multipliers turning call counts into budget % used
+        self._hour_budget_pct_per_call = 100.0 / self.max_calls_per_hour
+        self._day_budget_pct_per_call = 100.0 / self.max_calls_per_day
+        # Buffer flushes on whichever cap is hit first: item count or estimated bytes
+        self.flush_threshold_count = getattr(config, "flush_threshold", DEFAULT_FLUSH_THRESHOLD)
+        self.flush_threshold_bytes = getattr(
+            config, "flush_threshold_bytes", DEFAULT_FLUSH_THRESHOLD_BYTES
+        )
+        self.flush_max_age_sec = getattr(config, "flush_max_age_sec", DEFAULT_FLUSH_MAX_AGE_SEC)
         self.check_interval_sec = getattr(config, "check_interval_sec", DEFAULT_CHECK_INTERVAL_SEC)
         self.collection_times_et = getattr(
             config, "collection_times_et", DEFAULT_COLLECTION_TIMES_ET
         )
+        # Parsed and sorted once; _compute_next_collection only looks them up
+        self._collection_times_parsed: List[dt_time] = self._parse_collection_times(
+            self.collection_times_et
+        )
+        # (hour, minute) keys for bisecting the next slot
+        self._collection_slots: List[Tuple[int, int]] = [
+            (t.hour, t.minute) for t in self._collection_times_parsed
+        ]
+        # Midnight ET (as UTC) of the last collection date looked up; None on
+        # DST change days, where slots are not a fixed offset from midnight
+        self._cached_et_date: Optional[date] = None
+        self._cached_et_midnight_utc: Optional[datetime] = None
 
         # Initialize state variables
-        now_utc = datetime.now(timezone.utc)
         self.current_state: SchedulerState = SchedulerState.IDLE
         self.api_calls_today: int = 0
         self.api_calls_this_hour: int = 0
-        self.hour_window_start_utc: datetime = now_utc
-        self.day_window_start_utc: datetime = now_utc
-        self.next_collection_utc: datetime = self._compute_next_collection()
+        # Window starts as epoch seconds; the *_utc datetimes are derived on access
+        self._hour_window_start_ts: float = now_utc.timestamp()
+        self._day_window_start_ts: float = self._hour_window_start_ts
+        self.next_collection_utc: datetime = self._compute_next_collection(now_utc)
         self.consecutive_failures: int = 0
-        self.backoff_until_utc: datetime = datetime.now(timezone.utc) - timedelta(seconds=1)
-        self.write_buffer: List[Dict[str, Any]] = []
+        self.backoff_until_utc: datetime = now_utc - timedelta(seconds=1)
+        self._backoff_until_monotonic: float = now_mono - 1.0
+        # (scan_id, alert_count, epoch seconds) per scan with alerts, oldest first
+        self.write_buffer: deque[Tuple[Optional[int], int, float]] = deque()
+        # Monotonic time when the oldest buffered item was added (None if empty)
+        self._oldest_buffer_monotonic: Optional[float] = None
+        # Running estimate of the buffer's serialized size in bytes
+        self._buffer_bytes: int = 0
+
+        # Write coalescing: set when persisted fields change, cleared on persist
+        self._state_dirty: bool = True
+        self._last_persisted_monotonic: float = 0.0
+
+        # Set by wake() to end the current sleep early
+        self._wake_event = asyncio.Event()
 
         # Try to recover persisted state from database
         self._recover_state_from_db()
@@ -390,137 +764,203 @@ class SchedulerEngine:
             f"json_export_interval={self.export_interval_seconds}s"
         )
 
-    def _compute_next_collection(self) -> datetime:
+    @property
+    def hour_window_start_utc(self) -> datetime:
+        """Start time of the current hour window (UTC)."""
+        return datetime.fromtimestamp(self._hour_window_start_ts, tz=timezone.utc)
+
+    @property
+    def day_window_start_utc(self) -> datetime:
+        """Start time of the current day window (UTC)."""
+        return datetime.fromtimestamp(self._day_window_start_ts, tz=timezone.utc)
+
+    @staticmethod
+    def _parse_collection_times(collection_times_et: List[str]) -> List[dt_time]:
+        """
+        Parse "HH:MM" Eastern Time collection times into sorted time objects.
+
+        Non-string and malformed entries are logged and skipped. Falls back to
+        16:15 ET if nothing valid is configured.
+
+        Args:
+            collection_times_et: Configured collection times (format "HH:MM")
+
+        Returns:
+            Sorted list of collection times (ET)
+        """
+        parsed: List[dt_time] = []
+        for time_str in collection_times_et:
+            if not isinstance(time_str, str):
+                continue
+            try:
+                hours, minutes = map(int, time_str.split(":"))
+                parsed.append(dt_time(hours, minutes))
+            except ValueError as e:
+                logger.error(f"Ignoring invalid collection time {time_str!r}: {e}")
+
+        if not parsed:
+            logger.warning("No collection times configured, defaulting to 16:15 ET")
+            parsed = [FALLBACK_COLLECTION_TIME_ET]
+
+        return sorted(parsed)
+
+    def _compute_next_collection(self, now_utc: datetime) -> datetime:
         """
         Compute the safest and nearest scheduled collection time.
 
         Converts collection_times_et (Eastern Time) to UTC and finds the next
         occurrence. If all times have passed for today, schedules for tomorrow.
 
+        Args:
+            now_utc: Current time (UTC), captured once per scheduler check
+
         Returns:
             datetime in UTC of next collection time
         """
         try:
-            from datetime import time
-            import pytz
-
             # Get current time in ET
-            utc_now = datetime.now(timezone.utc)
-            et_tz = pytz.timezone("US/Eastern")
-            et_now = utc_now.astimezone(et_tz)
-
-            # Parse collection times (format "HH:MM")
-            collection_times_et_parsed: List[time] = []
-            for time_str in self.collection_times_et:
-                if isinstance(time_str, str):
-                    hours, minutes = map(int, time_str.split(":"))
-                    collection_times_et_parsed.append(time(hours, minutes))
-
-            if not collection_times_et_parsed:
-                logger.warning("No collection times configured, defaulting to 16:15 ET")
-                collection_times_et_parsed = [datetime.min.time().replace(hour=16, minute=15)]
-
-            # Find next collection time
-            today_et = et_now.date()
-            next_collection_et: Optional[datetime] = None
-
-            # Check if any times are still available today
-            for collection_time in sorted(collection_times_et_parsed):
-                candidate_et = datetime.combine(today_et, collection_time)
-                candidate_et = et_tz.localize(candidate_et)
-
-                if candidate_et > et_now:
-                    next_collection_et = candidate_et
-                    break
-
-            # If no times available today, use first time tomorrow
-            if next_collection_et is None:
-                tomorrow_et = today_et + timedelta(days=1)
-                next_collection_et = datetime.combine(
-                    tomorrow_et, sorted(collection_times_et_parsed)[0]
+            et_now = now_utc.astimezone(ET)
+
+            # First slot strictly after the current minute (slots are minute-aligned)
+            idx = bisect.bisect_right(self._collection_slots, (et_now.hour, et_now.minute))
+
+            if idx < len(self._collection_slots):
+                collection_date = et_now.date()
+                collection_time = self._collection_times_parsed[idx]
+            else:
+                # No times left today, use first time tomorrow
+                collection_date = et_now.date() + timedelta(days=1)
+                collection_time = self._collection_times_parsed[0]
+
+            midnight_utc = self._et_midnight_utc(collection_date)
+            if midnight_utc is not None:
+                next_collection_utc = midnight_utc + timedelta(
+                    hours=collection_time.hour, minutes=collection_time.minute
                 )
-                next_collection_et = et_tz.localize(next_collection_et)
-
-            # Convert back to UTC
-            next_collection_utc = next_collection_et.astimezone(timezone.utc)
+            else:
+                next_collection_et = ET.localize(datetime.combine(collection_date, collection_time))
+                next_collection_utc = next_collection_et.astimezone(timezone.utc)
 
             logger.info(
-                f"Computed next collection time: "
-                f"{next_collection_utc.isoformat()} UTC "
-                f"({next_collection_et.isoformat()} ET)"
+                "Computed next collection time: %s UTC (%s %s ET)",
+                next_collection_utc.isoformat(),
+                collection_date.isoformat(),
+                collection_time.strftime("%H:%M"),
             )
             return next_collection_utc
 
         except Exception as e:
             logger.error(f"Error computing next collection time: {e}")
             # Fallback: collection in 5 minutes
-            fallback = datetime.now(timezone.utc) + timedelta(minutes=5)
+            fallback = now_utc + timedelta(minutes=5)
             logger.info(f"Using fallback collection time: {fallback.isoformat()}")
             return fallback
 
-    def _reset_hourly_counter_if_expired(self) -> None:
+    def _et_midnight_utc(self, day: date) -> Optional[datetime]:
+        """
+        Return midnight ET of the given date as a UTC datetime, cached per date.
+
+        Localizing with pytz searches the DST transition table, so it is done
+        once per date rather than once per computed collection time.
+
+        Args:
+            day: Calendar date in ET
+
+        Returns:
+            Midnight ET in UTC, or None if the UTC offset changes during that
+            day (DST transition), in which case times must be localized
+        """
+        if day != self._cached_et_date:
+            midnight_et = ET.localize(datetime.combine(day, dt_time(0, 0)))
+            next_midnight_et = ET.localize(datetime.combine(day + timedelta(days=1), dt_time(0, 0)))
+            self._cached_et_date = day
+            self._cached_et_midnight_utc = (
+                midnight_et.astimezone(timezone.utc)
+                if midnight_et.utcoffset() == next_midnight_et.utcoffset()
+                else None
+            )
+        return self._cached_et_midnight_utc
+
+    def _reset_hourly_counter_if_expired(self, now_ts: float) -> None:
         """
         Reset hourly API call counter if hour window has expired.
 
         This method checks if the current hour window has expired (60+ minutes
         since hour_window_start_utc). If so, resets api_calls_this_hour to 0
         and updates hour_window_start_utc to now.
+
+        Args:
+            now_ts: Current time as epoch seconds
         """
-        now_utc = datetime.now(timezone.utc)
-        hours_elapsed = (now_utc - self.hour_window_start_utc).total_seconds() / 3600
+        elapsed_sec = now_ts - self._hour_window_start_ts
 
-        if hours_elapsed >= 1.0:
+        if elapsed_sec >= 3600.0:
             logger.info(
-                f"Resetting hourly counter: {self.api_calls_this_hour} calls in "
-                f"{hours_elapsed:.2f} hours"
+                "Resetting hourly counter: %d calls in %.2f hours",
+                self.api_calls_this_hour, elapsed_sec / 3600,
             )
             self.api_calls_this_hour = 0
-            self.hour_window_start_utc = now_utc
+            self._state_dirty = True
+            self._hour_window_start_ts = now_ts
 
-    def _reset_daily_counter_if_expired(self) -> None:
+    def _reset_daily_counter_if_expired(self, now_ts: float) -> None:
         """
         Reset daily API call counter if day window has expired.
 
         This method checks if the current day window has expired (24+ hours
         since day_window_start_utc). If so, resets api_calls_today to 0 and
         updates day_window_start_utc to now.
+
+        Args:
+            now_ts: Current time as epoch seconds
         """
-        now_utc = datetime.now(timezone.utc)
-        days_elapsed = (now_utc - self.day_window_start_utc).total_seconds() / 86400
+        elapsed_sec = now_ts - self._day_window_start_ts
 
-        if days_elapsed >= 1.0:
+        if elapsed_sec >= 86400.0:
             logger.info(
-                f"Resetting daily counter: {self.api_calls_today} calls in "
-                f"{days_elapsed:.2f} days"
+                "Resetting daily counter: %d calls in %.2f days",
+                self.api_calls_today, elapsed_sec / 86400,
             )
             self.api_calls_today = 0
-            self.day_window_start_utc = now_utc
+            self._state_dirty = True
+            self._day_window_start_ts = now_ts
+
+    def _checkpoint_counters(self, now_ts: float) -> None:
+        """
+        Reset any expired API call counter windows.
+
+        Called once per clock read in run_forever, so counter helpers such as
+        _has_rate_budget and _increment_api_calls never re-check the windows.
+
+        Args:
+            now_ts: Current time as epoch seconds
+        """
+        self._reset_hourly_counter_if_expired(now_ts)
+        self._reset_daily_counter_if_expired(now_ts)
 
     def _has_rate_budget(self) -> bool:
         """
         Check if API rate budget is available.
 
         Returns False if either hourly or daily limits have been exceeded.
+        Counter windows must already be current (see _checkpoint_counters).
 
         Returns:
             True if budget available, False if limits exceeded
         """
-        self._reset_hourly_counter_if_expired()
-        self._reset_daily_counter_if_expired()
-
         has_hourly = self.api_calls_this_hour < self.max_calls_per_hour
         has_daily = self.api_calls_today < self.max_calls_per_day
 
         if not has_hourly:
             logger.warning(
-                f"Hourly rate limit reached: {self.api_calls_this_hour} / "
-                f"{self.max_calls_per_hour}"
+                "Hourly rate limit reached: %d / %d",
+                self.api_calls_this_hour, self.max_calls_per_hour,
             )
 
         if not has_daily:
             logger.warning(
-                f"Daily rate limit reached: {self.api_calls_today} / "
-                f"{self.max_calls_per_day}"
+                "Daily rate limit reached: %d / %d",
+                self.api_calls_today, self.max_calls_per_day,
             )
 
         return has_hourly and has_daily
@@ -537,20 +977,13 @@ class SchedulerEngine:
         Returns:
             Delay in seconds (float between 1.0 and 3.0)
         """
-        hourly_pct = (self.api_calls_this_hour / self.max_calls_per_hour) * 100
-        daily_pct = (self.api_calls_today / self.max_calls_per_day) * 100
-        budget_pct = max(hourly_pct, daily_pct)
-
-        if budget_pct > 75:
-            delay = 3.0
-        elif budget_pct > 50:
-            delay = 2.5
-        elif budget_pct > 25:
-            delay = 2.0
-        else:
-            delay = 1.0
+        budget_pct = max(
+            self.api_calls_this_hour * self._hour_budget_pct_per_call,
+            self.api_calls_today * self._day_budget_pct_per_call,
+        )
+        delay = ADAPTIVE_DELAYS_SEC[bisect.bisect_left(ADAPTIVE_DELAY_THRESHOLDS_PCT, budget_pct)]
 
-        logger.debug(f"Adaptive delay: {delay:.2f}s (budget {budget_pct:.1f}% used)")
+        logger.debug("Adaptive delay: %.2fs (budget %.1f%% used)", delay, budget_pct)
         return delay
 
     def _exponential_backoff(self) -> timedelta:
@@ -574,8 +1007,8 @@ class SchedulerEngine:
             backoff_sec = BACKOFF_SECONDS[self.consecutive_failures]
 
         logger.warning(
-            f"Exponential backoff: {backoff_sec}s "
-            f"(consecutive_failures={self.consecutive_failures})"
+            "Exponential backoff: %ss (consecutive_failures=%d)",
+            backoff_sec, self.consecutive_failures,
         )
         return timedelta(seconds=backoff_sec)
 
@@ -583,37 +1016,125 @@ class SchedulerEngine:
         """
         Increment API call counters.
 
+        Counter windows must already be current (see _checkpoint_counters).
+
         Args:
             count: Number of API calls to increment (default 1)
         """
-        self._reset_hourly_counter_if_expired()
-        self._reset_daily_counter_if_expired()
-
         self.api_calls_this_hour += count
         self.api_calls_today += count
+        # Counter-only change: the repository applies it as a batched delta
+        # UPDATE, so the state is not marked dirty for a full save
+        self.state_repo.record_api_call(count)
 
         logger.debug(
-            f"Incremented API calls: +{count} "
-            f"(hour: {self.api_calls_this_hour}/{self.max_calls_per_hour}, "
-            f"day: {self.api_calls_today}/{self.max_calls_per_day})"
+            "Incremented API calls: +%d (hour: %d/%d, day: %d/%d)",
+            count,
+            self.api_calls_this_hour, self.max_calls_per_hour,
+            self.api_calls_today, self.max_calls_per_day,
         )
 
-    def _handle_rate_limit_error(self) -> None:
+    def _handle_rate_limit_error(self, now_utc: datetime) -> None:
         """
         Handle a rate limit error by transitioning to BACKING_OFF state.
 
         Increments consecutive_failures counter, computes exponential backoff,
-        and sets backoff_until_utc.
+        and sets backoff_until_utc (persisted) and its monotonic deadline.
+
+        Args:
+            now_utc: Current time (UTC); the backoff starts here
         """
         self.consecutive_failures += 1
         backoff_duration = self._exponential_backoff()
-        self.backoff_until_utc = datetime.now(timezone.utc) + backoff_duration
+        self.backoff_until_utc = now_utc + backoff_duration
+        self._backoff_until_monotonic = time.monotonic() + backoff_duration.total_seconds()
+        self._state_dirty = True
 
         logger.error(
-            f"Rate limit error encountered. Backing off until "
-            f"{self.backoff_until_utc.isoformat()} UTC"
+            "Rate limit error encountered. Backing off until %s UTC",
+            self.backoff_until_utc.isoformat(),
         )
 
+    def _write_buffer_expired(self, now_mono: float) -> bool:
+        """
+        Check if the write buffer holds an item older than flush_max_age_sec.
+
+        Bounds how long buffered items can wait for a size-triggered flush
+        when few alerts are generated.
+
+        Args:
+            now_mono: Current time.monotonic() reading
+
+        Returns:
+            True if the buffer is non-empty and its oldest item has expired
+        """
+        return (
+            self._oldest_buffer_monotonic is not None
+            and now_mono - self._oldest_buffer_monotonic >= self.flush_max_age_sec
+        )
+
+    def _seconds_until_next_event(self, now_ts: float, now_mono: float) -> float:
+        """
+        Compute how long until the loop has anything to do.
+
+        Transient states (IDLE, COLLECTING, FLUSHING) are always due.
+        Otherwise this is the time to the earliest of the next periodic
+        export, the next collection (WAITING), the write buffer age limit
+        (WAITING) or the end of backoff (BACKING_OFF).
+
+        Args:
+            now_ts: Current time as epoch seconds
+            now_mono: Current time.monotonic() reading
+
+        Returns:
+            Seconds until the next event (<= 0 if something is due now)
+        """
+        if self.current_state not in (SchedulerState.WAITING, SchedulerState.BACKING_OFF):
+            return 0.0
+
+        remaining = self._last_export_monotonic + self.export_interval_seconds - now_mono
+        if self.current_state == SchedulerState.WAITING:
+            # Collection times are wall-clock deadlines
+            remaining = min(remaining, self.next_collection_utc.timestamp() - now_ts)
+            if self._oldest_buffer_monotonic is not None:
+                remaining = min(
+                    remaining,
+                    self._oldest_buffer_monotonic + self.flush_max_age_sec - now_mono,
+                )
+        else:
+            remaining = min(remaining, self._backoff_until_monotonic - now_mono)
+
+        return remaining
+
+    async def _wait_for_next_check(self) -> None:
+        """
+        Sleep until the next event is due, or until wake() is called.
+
+        The sleep is bounded by MIN_CHECK_INTERVAL_SEC and
+        MAX_CHECK_INTERVAL_SEC; transient states only yield to the event loop.
+        """
+        if self.current_state not in (SchedulerState.WAITING, SchedulerState.BACKING_OFF):
+            await asyncio.sleep(0)
+            return
+
+        remaining = self._seconds_until_next_event(time.time(), time.monotonic())
+        sleep_for = min(max(remaining, MIN_CHECK_INTERVAL_SEC), MAX_CHECK_INTERVAL_SEC)
+        try:
+            await asyncio.wait_for(self._wake_event.wait(), timeout=sleep_for)
+        except asyncio.TimeoutError:
+            pass
+        self._wake_event.clear()
+
+    def wake(self) -> None:
+        """
+        Wake the scheduler loop so it re-checks state immediately.
+
+        Call after changing a deadline from outside the loop (e.g. a new
+        collection time or a rate-limit signal). Must be called from the
+        event loop thread.
+        """
+        self._wake_event.set()
+
     def _transition_state(self, new_state: SchedulerState) -> None:
         """
         Transition to a new state and log the change.
@@ -622,8 +1143,25 @@ class SchedulerEngine:
             new_state: New SchedulerState to transition to
         """
         if self.current_state != new_state:
-            logger.info(f"State transition: {self.current_state.value} → {new_state.value}")
+            logger.info("State transition: %s → %s", self.current_state.value, new_state.value)
             self.current_state = new_state
+            self._state_dirty = True
+
+    def _persist_state_if_needed(self) -> None:
+        """
+        Persist state if it changed since the last write, or as a heartbeat.
+
+        State transitions, counter resets and backoffs mark the state dirty.
+        API call increments are persisted separately as counter deltas
+        (see SchedulerStateRepository.record_api_call). An unchanged state is re-written only every
+        STATE_PERSIST_MAX_INTERVAL_SEC, so an idle WAITING or BACKING_OFF
+        loop writes about once a minute instead of on every check.
+        """
+        if (
+            self._state_dirty
+            or time.monotonic() - self._last_persisted_monotonic >= STATE_PERSIST_MAX_INTERVAL_SEC
+        ):
+            self._persist_state()
 
     def _persist_state(self) -> None:
         """
@@ -634,25 +1172,27 @@ class SchedulerEngine:
         unexpected shutdowns.
         """
         try:
+            # last_state_change is stamped by the database on write
             state_data = SchedulerStateData(
                 current_state=self.current_state.value,
                 api_calls_today=self.api_calls_today,
                 api_calls_this_hour=self.api_calls_this_hour,
-                hour_window_start_utc=self.hour_window_start_utc.isoformat(),
-                day_window_start_utc=self.day_window_start_utc.isoformat(),
-                next_collection_utc=self.next_collection_utc.isoformat(),
+                hour_window_start_ms=int(self._hour_window_start_ts * 1000),
+                day_window_start_ms=int(self._day_window_start_ts * 1000),
+                next_collection_ms=_to_epoch_ms(self.next_collection_utc),
                 consecutive_failures=self.consecutive_failures,
-                backoff_until_utc=self.backoff_until_utc.isoformat(),
+                backoff_until_ms=_to_epoch_ms(self.backoff_until_utc),
                 write_buffer_count=len(self.write_buffer),
-                last_state_change_utc=datetime.now(timezone.utc).isoformat(),
             )
 
             self.state_repo.save_state(state_data)
+            self._state_dirty = False
+            self._last_persisted_monotonic = time.monotonic()
 
         except Exception as e:
             logger.error(f"Failed to persist scheduler state: {e}")
 
-    def _export_data_periodically(self) -> None:
+    def _export_data_periodically(self, now_mono: float) -> None:
         """
         Export data to JSON files if export interval has passed.
 
@@ -665,55 +1205,97 @@ class SchedulerEngine:
 
         Note: Errors in export don't stop the scheduler - they're logged
         and the scheduler continues operation.
+
+        Args:
+            now_mono: Current time.monotonic() reading
         """
-        now_utc = datetime.now(timezone.utc)
-        time_since_last_export = (now_utc - self.last_export_utc).total_seconds()
+        time_since_last_export = now_mono - self._last_export_monotonic
 
         if time_since_last_export >= self.export_interval_seconds:
-            try:
+            if self._data_generation == self._last_exported_generation:
+                # Nothing new since the last export; check again next interval
+                self._last_export_monotonic = now_mono
+                return
+
+            # If an export is still running, leave the last export time so we retry soon
+            if self._submit_export("periodic"):
                 logger.info(
                     f"Periodic export triggered "
                     f"({time_since_last_export:.0f}s since last export)"
                 )
-                export_result = self.json_exporter.export_all()
+                self._last_export_monotonic = now_mono
+
+    def _submit_export(self, reason: str) -> bool:
+        """
+        Hand export_all() to the export worker unless an export is in flight.
 
-                if export_result.get("success"):
-                    logger.info("Data export completed successfully")
-                else:
-                    errors = export_result.get("errors", [])
-                    logger.warning(
-                        f"Data export completed with {len(errors)} errors: {errors}"
-                    )
+        Exports write several JSON files and can take hundreds of milliseconds,
+        so they run off the scheduler loop. Requests made while the previous
+        export is still running are dropped; that export already picks up
+        the data written so far. Requests are also dropped when no data has
+        changed since the last export (_data_generation unchanged).
 
-                self.last_export_utc = now_utc
+        Args:
+            reason: Label for log messages (e.g. "periodic", "post-flush")
 
-            except Exception as e:
-                logger.error(f"Periodic export failed: {e}")
-                # Don't update last_export_utc so we retry soon
-                # Continue scheduler operation regardless
+        Returns:
+            True if an export was submitted, False if it was skipped
+        """
+        if self._data_generation == self._last_exported_generation:
+            logger.debug("Skipping %s export, no new data since last export", reason)
+            return False
+
+        if self._export_future is not None and not self._export_future.done():
+            logger.debug("Skipping %s export, previous export still running", reason)
+            return False
+
+        self._export_future = self._export_executor.submit(self._run_export, reason)
+        self._last_exported_generation = self._data_generation
+        return True
+
+    def _run_export(self, reason: str) -> None:
+        """
+        Run export_all() on the export worker and log the outcome.
+
+        Errors in export don't stop the scheduler - they're logged and the
+        scheduler continues operation.
+
+        Args:
+            reason: Label for log messages
+        """
+        try:
+            export_result = self.json_exporter.export_all()
+        except Exception as e:
+            logger.error(f"{reason.capitalize()} export failed: {e}")
+            return
+
+        if export_result.get("success"):
+            logger.info(f"{reason.capitalize()} data export completed successfully")
+        else:
+            errors = export_result.get("errors", [])
+            logger.warning(
+                f"{reason.capitalize()} data export completed with {len(errors)} errors: {errors}"
+            )
 
     def _recover_state_from_db(self) -> None:
         """
         Load persisted scheduler state from database on startup.
 
         Attempts to recover the last persisted state. If found and still
-        valid (not too old), restores all state variables. This enables
-        crash recovery without losing tracking of API call counts.
+        valid (saved within STATE_MAX_AGE_HOURS), restores all state
+        variables. This enables crash recovery without losing tracking of
+        API call counts.
         """
         try:
-            persisted_state = self.state_repo.get_latest_state()
+            # Stale state is filtered out by the repository query
+            persisted_state = self.state_repo.get_latest_state(
+                max_age_hours=STATE_MAX_AGE_HOURS
+            )
 
             if persisted_state is None:
-                logger.info("No persisted scheduler state found, starting fresh")
-                return
-
-            # Check if persisted state is recent (within last 24 hours)
-            last_persist = datetime.fromisoformat(persisted_state.last_persisted_utc)
-            age_hours = (datetime.now(timezone.utc) - last_persist).total_seconds() / 3600
-
-            if age_hours > 24:
                 logger.info(
-                    f"Persisted state is {age_hours:.1f}h old, resetting to fresh state"
+                    f"No persisted scheduler state from the last {STATE_MAX_AGE_HOURS:.0f}h, "
+                    f"starting fresh"
                 )
                 return
 
@@ -722,24 +1304,19 @@ class SchedulerEngine:
             self.api_calls_today = persisted_state.api_calls_today
             self.api_calls_this_hour = persisted_state.api_calls_this_hour
             self.consecutive_failures = persisted_state.consecutive_failures
-            self.write_buffer_count = persisted_state.write_buffer_count
 
-            # Restore datetime fields
-            if persisted_state.hour_window_start_utc:
-                self.hour_window_start_utc = datetime.fromisoformat(
-                    persisted_state.hour_window_start_utc
-                )
-            if persisted_state.day_window_start_utc:
-                self.day_window_start_utc = datetime.fromisoformat(
-                    persisted_state.day_window_start_utc
-                )
-            if persisted_state.next_collection_utc:
-                self.next_collection_utc = datetime.fromisoformat(
-                    persisted_state.next_collection_utc
-                )
-            if persisted_state.backoff_until_utc:
-                self.backoff_until_utc = datetime.fromisoformat(
-                    persisted_state.backoff_until_utc
+            # Restore timestamps (window starts stay as epoch seconds)
+            if persisted_state.hour_window_start_ms:
+                self._hour_window_start_ts = persisted_state.hour_window_start_ms / 1000
+            if persisted_state.day_window_start_ms:
+                self._day_window_start_ts = persisted_state.day_window_start_ms / 1000
+            if persisted_state.next_collection_ms:
+                self.next_collection_utc = _from_epoch_ms(persisted_state.next_collection_ms)
+            if persisted_state.backoff_until_ms:
+                self.backoff_until_utc = _from_epoch_ms(persisted_state.backoff_until_ms)
+                # Carry the remaining backoff over to this process's monotonic clock
+                self._backoff_until_monotonic = time.monotonic() + (
+                    persisted_state.backoff_until_ms / 1000 - time.time()
                 )
 
             logger.info(
@@ -754,7 +1331,7 @@ class SchedulerEngine:
 
     async def run_forever(self) -> None:
         """
-        Main scheduler loop - runs forever with 10-second check intervals.
+        Main scheduler loop - runs forever, sleeping until the next deadline.
 
         Implements the state machine:
         - IDLE: Initialize and transition to WAITING
@@ -763,7 +1340,9 @@ class SchedulerEngine:
         - FLUSHING: Bulk write all buffered data to database
         - BACKING_OFF: Wait until backoff expires, then transition
 
-        State transitions and statistics are persisted to database after each check.
+        State is persisted to database after a check that changed it (and at
+        least once a minute as a heartbeat), not on every check. Checks where
+        nothing is due and nothing changed skip the state machine entirely.
         This method blocks indefinitely and should be run in an async context.
 
         Raises:
@@ -774,7 +1353,22 @@ class SchedulerEngine:
         try:
             while True:
                 try:
+                    # Single clock read per check, passed to every helper
                     now_utc = datetime.now(timezone.utc)
+                    now_ts = now_utc.timestamp()
+                    now_mono = time.monotonic()
+
+                    # No-op tick: nothing due and nothing changed, so only the
+                    # state heartbeat can have work to do
+                    if (
+                        not self._state_dirty
+                        and self._seconds_until_next_event(now_ts, now_mono) > NO_OP_TICK_MARGIN_SEC
+                    ):
+                        self._persist_state_if_needed()
+                        await self._wait_for_next_check()
+                        continue
+
+                    self._checkpoint_counters(now_ts)
 
                     # ============================================================
                     # State Machine
@@ -782,15 +1376,15 @@ class SchedulerEngine:
 
                     if self.current_state == SchedulerState.IDLE:
                         logger.debug("State: IDLE - initializing")
-                        self.next_collection_utc = self._compute_next_collection()
+                        self.next_collection_utc = self._compute_next_collection(now_utc)
                         self._transition_state(SchedulerState.WAITING)
-                        self._persist_state()
 
                     elif self.current_state == SchedulerState.WAITING:
-                        logger.debug(
-                            f"State: WAITING - next collection in "
-                            f"{(self.next_collection_utc - now_utc).total_seconds():.0f}s"
-                        )
+                        if logger.isEnabledFor(logging.DEBUG):
+                            logger.debug(
+                                "State: WAITING - next collection in %.0fs",
+                                (self.next_collection_utc - now_utc).total_seconds(),
+                            )
 
                         if now_utc >= self.next_collection_utc:
                             logger.info("Collection time reached, checking rate budget")
@@ -800,10 +1394,15 @@ class SchedulerEngine:
                                 self._transition_state(SchedulerState.COLLECTING)
                             else:
                                 logger.warning("Rate budget exhausted, entering backoff")
-                                self._handle_rate_limit_error()
+                                self._handle_rate_limit_error(now_utc)
                                 self._transition_state(SchedulerState.BACKING_OFF)
 
-                        self._persist_state()
+                        elif self._write_buffer_expired(now_mono):
+                            logger.info(
+                                "Oldest buffered item is over %ss old (%d items), flushing",
+                                self.flush_max_age_sec, len(self.write_buffer),
+                            )
+                            self._transition_state(SchedulerState.FLUSHING)
 
                     elif self.current_state == SchedulerState.COLLECTING:
                         logger.info("State: COLLECTING - running scan")
@@ -811,6 +1410,13 @@ class SchedulerEngine:
                         try:
                             # Run the scan
                             scan_result = await self.scan_runner(self.config, provider=self.provider)
+                            # The scan can take minutes; re-read the clock once after it
+                            now_utc = datetime.now(timezone.utc)
+                            now_ts = now_utc.timestamp()
+                            now_mono = time.monotonic()
+                            self._checkpoint_counters(now_ts)
+                            # The scan wrote new scan, chain and alert rows
+                            self._data_generation += 1
 
                             # Estimate API calls (tickers scanned)
                             tickers_scanned = getattr(scan_result, "ticker_count", 1)
@@ -820,112 +1426,118 @@ class SchedulerEngine:
                             alerts_generated = getattr(scan_result, "alert_count", 0)
                             if alerts_generated > 0:
                                 # In real implementation, would buffer alerts here
-                                logger.info(f"Buffered {alerts_generated} alerts")
-                                self.write_buffer.append({
-                                    "scan_id": getattr(scan_result, "scan_id", None),
-                                    "alerts": alerts_generated,
-                                    "timestamp_utc": now_utc.isoformat(),
-                                })
-
-                            # Check if buffer exceeds threshold
-                            if len(self.write_buffer) >= self.flush_threshold:
+                                logger.info("Buffered %d alerts", alerts_generated)
+                                if not self.write_buffer:
+                                    self._oldest_buffer_monotonic = now_mono
+                                item = (
+                                    getattr(scan_result, "scan_id", None),
+                                    alerts_generated,
+                                    now_ts,
+                                )
+                                self.write_buffer.append(item)
+                                self._buffer_bytes += len(json.dumps(item))
+
+                            # Flush when the buffer is full or its oldest item is too old
+                            if (
+                                len(self.write_buffer) >= self.flush_threshold_count
+                                or self._buffer_bytes >= self.flush_threshold_bytes
+                                or self._write_buffer_expired(now_mono)
+                            ):
                                 logger.info(
-                                    f"Write buffer threshold reached "
-                                    f"({len(self.write_buffer)} items), flushing"
+                                    "Write buffer flush triggered (%d items, ~%d bytes), flushing",
+                                    len(self.write_buffer), self._buffer_bytes,
                                 )
                                 self._transition_state(SchedulerState.FLUSHING)
                             else:
                                 logger.info("Collection complete, scheduling next collection")
-                                self.next_collection_utc = self._compute_next_collection()
+                                self.next_collection_utc = self._compute_next_collection(now_utc)
                                 self.consecutive_failures = 0
 
                                 # Export data to JSON after successful collection
-                                try:
-                                    logger.info("Exporting collected data to JSON...")
-                                    self.json_exporter.export_all()
-                                    self.last_export_utc = now_utc
-                                except Exception as export_e:
-                                    logger.error(f"Failed to export after collection: {export_e}")
+                                logger.info("Exporting collected data to JSON...")
+                                if self._submit_export("post-collection"):
+                                    self._last_export_monotonic = now_mono
 
                                 self._transition_state(SchedulerState.WAITING)
 
                         except Exception as e:
-                            logger.error(f"Error during collection: {e}")
-                            self._handle_rate_limit_error()
+                            logger.error("Error during collection: %s", e)
+                            now_utc = datetime.now(timezone.utc)
+                            self._handle_rate_limit_error(now_utc)
                             self._transition_state(SchedulerState.BACKING_OFF)
 
-                        self._persist_state()
-
                     elif self.current_state == SchedulerState.FLUSHING:
-                        logger.info(f"State: FLUSHING - writing {len(self.write_buffer)} items")
+                        logger.info("State: FLUSHING - writing %d items", len(self.write_buffer))
 
                         try:
                             # In real implementation, would flush to database
                             # For now, just log and clear buffer
                             logger.info(
-                                f"Flushed {len(self.write_buffer)} buffered items to database"
+                                "Flushed %d buffered items to database", len(self.write_buffer)
                             )
                             self.write_buffer.clear()
+                            self._oldest_buffer_monotonic = None
+                            self._buffer_bytes = 0
+                            self._data_generation += 1
 
                             # Export data to JSON after flush
-                            try:
-                                logger.info("Exporting flushed data to JSON...")
-                                self.json_exporter.export_all()
-                                self.last_export_utc = now_utc
-                            except Exception as export_e:
-                                logger.error(f"Failed to export after flush: {export_e}")
+                            logger.info("Exporting flushed data to JSON...")
+                            if self._submit_export("post-flush"):
+                                self._last_export_monotonic = now_mono
 
                             # Schedule next collection
-                            self.next_collection_utc = self._compute_next_collection()
+                            self.next_collection_utc = self._compute_next_collection(now_utc)
                             self.consecutive_failures = 0
                             self._transition_state(SchedulerState.WAITING)
 
                         except Exception as e:
-                            logger.error(f"Error during flush: {e}")
-                            self._handle_rate_limit_error()
+                            logger.error("Error during flush: %s", e)
+                            self._handle_rate_limit_error(now_utc)
                             self._transition_state(SchedulerState.BACKING_OFF)
 
-                        self._persist_state()
-
                     elif self.current_state == SchedulerState.BACKING_OFF:
-                        if now_utc >= self.backoff_until_utc:
+                        if now_mono >= self._backoff_until_monotonic:
                             logger.info(
-                                f"Backoff period expired, resuming "
-                                f"(waited {self.consecutive_failures} failures)"
+                                "Backoff period expired, resuming (waited %d failures)",
+                                self.consecutive_failures,
                             )
                             self._transition_state(SchedulerState.WAITING)
-                        else:
-                            remaining_sec = (self.backoff_until_utc - now_utc).total_seconds()
+                        elif logger.isEnabledFor(logging.DEBUG):
                             logger.debug(
-                                f"State: BACKING_OFF - "
-                                f"{remaining_sec:.0f}s remaining"
+                                "State: BACKING_OFF - %.0fs remaining",
+                                self._backoff_until_monotonic - now_mono,
                             )
 
-                        self._persist_state()
+                    self._persist_state_if_needed()
 
                     # ============================================================
                     # Periodic Data Export (every 5 minutes)
                     # ============================================================
 
-                    self._export_data_periodically()
+                    self._export_data_periodically(now_mono)
 
                     # ============================================================
-                    # Wait before next check
+                    # Sleep until the next deadline (or an external wake())
                     # ============================================================
 
-                    await asyncio.sleep(self.check_interval_sec)
+                    await self._wait_for_next_check()
 
                 except asyncio.CancelledError:
                     logger.info("SchedulerEngine cancelled, shutting down")
                     self._persist_state()
+                    self.state_repo.close()
+                    # Let an in-flight export finish writing its files
+                    self._export_executor.shutdown(wait=True)
+                    # Stop the detector worker processes started by scans
+                    shutdown_detector_pool()
                     break
 
                 except Exception as e:
-                    logger.error(f"Unexpected error in scheduler loop: {e}", exc_info=True)
+                    logger.error("Unexpected error in scheduler loop: %s", e, exc_info=True)
                     await asyncio.sleep(self.check_interval_sec)
 
         except Exception as e:
-            logger.error(f"Fatal error in run_forever: {e}", exc_info=True)
+            logger.error("Fatal error in run_forever: %s", e, exc_info=True)
             raise
 
 
@@ -987,4 +1599,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_event_loop(main())
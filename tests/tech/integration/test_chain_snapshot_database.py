@@ -12,6 +12,11 @@ This test validates:
 
 Running:
     pytest tests/tech/integration/test_chain_snapshot_database.py -v
+
+    Tests share one in-memory connection and recreate chain_snapshots before
+    use; each pytest-xdist worker gets its own connection, so the file can
+    also run in parallel:
+    pytest tests/tech/integration/test_chain_snapshot_database.py -n auto
 """
 
 import pytest
@@ -21,13 +26,42 @@ from pathlib import Path
 
 import duckdb
 
+try:
+    import orjson
+except ImportError:  # optional; stdlib json is used when unavailable
+    orjson = None
+
+
+def _dumps(data) -> str:
+    """Serialize chain data for a JSON column, with orjson when installed."""
+    if orjson is None:
+        return json.dumps(data)
+    return orjson.dumps(data).decode()
+
+
+def _loads(payload: str):
+    """Parse a JSON column value, with orjson when installed."""
+    if orjson is None:
+        return json.loads(payload)
+    return orjson.loads(payload)
+
+
+@pytest.fixture(scope="module")
+def conn():
+    """Share one in-memory DuckDB connection across the tests in this module."""
+    connection = duckdb.connect(":memory:")
+    # A handful of rows per statement; skip DuckDB's multi-threaded pipelines
+    connection.execute("PRAGMA threads=1")
+    yield connection
+    connection.close()
+
 
 class TestChainSnapshotDatabaseSchema:
     """Test chain_snapshots table schema and structure."""
 
-    def test_chain_snapshots_table_exists(self):
+    def test_chain_snapshots_table_exists(self, conn):
         """Test that chain_snapshots table can be created."""
-        conn = duckdb.connect(":memory:")
+        conn.execute("DROP TABLE IF EXISTS chain_snapshots")
 
         # Create table
         conn.execute("""
@@ -57,9 +91,9 @@ class TestChainSnapshotDatabaseSchema:
         ).fetchall()
         assert len(result) > 0
 
-    def test_chain_snapshots_required_columns(self):
+    def test_chain_snapshots_required_columns(self, conn):
         """Test that all required columns exist."""
-        conn = duckdb.connect(":memory:")
+        conn.execute("DROP TABLE IF EXISTS chain_snapshots")
 
         conn.execute("""
             CREATE TABLE chain_snapshots (
@@ -94,9 +128,9 @@ class TestChainSnapshotDatabaseSchema:
         for col in required:
             assert col in column_names, f"Missing column: {col}"
 
-    def test_unique_constraint_on_snapshot_key(self):
+    def test_unique_constraint_on_snapshot_key(self, conn):
         """Test unique constraint on (ticker, snapshot_date, expiration)."""
-        conn = duckdb.connect(":memory:")
+        conn.execute("DROP TABLE IF EXISTS chain_snapshots")
 
         conn.execute("""
             CREATE TABLE chain_snapshots (
@@ -130,9 +164,9 @@ class TestChainSnapshotDatabaseSchema:
 class TestChainSnapshotInsert:
     """Test inserting chain snapshots into database."""
 
-    def test_insert_chain_snapshot(self):
+    def test_insert_chain_snapshot(self, conn):
         """Test inserting a single chain snapshot."""
-        conn = duckdb.connect(":memory:")
+        conn.execute("DROP TABLE IF EXISTS chain_snapshots")
 
         conn.execute("""
             CREATE TABLE chain_snapshots (
@@ -159,7 +193,7 @@ class TestChainSnapshotInsert:
             (id, ticker, snapshot_date, expiration, dte, underlying_price, chain_json, created_at)
             VALUES (1, 'AAPL', '2026-01-27', '2026-02-20', 24, 192.5, ?, ?)
             """,
-            [json.dumps(snapshot), datetime.now(timezone.utc)],
+            [_dumps(snapshot), datetime.now(timezone.utc)],
         )
 
         # Verify insert
@@ -167,9 +201,9 @@ class TestChainSnapshotInsert:
         assert len(result) == 1
         assert result[0][1] == "AAPL"  # ticker
 
-    def test_insert_multiple_chain_snapshots(self):
+    def test_insert_multiple_chain_snapshots(self, conn):
         """Test inserting multiple chain snapshots."""
-        conn = duckdb.connect(":memory:")
+        conn.execute("DROP TABLE IF EXISTS chain_snapshots")
 
         conn.execute("""
             CREATE TABLE chain_snapshots (
@@ -182,30 +216,29 @@ class TestChainSnapshotInsert:
             )
         """)
 
-        # Insert multiple
+        # Insert multiple in one batched call
         snapshots = [
-            ("AAPL", "2026-01-27", "2026-02-20", 24),
-            ("MSFT", "2026-01-27", "2026-02-20", 24),
-            ("GOOGL", "2026-01-27", "2026-02-20", 24),
+            (1, "AAPL", "2026-01-27", "2026-02-20", 24),
+            (2, "MSFT", "2026-01-27", "2026-02-20", 24),
+            (3, "GOOGL", "2026-01-27", "2026-02-20", 24),
         ]
 
-        for i, (ticker, snap_date, exp_date, dte) in enumerate(snapshots, 1):
-            conn.execute(
-                """
-                INSERT INTO chain_snapshots
-                (id, ticker, snapshot_date, expiration, dte, chain_json)
-                VALUES (?, ?, ?, ?, ?, '{}')
-                """,
-                [i, ticker, snap_date, exp_date, dte],
-            )
+        conn.executemany(
+            """
+            INSERT INTO chain_snapshots
+            (id, ticker, snapshot_date, expiration, dte, chain_json)
+            VALUES (?, ?, ?, ?, ?, '{}')
+            """,
+            snapshots,
+        )
 
         # Verify all inserted
         result = conn.execute("SELECT COUNT(*) FROM chain_snapshots").fetchone()
         assert result[0] == 3
 
-    def test_insert_chain_with_all_fields(self):
+    def test_insert_chain_with_all_fields(self, conn):
         """Test inserting chain snapshot with all optional fields."""
-        conn = duckdb.connect(":memory:")
+        conn.execute("DROP TABLE IF EXISTS chain_snapshots")
 
         conn.execute("""
             CREATE TABLE chain_snapshots (
@@ -248,9 +281,9 @@ class TestChainSnapshotInsert:
 class TestChainSnapshotQuery:
     """Test querying chain snapshots from database."""
 
-    def test_query_snapshot_by_ticker(self):
+    def test_query_snapshot_by_ticker(self, conn):
         """Test querying snapshots by ticker."""
-        conn = duckdb.connect(":memory:")
+        conn.execute("DROP TABLE IF EXISTS chain_snapshots")
 
         conn.execute("""
             CREATE TABLE chain_snapshots (
@@ -261,11 +294,10 @@ class TestChainSnapshotQuery:
         """)
 
         # Insert test data
-        for ticker in ["AAPL", "MSFT", "GOOGL"]:
-            conn.execute(
-                "INSERT INTO chain_snapshots VALUES (?, '2026-01-27', '{}')",
-                [ticker],
-            )
+        conn.executemany(
+            "INSERT INTO chain_snapshots VALUES (?, '2026-01-27', '{}')",
+            [(ticker,) for ticker in ["AAPL", "MSFT", "GOOGL"]],
+        )
 
         # Query AAPL
         result = conn.execute(
@@ -274,9 +306,9 @@ class TestChainSnapshotQuery:
         assert len(result) == 1
         assert result[0][0] == "AAPL"
 
-    def test_query_snapshot_by_date(self):
+    def test_query_snapshot_by_date(self, conn):
         """Test querying snapshots by date."""
-        conn = duckdb.connect(":memory:")
+        conn.execute("DROP TABLE IF EXISTS chain_snapshots")
 
         conn.execute("""
             CREATE TABLE chain_snapshots (
@@ -293,11 +325,10 @@ class TestChainSnapshotQuery:
             "2026-01-27",
         ]
 
-        for i, d in enumerate(dates):
-            conn.execute(
-                "INSERT INTO chain_snapshots VALUES (?, ?, '{}')",
-                ["AAPL", d],
-            )
+        conn.executemany(
+            "INSERT INTO chain_snapshots VALUES (?, ?, '{}')",
+            [("AAPL", d) for d in dates],
+        )
 
         # Query specific date
         result = conn.execute(
@@ -305,9 +336,9 @@ class TestChainSnapshotQuery:
         ).fetchall()
         assert len(result) == 1
 
-    def test_query_snapshot_by_date_range(self):
+    def test_query_snapshot_by_date_range(self, conn):
         """Test querying snapshots within date range."""
-        conn = duckdb.connect(":memory:")
+        conn.execute("DROP TABLE IF EXISTS chain_snapshots")
 
         conn.execute("""
             CREATE TABLE chain_snapshots (
@@ -318,12 +349,10 @@ class TestChainSnapshotQuery:
         """)
 
         # Insert for range of dates
-        for i in range(10):
-            d = f"2026-01-{20+i:02d}"
-            conn.execute(
-                "INSERT INTO chain_snapshots VALUES (?, ?, '{}')",
-                ["AAPL", d],
-            )
+        conn.executemany(
+            "INSERT INTO chain_snapshots VALUES (?, ?, '{}')",
+            [("AAPL", f"2026-01-{20+i:02d}") for i in range(10)],
+        )
 
         # Query range
         result = conn.execute(
@@ -335,9 +364,9 @@ class TestChainSnapshotQuery:
 
         assert result[0] >= 1
 
-    def test_query_latest_snapshot_per_ticker(self):
+    def test_query_latest_snapshot_per_ticker(self, conn):
         """Test getting latest snapshot for each ticker."""
-        conn = duckdb.connect(":memory:")
+        conn.execute("DROP TABLE IF EXISTS chain_snapshots")
 
         conn.execute("""
             CREATE TABLE chain_snapshots (
@@ -357,30 +386,26 @@ class TestChainSnapshotQuery:
             (5, "MSFT", "2026-01-27"),
         ]
 
-        for id, ticker, date in data:
-            conn.execute(
-                "INSERT INTO chain_snapshots VALUES (?, ?, ?, '{}')",
-                [id, ticker, date],
-            )
+        conn.executemany("INSERT INTO chain_snapshots VALUES (?, ?, ?, '{}')", data)
 
         # Get latest for each ticker
         result = conn.execute(
             """
             SELECT ticker, MAX(snapshot_date) FROM chain_snapshots
             GROUP BY ticker
+            ORDER BY ticker
             """
         ).fetchall()
 
-        assert len(result) == 2
-        assert result[0][1] >= "2026-01-27"
+        assert result == [("AAPL", date(2026, 1, 27)), ("MSFT", date(2026, 1, 27))]
 
 
 class TestChainSnapshotJSONData:
     """Test JSON data in chain snapshots."""
 
-    def test_store_and_retrieve_chain_json(self):
+    def test_store_and_retrieve_chain_json(self, conn):
         """Test storing and retrieving chain JSON data."""
-        conn = duckdb.connect(":memory:")
+        conn.execute("DROP TABLE IF EXISTS chain_snapshots")
 
         conn.execute("""
             CREATE TABLE chain_snapshots (
@@ -407,7 +432,7 @@ class TestChainSnapshotJSONData:
         # Insert
         conn.execute(
             "INSERT INTO chain_snapshots VALUES (1, 'AAPL', ?)",
-            [json.dumps(chain_data)],
+            [_dumps(chain_data)],
         )
 
         # Retrieve
@@ -415,14 +440,14 @@ class TestChainSnapshotJSONData:
             "SELECT chain_json FROM chain_snapshots WHERE id = 1"
         ).fetchone()
 
-        retrieved = json.loads(result[0])
+        retrieved = _loads(result[0])
         assert retrieved["ticker"] == "AAPL"
         assert len(retrieved["chains"]) == 1
         assert len(retrieved["chains"][0]["calls"]) == 2
 
-    def test_json_access_in_query(self):
+    def test_json_access_in_query(self, conn):
         """Test accessing JSON fields in queries."""
-        conn = duckdb.connect(":memory:")
+        conn.execute("DROP TABLE IF EXISTS chain_snapshots")
 
         conn.execute("""
             CREATE TABLE chain_snapshots (
@@ -439,24 +464,24 @@ class TestChainSnapshotJSONData:
 
         conn.execute(
             "INSERT INTO chain_snapshots VALUES (1, ?)",
-            [json.dumps(chain_data)],
+            [_dumps(chain_data)],
         )
 
-        # Query JSON fields (DuckDB syntax)
+        # Extract the field in DuckDB rather than parsing the document in Python
         result = conn.execute(
-            "SELECT chain_json FROM chain_snapshots WHERE id = 1"
+            "SELECT json_extract(chain_json, '$.underlying_price')::DOUBLE "
+            "FROM chain_snapshots WHERE id = 1"
         ).fetchone()
 
-        data = json.loads(result[0])
-        assert data["underlying_price"] == 192.5
+        assert result[0] == 192.5
 
 
 class TestChainSnapshotIntegration:
     """Test full integration scenarios."""
 
-    def test_snapshot_workflow(self):
+    def test_snapshot_workflow(self, conn):
         """Test complete workflow: insert -> query -> verify."""
-        conn = duckdb.connect(":memory:")
+        conn.execute("DROP TABLE IF EXISTS chain_snapshots")
 
         # Create table
         conn.execute("""
@@ -479,7 +504,7 @@ class TestChainSnapshotIntegration:
             (id, ticker, snapshot_date, expiration, dte, chain_json)
             VALUES (1, 'AAPL', '2026-01-27', '2026-02-20', 24, ?)
             """,
-            [json.dumps(snapshot)],
+            [_dumps(snapshot)],
         )
 
         # Query
@@ -490,12 +515,12 @@ class TestChainSnapshotIntegration:
         # Verify
         assert result[1] == "AAPL"
         assert result[2] == "2026-01-27"
-        retrieved_json = json.loads(result[5])
+        retrieved_json = _loads(result[5])
         assert "calls" in retrieved_json
 
-    def test_deduplication_prevents_duplicate_inserts(self):
+    def test_deduplication_prevents_duplicate_inserts(self, conn):
         """Test that unique constraint prevents duplicates."""
-        conn = duckdb.connect(":memory:")
+        conn.execute("DROP TABLE IF EXISTS chain_snapshots")
 
         conn.execute("""
             CREATE TABLE chain_snapshots (
@@ -0,0 +1,212 @@
+"""Integration tests for scheduler state persistence.
+
+Tests verify that SchedulerStateRepository writes and reads the
+scheduler_state table exactly as defined in functions/db/schema.sql.
+
+This test validates:
+1. save_state -> flush -> get_latest_state round-trips all persisted fields
+2. Repeated saves keep a single row (id = 1), including over the seed row
+3. An empty table recovers as None
+4. Recovery reads the row by primary key
+5. Recorded API calls are applied as counter deltas
+6. Stale state is filtered out by max_age_hours
+7. The engine persists API call increments as deltas, not full saves
+
+Running:
+    pytest tests/tech/integration/test_scheduler_state_persistence.py -v
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+
+SCHEMA_PATH = Path(__file__).resolve().parents[3] / "functions" / "db" / "schema.sql"
+
+
+@pytest.fixture
+def db(make_db):
+    """Create a DuckDB database with the canonical scheduler_state table."""
+    # Use the table and index definitions from schema.sql so the test tracks the schema
+    statements = re.findall(
+        r"CREATE (?:TABLE IF NOT EXISTS scheduler_state|(?:UNIQUE )?INDEX IF NOT EXISTS \w+ ON scheduler_state)\b.*?;",
+        SCHEMA_PATH.read_text(),
+        re.DOTALL,
+    )
+    return make_db("\n".join(statements))
+
+
+@pytest.fixture
+def repo(db):
+    """Create a SchedulerStateRepository and stop its flusher afterwards."""
+    from scripts.scheduler_engine import SchedulerStateRepository
+
+    repository = SchedulerStateRepository()
+    yield repository
+    repository.close()
+
+
+class TestSchedulerStateRoundTrip:
+    """Test save_state/get_latest_state against schema.sql."""
+
+    def test_round_trip(self, repo):
+        """Test that persisted fields are recovered unchanged."""
+        from scripts.scheduler_engine import SchedulerStateData
+
+        state = SchedulerStateData(
+            current_state="BACKING_OFF",
+            api_calls_today=120,
+            api_calls_this_hour=15,
+            hour_window_start_ms=1_767_000_000_000,
+            next_collection_ms=1_767_003_600_000,
+            consecutive_failures=2,
+            backoff_until_ms=1_767_000_240_000,
+        )
+
+        assert repo.save_state(state) == 1
+        repo.flush()
+
+        recovered = repo.get_latest_state()
+
+        assert recovered.current_state == "BACKING_OFF"
+        assert recovered.api_calls_today == 120
+        assert recovered.api_calls_this_hour == 15
+        assert recovered.hour_window_start_ms == 1_767_000_000_000
+        assert recovered.next_collection_ms == 1_767_003_600_000
+        assert recovered.consecutive_failures == 2
+        assert recovered.backoff_until_ms == 1_767_000_240_000
+        assert recovered.last_state_change_ms > 0
+        assert recovered.last_persisted_ms > 0
+
+    def test_repeated_saves_keep_singleton_row(self, repo, db):
+        """Test that each save replaces the row with id = 1."""
+        from scripts.scheduler_engine import SchedulerStateData
+
+        for calls in (1, 2, 3):
+            repo.save_state(SchedulerStateData(current_state="WAITING", api_calls_today=calls))
+            repo.flush()
+
+        rows = db.execute("SELECT id, api_calls_today FROM scheduler_state").fetchall()
+        assert rows == [(1, 3)]
+
+    def test_saves_replace_schema_seed_row(self, repo, db):
+        """Test that saves over the row seeded by schema.sql keep one row."""
+        from scripts.scheduler_engine import SchedulerStateData
+
+        db.execute("INSERT INTO scheduler_state (id, current_state) VALUES (1, 'IDLE')")
+
+        for state in ("WAITING", "COLLECTING", "FLUSHING", "WAITING"):
+            repo.save_state(SchedulerStateData(current_state=state))
+            repo.flush()
+
+        rows = db.execute("SELECT id, current_state FROM scheduler_state").fetchall()
+        assert rows == [(1, "WAITING")]
+
+    def test_unset_timestamps_load_as_zero(self, repo, db):
+        """Test that NULL columns come back as 0 rather than None."""
+        db.execute("INSERT INTO scheduler_state (id, current_state) VALUES (1, 'IDLE')")
+
+        recovered = repo.get_latest_state()
+
+        assert recovered.hour_window_start_ms == 0
+        assert recovered.next_collection_ms == 0
+        assert recovered.backoff_until_ms == 0
+
+    def test_load_is_primary_key_lookup(self, repo, db):
+        """Test that recovery filters on id rather than sorting the table."""
+        assert "WHERE id = 1" in repo._LOAD_SQL
+        assert "ORDER BY" not in repo._LOAD_SQL
+
+        plan = db.execute(f"EXPLAIN {repo._LOAD_SQL}").fetchall()
+        assert "ORDER" not in plan[0][1]
+
+    def test_save_times_advance_on_each_save(self, repo):
+        """Test that the database re-stamps save times when the row is replaced."""
+        import time
+
+        from scripts.scheduler_engine import SchedulerStateData
+
+        repo.save_state(SchedulerStateData())
+        repo.flush()
+        first = repo.get_latest_state()
+        time.sleep(0.01)
+
+        repo.save_state(SchedulerStateData(current_state="WAITING"))
+        repo.flush()
+        second = repo.get_latest_state()
+
+        assert second.last_state_change_ms > first.last_state_change_ms
+        assert second.last_persisted_ms > first.last_persisted_ms
+
+    def test_recorded_api_calls_increment_counters(self, repo, db):
+        """Test that API call deltas are added to the persisted counters."""
+        from scripts.scheduler_engine import SchedulerStateData
+
+        repo.save_state(SchedulerStateData(api_calls_today=10, api_calls_this_hour=4))
+        repo.flush()
+
+        repo.record_api_call()
+        repo.record_api_call(5)
+        assert repo.get_latest_state().api_calls_today == 16
+
+        repo.flush()
+
+        assert db.execute(
+            "SELECT api_calls_today, api_calls_this_hour FROM scheduler_state"
+        ).fetchone() == (16, 10)
+
+    def test_save_state_supersedes_recorded_api_calls(self, repo, db):
+        """Test that a full state save replaces unflushed deltas."""
+        from scripts.scheduler_engine import SchedulerStateData
+
+        with repo._flush_guard:  # hold off the background flusher
+            repo.record_api_call(3)
+            repo.save_state(SchedulerStateData(api_calls_today=3, api_calls_this_hour=3))
+        repo.flush()
+
+        assert db.execute(
+            "SELECT api_calls_today, api_calls_this_hour FROM scheduler_state"
+        ).fetchone() == (3, 3)
+
+    def test_engine_records_api_calls_as_deltas(self, repo, db, monkeypatch):
+        """Test that engine API call increments skip the full state save."""
+        from types import SimpleNamespace
+
+        from scripts import scheduler_engine
+
+        monkeypatch.setattr(scheduler_engine, "get_scheduler_state_repo", lambda: repo)
+        monkeypatch.setattr(scheduler_engine, "JSONExporter", lambda: None)
+        engine = scheduler_engine.SchedulerEngine(SimpleNamespace(), scan_runner=None, provider=None)
+        engine._export_executor.shutdown()
+        engine._persist_state()
+        repo.flush()
+
+        engine._increment_api_calls(5)
+        engine._persist_state_if_needed()
+
+        assert repo._pending is None
+        assert repo._pending_day_delta == 5
+        repo.flush()
+        assert db.execute(
+            "SELECT api_calls_today, api_calls_this_hour FROM scheduler_state"
+        ).fetchone() == (5, 5)
+
+    def test_max_age_filters_stale_state(self, repo, db):
+        """Test that max_age_hours hides a row saved too long ago."""
+        from scripts.scheduler_engine import SchedulerStateData
+
+        repo.save_state(SchedulerStateData(current_state="WAITING"))
+        repo.flush()
+
+        assert repo.get_latest_state(max_age_hours=24).current_state == "WAITING"
+
+        db.execute(
+            "UPDATE scheduler_state SET updated_at = CURRENT_TIMESTAMP - INTERVAL 25 HOUR"
+        )
+
+        assert repo.get_latest_state(max_age_hours=24) is None
+        assert repo.get_latest_state().current_state == "WAITING"
+
+    def test_empty_table_returns_none(self, repo):
+        """Test that recovery without a persisted row returns None."""
+        assert repo.get_latest_state() is None
@@ -0,0 +1,82 @@
+"""
+Unit tests for AlertRepository batch writes.
+
+Tests save_alerts_batch with focus on:
+- AlertRow and dict inputs
+- Single-transaction semantics (all rows or none)
+"""
+
+import json
+
+import pytest
+
+
+@pytest.fixture
+def db(make_db):
+    """Create a DuckDB database with the alerts table."""
+    return make_db("""
+        CREATE SEQUENCE IF NOT EXISTS alerts_id_seq START 1;
+        CREATE TABLE IF NOT EXISTS alerts (
+            id INTEGER PRIMARY KEY DEFAULT nextval('alerts_id_seq'),
+            scan_id INTEGER NOT NULL,
+            ticker VARCHAR(20) NOT NULL,
+            detector_name VARCHAR(100) NOT NULL,
+            score DECIMAL(8, 4) NOT NULL,
+            alert_json JSON NOT NULL,
+            created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+        );
+    """)
+
+
+class TestSaveAlertsBatch:
+    """Tests for AlertRepository.save_alerts_batch."""
+
+    def test_writes_alert_rows_and_dicts(self, db):
+        """Test that AlertRow and dict alerts are written in one call."""
+        from functions.db.repositories import AlertRepository, AlertRow
+
+        count = AlertRepository().save_alerts_batch(scan_id=7, alerts=[
+            AlertRow(
+                ticker="AAPL",
+                detector_name="low_iv",
+                score=81.5,
+                metrics={"iv_percentile": 12},
+                explanation={"summary": "IV near lows"},
+                strategies=["Long Straddle"],
+                confidence="high",
+            ),
+            {"ticker": "MSFT", "detector_name": "rich_premium", "score": 70.0,
+             "alert_data": {"metrics": {}}},
+        ])
+
+        rows = db.execute(
+            "SELECT scan_id, ticker, score, alert_json FROM alerts ORDER BY id"
+        ).fetchall()
+        assert count == 2
+        assert [(r[0], r[1], float(r[2])) for r in rows] == [(7, "AAPL", 81.5), (7, "MSFT", 70.0)]
+        assert json.loads(rows[0][3]) == {
+            "metrics": {"iv_percentile": 12},
+            "explanation": {"summary": "IV near lows"},
+            "strategies": ["Long Straddle"],
+            "confidence": "high",
+        }
+
+    def test_failed_row_rolls_back_batch(self, db):
+        """Test that one invalid row leaves no partial batch behind."""
+        from functions.db.repositories import AlertRepository
+
+        alerts = [
+            {"ticker": "AAPL", "detector_name": "low_iv", "score": 80.0, "alert_data": {}},
+            {"ticker": None, "detector_name": "low_iv", "score": 80.0, "alert_data": {}},
+        ]
+
+        with pytest.raises(RuntimeError):
+            AlertRepository().save_alerts_batch(scan_id=7, alerts=alerts)
+
+        assert db.execute("SELECT COUNT(*) FROM alerts").fetchone()[0] == 0
+
+    def test_empty_batch_is_noop(self, db):
+        """Test that an empty batch returns 0 without touching the database."""
+        from functions.db.repositories import AlertRepository
+
+        assert AlertRepository().save_alerts_batch(scan_id=7, alerts=[]) == 0
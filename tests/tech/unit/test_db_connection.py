@@ -4,7 +4,7 @@ Unit tests for DuckDB connection manager.
 Tests the DuckDBManager class with focus on:
 - Thread-local connection caching
 - Connection lifecycle management
-- Query execution (execute, execute_one, execute_insert)
+- Query execution (execute, execute_one, execute_insert, execute_many)
 - Context manager functionality
 - Schema initialization
 - Error handling
@@ -88,6 +88,18 @@ class TestDuckDBManager:
         conn2 = manager.get_connection()
         assert conn is conn2
 
+    def test_connection_applies_config(self, temp_db):
+        """Test that connections use the shared DuckDB settings."""
+        from functions.db.connection import DuckDBManager
+
+        manager = DuckDBManager(
+            db_path=temp_db["db_path"],
+            schema_path=temp_db["schema_path"],
+        )
+
+        result = manager.execute_one("SELECT current_setting('checkpoint_threshold')")
+        assert result[0] == "64.0MB"
+
     def test_thread_local_connections(self, temp_db):
         """Test that different threads get different connections."""
         from functions.db.connection import DuckDBManager
@@ -275,6 +287,44 @@ class TestDuckDBManager:
         count = result.fetchone()[0]
         assert count >= 5
 
+    def test_execute_many(self, temp_db):
+        """Test batch INSERT with execute_many."""
+        from functions.db.connection import DuckDBManager
+
+        manager = DuckDBManager(
+            db_path=temp_db["db_path"],
+            schema_path=temp_db["schema_path"],
+        )
+        manager.initialize(ignore_exists=True)
+
+        count = manager.execute_many(
+            "INSERT INTO test_table (id, name, value) VALUES (?, ?, ?)",
+            [[i, f"batch_{i}", float(i)] for i in range(10, 15)],
+        )
+
+        assert count == 5
+        result = manager.execute("SELECT COUNT(*) FROM test_table WHERE id >= 10")
+        assert result.fetchone()[0] == 5
+
+    def test_execute_many_rolls_back_on_error(self, temp_db):
+        """Test that a failing batch leaves no partial rows behind."""
+        from functions.db.connection import DuckDBManager
+
+        manager = DuckDBManager(
+            db_path=temp_db["db_path"],
+            schema_path=temp_db["schema_path"],
+        )
+        manager.initialize(ignore_exists=True)
+
+        with pytest.raises(RuntimeError):
+            manager.execute_many(
+                "INSERT INTO test_table (id, name, value) VALUES (?, ?, ?)",
+                [[20, "ok", 1.0], [20, "duplicate", 2.0]],
+            )
+
+        result = manager.execute("SELECT COUNT(*) FROM test_table WHERE id = 20")
+        assert result.fetchone()[0] == 0
+
     def test_close_connection(self, temp_db):
         """Test closing connection."""
         from functions.db.connection import DuckDBManager
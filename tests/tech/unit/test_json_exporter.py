@@ -0,0 +1,52 @@
+"""
+Unit tests for JSONExporter file writes.
+
+Tests _atomic_write_json and _create_archive_copy with focus on:
+- Output matching stdlib json.dump(indent=2, default=str)
+- The archive copy reusing the serialized bytes
+"""
+
+import json
+from datetime import datetime, timezone
+from decimal import Decimal
+
+import pytest
+
+
+@pytest.fixture
+def exporter(tmp_path, make_db):
+    """Create a JSONExporter writing to tmp_path (repositories are not queried)."""
+    make_db()
+
+    from functions.export.json_exporter import JSONExporter
+
+    return JSONExporter(export_base_dir=str(tmp_path / "exports"))
+
+
+class TestAtomicWriteJson:
+    """Tests for JSONExporter._atomic_write_json."""
+
+    def test_writes_indented_json(self, exporter):
+        """Test that the file matches json.dump(indent=2, default=str)."""
+        data = {
+            "alerts": [{"score": Decimal("81.5"), "created_at": datetime(2026, 1, 2, tzinfo=timezone.utc)}],
+            "total_count": 1,
+        }
+        path = exporter.export_dir / "alerts.json"
+
+        exporter._atomic_write_json(path, data, "2026-01-02T00:00:00+00:00")
+
+        assert json.loads(path.read_text()) == json.loads(json.dumps(data, default=str))
+        assert json.loads(path.read_text())["export_timestamp"] == "2026-01-02T00:00:00+00:00"
+        assert list(exporter.export_dir.glob("*.json")) == [path]
+
+    def test_archive_reuses_serialized_bytes(self, exporter):
+        """Test that the archive copy is byte-identical to the latest export."""
+        path = exporter.export_dir / "scans.json"
+
+        payload = exporter._atomic_write_json(path, {"scans": [], "total_count": 0})
+        exporter._create_archive_copy("scans.json", payload)
+
+        archives = list(exporter.archive_dir.glob("scans_*.json"))
+        assert len(archives) == 1
+        assert archives[0].read_bytes() == path.read_bytes() == payload
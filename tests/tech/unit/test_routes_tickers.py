@@ -0,0 +1,296 @@
+"""
+Unit tests for the per-ticker knowledge base routes.
+
+Tests the helpers behind /tickers/* with focus on:
+- Ticker inventory scanning for /tickers/list
+- Inventory cache reuse and invalidation
+- Conditional GET (ETag / If-None-Match) on thesis endpoints
+- File-descriptor cache reuse and invalidation
+- In-memory knowledge base preload and change handling
+- Unreadable files and watcher failures
+- Combined /tickers/{ticker}/kb endpoint
+- Inlined knowledge base files via /tickers/list?expand=
+"""
+
+import pytest
+
+
+@pytest.fixture
+def tickers_dir(tmp_path):
+    """Create a small tickers/ knowledge base for testing."""
+    base = tmp_path / "tickers"
+    (base / "AAPL").mkdir(parents=True)
+    (base / "AAPL" / "theses.md").write_text("# AAPL thesis\n")
+    (base / "AAPL" / "risks.md").write_text("# AAPL risks\n")
+    (base / "SOFI").mkdir()
+    (base / "SOFI" / "notes.md").write_text("# SOFI notes\n")
+    (base / "README.md").write_text("not a ticker\n")
+    return base
+
+
+@pytest.fixture(autouse=True)
+def reset_inventory_cache():
+    """Clear the module-level inventory cache between tests."""
+    from scripts.api import routes_tickers
+
+    routes_tickers._ticker_list_cache.update({"mtime_ns": None, "expires_at": 0.0, "tickers": []})
+    yield
+    routes_tickers.close_fd_cache()
+    routes_tickers._kb.clear()
+    routes_tickers._kb_loaded = False
+
+
+class TestTickerInventory:
+    """Tests for the /tickers/list inventory helpers."""
+
+    def test_scan_lists_directories_with_file_flags(self, tickers_dir):
+        """Test that only ticker directories are listed, with per-file flags."""
+        from scripts.api.routes_tickers import _scan_ticker_inventory
+
+        tickers = _scan_ticker_inventory(str(tickers_dir))
+
+        assert tickers == [
+            {"ticker": "AAPL", "has_thesis": True, "has_risks": True, "has_notes": False},
+            {"ticker": "SOFI", "has_thesis": False, "has_risks": False, "has_notes": True},
+        ]
+
+    def test_inventory_is_cached(self, tickers_dir):
+        """Test that repeated calls reuse the cached inventory list."""
+        from scripts.api.routes_tickers import _get_ticker_inventory
+
+        first = _get_ticker_inventory(str(tickers_dir))
+        second = _get_ticker_inventory(str(tickers_dir))
+
+        assert first is second
+
+    def test_inventory_refreshes_when_directory_changes(self, tickers_dir):
+        """Test that adding a ticker directory invalidates the cache."""
+        from scripts.api.routes_tickers import _get_ticker_inventory
+
+        first = _get_ticker_inventory(str(tickers_dir))
+        (tickers_dir / "TSLA").mkdir()
+        second = _get_ticker_inventory(str(tickers_dir))
+
+        assert [t["ticker"] for t in first] == ["AAPL", "SOFI"]
+        assert [t["ticker"] for t in second] == ["AAPL", "SOFI", "TSLA"]
+
+
+class TestLoadThesisFile:
+    """Tests for load_thesis_file ticker sanitization and lookup."""
+
+    @pytest.fixture(autouse=True)
+    def use_tickers_dir(self, tickers_dir, monkeypatch):
+        """Point the loader at the temporary knowledge base."""
+        from scripts.api import routes_tickers
+
+        monkeypatch.setattr(routes_tickers, "get_tickers_dir_str", lambda: str(tickers_dir))
+
+    def test_loads_file_case_insensitively(self):
+        """Test that lowercase tickers resolve to the uppercase directory."""
+        from scripts.api.routes_tickers import load_thesis_file
+
+        assert load_thesis_file("aapl", "thesis") == "# AAPL thesis\n"
+
+    def test_strips_path_traversal(self):
+        """Test that separators and '..' cannot escape the tickers directory."""
+        from scripts.api.routes_tickers import load_thesis_file
+
+        assert load_thesis_file("../AAPL", "thesis") == "# AAPL thesis\n"
+        assert load_thesis_file("..", "thesis") is None
+        assert load_thesis_file("..\\..", "notes") is None
+
+    def test_reuses_cached_descriptor(self):
+        """Test that repeated reads of an unchanged file reuse one descriptor."""
+        from scripts.api import routes_tickers
+
+        routes_tickers.load_thesis_file("AAPL", "thesis")
+        routes_tickers.load_thesis_file("AAPL", "thesis")
+
+        assert len(routes_tickers._fd_cache) == 1
+
+    def test_reopens_replaced_file(self, tickers_dir):
+        """Test that a file replaced on disk is re-read, not served stale."""
+        from scripts.api.routes_tickers import load_thesis_file
+
+        assert load_thesis_file("AAPL", "risks") == "# AAPL risks\n"
+        replacement = tickers_dir / "AAPL" / "risks.tmp"
+        replacement.write_text("# AAPL risks, revised\n")
+        replacement.replace(tickers_dir / "AAPL" / "risks.md")
+
+        assert load_thesis_file("AAPL", "risks") == "# AAPL risks, revised\n"
+
+    def test_rejects_invalid_file_type_and_long_ticker(self):
+        """Test that unknown file types and over-long tickers return None."""
+        from scripts.api.routes_tickers import load_thesis_file
+
+        assert load_thesis_file("AAPL", "secrets") is None
+        assert load_thesis_file("A" * 11, "thesis") is None
+
+
+class TestThesisConditionalGet:
+    """Tests for ETag/If-None-Match handling on thesis endpoints."""
+
+    @pytest.fixture
+    def client(self, tickers_dir, monkeypatch):
+        """Build a TestClient around the ticker router."""
+        from fastapi import FastAPI
+        from fastapi.testclient import TestClient
+        from scripts.api import routes_tickers
+
+        monkeypatch.setattr(routes_tickers, "get_tickers_dir_str", lambda: str(tickers_dir))
+        app = FastAPI()
+        app.include_router(routes_tickers.router)
+        return TestClient(app)
+
+    def test_response_includes_etag(self, client):
+        """Test that a full response carries an ETag and last_updated."""
+        response = client.get("/tickers/AAPL/thesis")
+
+        assert response.status_code == 200
+        assert response.headers["etag"].startswith('W/"')
+        assert response.json()["content"] == "# AAPL thesis\n"
+        assert response.json()["last_updated"].endswith("Z")
+
+    def test_matching_etag_returns_304(self, client):
+        """Test that If-None-Match with the current ETag returns 304."""
+        etag = client.get("/tickers/AAPL/risks").headers["etag"]
+
+        response = client.get("/tickers/AAPL/risks", headers={"If-None-Match": etag})
+
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["etag"] == etag
+
+    def test_changed_file_returns_200(self, client, tickers_dir):
+        """Test that a modified file no longer matches the old ETag."""
+        etag = client.get("/tickers/SOFI/notes").headers["etag"]
+        (tickers_dir / "SOFI" / "notes.md").write_text("# SOFI notes, updated\n")
+
+        response = client.get("/tickers/SOFI/notes", headers={"If-None-Match": etag})
+
+        assert response.status_code == 200
+        assert response.headers["etag"] != etag
+
+    def test_combined_kb_endpoint(self, client):
+        """Test that /kb returns all present files and null for missing ones."""
+        response = client.get("/tickers/aapl/kb")
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["ticker"] == "AAPL"
+        assert body["thesis"]["content"] == "# AAPL thesis\n"
+        assert body["risks"]["file_type"] == "risks"
+        assert body["notes"] is None
+
+    def test_list_expand_inlines_files(self, client, tickers_dir, monkeypatch):
+        """Test that ?expand= adds the requested files to each listed ticker."""
+        from scripts.api import routes_tickers
+
+        monkeypatch.setattr(routes_tickers, "get_tickers_dir", lambda: tickers_dir)
+
+        body = client.get("/tickers/list?expand=thesis,notes").json()
+
+        aapl, sofi = body["tickers"]
+        assert aapl["thesis"]["content"] == "# AAPL thesis\n"
+        assert aapl["notes"] is None
+        assert "risks" not in aapl
+        assert sofi["notes"]["file_type"] == "notes"
+        assert "thesis" not in client.get("/tickers/list").json()["tickers"][0]
+        assert client.get("/tickers/list?expand=charts").status_code == 400
+
+    def test_response_uses_sanitized_ticker(self, client):
+        """Test that responses report the normalized ticker symbol."""
+        response = client.get("/tickers/aapl/thesis")
+
+        assert response.json()["ticker"] == "AAPL"
+        assert client.get("/tickers/" + "A" * 11 + "/kb").status_code == 400
+
+    def test_missing_file_returns_404(self, client):
+        """Test that a missing file still returns 404."""
+        response = client.get("/tickers/SOFI/thesis")
+
+        assert response.status_code == 404
+
+
+class TestKnowledgeBasePreload:
+    """Tests for the preloaded in-memory knowledge base."""
+
+    @pytest.fixture(autouse=True)
+    def use_tickers_dir(self, tickers_dir, monkeypatch):
+        """Point the knowledge base at the temporary tickers directory."""
+        from scripts.api import routes_tickers
+
+        monkeypatch.setattr(routes_tickers, "get_tickers_dir_str", lambda: str(tickers_dir))
+
+    def test_preload_serves_from_memory(self, tickers_dir):
+        """Test that preloaded content is served without touching disk."""
+        from scripts.api import routes_tickers
+
+        assert routes_tickers.preload_knowledge_base() == 3
+        (tickers_dir / "AAPL" / "theses.md").write_text("# changed on disk\n")
+
+        assert routes_tickers.load_thesis_file("aapl", "thesis") == "# AAPL thesis\n"
+        assert routes_tickers.load_thesis_file("SOFI", "thesis") is None
+
+    def test_refresh_applies_file_changes(self, tickers_dir):
+        """Test that watcher-reported file changes update the knowledge base."""
+        from scripts.api import routes_tickers
+
+        routes_tickers.preload_knowledge_base()
+        thesis_path = tickers_dir / "AAPL" / "theses.md"
+        thesis_path.write_text("# AAPL thesis v2\n")
+        routes_tickers._refresh_kb_path(str(thesis_path))
+
+        assert routes_tickers.load_thesis_file("AAPL", "thesis") == "# AAPL thesis v2\n"
+
+    def test_refresh_handles_ticker_directories(self, tickers_dir):
+        """Test that added and removed ticker directories are reflected."""
+        import shutil
+        from scripts.api import routes_tickers
+
+        routes_tickers.preload_knowledge_base()
+        (tickers_dir / "TSLA").mkdir()
+        (tickers_dir / "TSLA" / "notes.md").write_text("# TSLA notes\n")
+        routes_tickers._refresh_kb_path(str(tickers_dir / "TSLA"))
+        assert routes_tickers.load_thesis_file("TSLA", "notes") == "# TSLA notes\n"
+
+        shutil.rmtree(tickers_dir / "SOFI")
+        routes_tickers._refresh_kb_path(str(tickers_dir / "SOFI"))
+        assert routes_tickers.load_thesis_file("SOFI", "notes") is None
+
+    def test_preload_skips_unreadable_file(self, tickers_dir):
+        """Test that a non-UTF-8 file is skipped instead of failing preload."""
+        from scripts.api import routes_tickers
+
+        (tickers_dir / "AAPL" / "risks.md").write_bytes(b"\xff\xfe not utf-8")
+
+        assert routes_tickers.preload_knowledge_base() == 2
+        assert routes_tickers.load_thesis_file("AAPL", "thesis") == "# AAPL thesis\n"
+        assert routes_tickers.load_thesis_file("AAPL", "risks") is None
+
+    def test_watcher_survives_bad_change_and_falls_back_to_disk(self, tickers_dir, monkeypatch):
+        """Test that a failed refresh is skipped and a stopped watcher disables the cache."""
+        import asyncio
+        from scripts.api import routes_tickers
+
+        routes_tickers.preload_knowledge_base()
+        refreshed = []
+
+        def refresh(path):
+            if path == "bad":
+                raise RuntimeError("boom")
+            refreshed.append(path)
+
+        async def fake_awatch(*args, **kwargs):
+            yield {(None, "bad")}
+            yield {(None, "good")}
+            raise OSError("watch failed")
+
+        monkeypatch.setattr(routes_tickers, "_refresh_kb_path", refresh)
+        monkeypatch.setattr(routes_tickers, "awatch", fake_awatch)
+        asyncio.run(routes_tickers.watch_knowledge_base())
+
+        assert refreshed == ["good"]
+        assert routes_tickers._kb_loaded is False
+        (tickers_dir / "AAPL" / "theses.md").write_text("# changed on disk\n")
+        assert routes_tickers.load_thesis_file("AAPL", "thesis") == "# changed on disk\n"
@@ -0,0 +1,405 @@
+"""
+Unit tests for scan detector execution.
+
+Tests functions/detect/runner.py and the detector stage of run_scan() with
+focus on:
+- Building detector instances once from the registry
+- Running detectors in-process and in the detector pool
+- Reusing and shutting down the detector pool
+- Skipping detectors for tickers rejected by RiskGate.ticker_prefilter()
+- Using the provider's batch get_full_snapshots() only when overridden
+- Batch writing feature snapshots
+"""
+
+import asyncio
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime, timezone
+from typing import List, Optional
+
+import pytest
+
+from functions.compute.feature_engine import FeatureSet
+from functions.detect.base import AlertCandidate, DetectorPlugin
+from functions.market.provider_base import MarketDataProvider
+
+# Tables run_scan() writes to, from schema.sql (foreign keys omitted)
+SCAN_DDL = """
+CREATE SEQUENCE IF NOT EXISTS scans_id_seq START 1;
+CREATE TABLE IF NOT EXISTS scans (
+    id INTEGER PRIMARY KEY DEFAULT nextval('scans_id_seq'),
+    scan_ts TIMESTAMP WITH TIME ZONE NOT NULL,
+    config_hash VARCHAR(64) NOT NULL,
+    status VARCHAR(20) NOT NULL,
+    tickers_scanned INTEGER,
+    alerts_generated INTEGER DEFAULT 0,
+    chains_collected INTEGER DEFAULT 0,
+    runtime_seconds DECIMAL(10, 2),
+    error_message TEXT,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE SEQUENCE IF NOT EXISTS feature_snapshots_id_seq START 1;
+CREATE TABLE IF NOT EXISTS feature_snapshots (
+    id INTEGER PRIMARY KEY DEFAULT nextval('feature_snapshots_id_seq'),
+    scan_id INTEGER NOT NULL,
+    ticker VARCHAR(20) NOT NULL,
+    features JSON NOT NULL,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE SEQUENCE IF NOT EXISTS alerts_id_seq START 1;
+CREATE TABLE IF NOT EXISTS alerts (
+    id INTEGER PRIMARY KEY DEFAULT nextval('alerts_id_seq'),
+    scan_id INTEGER NOT NULL,
+    ticker VARCHAR(20) NOT NULL,
+    detector_name VARCHAR(100) NOT NULL,
+    score DECIMAL(8, 4) NOT NULL,
+    strategies JSON,
+    alert_json JSON NOT NULL,
+    sent BOOLEAN DEFAULT FALSE,
+    created_at TIMESTAMP WITH TIME ZONE NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+CREATE TABLE IF NOT EXISTS alert_cooldowns (
+    ticker VARCHAR(20) PRIMARY KEY,
+    last_alert_ts TIMESTAMP WITH TIME ZONE,
+    last_score DECIMAL(8, 4)
+);
+CREATE TABLE IF NOT EXISTS daily_alert_counts (
+    count_date DATE PRIMARY KEY,
+    alert_count INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+class StubDetector(DetectorPlugin):
+    """Detector that records the tickers it saw and fires for AAPL."""
+
+    def __init__(self):
+        self.seen: List[str] = []
+        self._lock = threading.Lock()
+
+    @property
+    def name(self) -> str:
+        return "StubDetector"
+
+    @property
+    def description(self) -> str:
+        return "Fires for AAPL"
+
+    def get_config_key(self) -> str:
+        return "detectors.stub"
+
+    def detect(self, features: FeatureSet) -> Optional[AlertCandidate]:
+        with self._lock:
+            self.seen.append(features.ticker)
+        if features.ticker != "AAPL":
+            return None
+        return AlertCandidate(
+            detector_name=self.name,
+            score=80.0,
+            explanation={"summary": "stub", "reason": "stub", "trigger": "stub"},
+        )
+
+
+class BrokenDetector(StubDetector):
+    """Detector whose detect() raises; detect_safe() turns that into None."""
+
+    @property
+    def name(self) -> str:
+        return "BrokenDetector"
+
+    def detect(self, features: FeatureSet) -> Optional[AlertCandidate]:
+        raise RuntimeError("boom")
+
+
+class StubProvider(MarketDataProvider):
+    """Provider returning a bare snapshot object per ticker."""
+
+    def __init__(self):
+        self.single_calls: List[str] = []
+
+    def get_current_price(self, ticker):
+        return 100.0
+
+    def get_price_history(self, ticker, lookback_days=365):
+        return None
+
+    def get_options_expirations(self, ticker) -> List[date]:
+        return []
+
+    def get_options_chain(self, ticker, expiration):
+        return None
+
+    def get_ticker_info(self, ticker):
+        return None
+
+    def get_full_snapshot(self, ticker):
+        self.single_calls.append(ticker)
+        return _Snapshot(ticker)
+
+
+class BatchStubProvider(StubProvider):
+    """Provider with a multi-symbol endpoint."""
+
+    def __init__(self):
+        super().__init__()
+        self.batch_calls: List[List[str]] = []
+
+    def get_full_snapshots(self, tickers):
+        self.batch_calls.append(list(tickers))
+        return {ticker: _Snapshot(ticker) for ticker in tickers}
+
+
+class _Snapshot:
+    def __init__(self, ticker: str):
+        self.ticker = ticker
+        self.price = 100.0
+
+
+def _features(ticker: str) -> FeatureSet:
+    return FeatureSet(ticker=ticker, timestamp=datetime.now(timezone.utc), price=100.0)
+
+
+@pytest.fixture(autouse=True)
+def reset_runner_state():
+    """Drop cached detectors and the shared pool between tests."""
+    from functions.detect import runner
+
+    runner._process_detectors = None
+    yield
+    runner._process_detectors = None
+    runner.shutdown_detector_pool()
+
+
+# ============================================================================
+# RUNNER HELPERS
+# ============================================================================
+
+
+class _StubRegistry:
+    def __init__(self, classes):
+        self._classes = tuple(classes)
+
+    def get_all_detectors(self):
+        return self._classes
+
+
+class _FailingDetector(StubDetector):
+    def __init__(self):
+        raise ValueError("cannot build")
+
+
+def test_build_detectors_skips_classes_that_fail(monkeypatch):
+    """One instance per registered class; failing classes are skipped."""
+    from functions.detect import runner
+
+    monkeypatch.setattr(
+        runner, "get_registry", lambda: _StubRegistry([StubDetector, _FailingDetector])
+    )
+
+    detectors = runner.build_detectors()
+
+    assert [type(d) for d in detectors] == [StubDetector]
+
+
+def test_run_detectors_collects_candidates():
+    """Only detectors that fire contribute candidates; errors are contained."""
+    from functions.detect.runner import run_detectors
+
+    stub = StubDetector()
+    candidates = run_detectors(_features("AAPL"), [BrokenDetector(), stub])
+
+    assert [c.detector_name for c in candidates] == ["StubDetector"]
+    assert run_detectors(_features("MSFT"), [stub]) == []
+    assert stub.seen == ["AAPL", "MSFT"]
+
+
+def test_run_detectors_builds_process_detectors_once(monkeypatch):
+    """Without explicit detectors the per-process instances are built once."""
+    from functions.detect import runner
+
+    built = []
+
+    def fake_build():
+        built.append(1)
+        return [StubDetector()]
+
+    monkeypatch.setattr(runner, "build_detectors", fake_build)
+
+    runner.run_detectors(_features("AAPL"))
+    runner.run_detectors(_features("MSFT"))
+
+    assert len(built) == 1
+    assert runner._process_detectors[0].seen == ["AAPL", "MSFT"]
+
+
+def test_detector_pool_is_reused_and_shut_down():
+    """The pool is shared for a worker count and recreated when it changes."""
+    from functions.detect import runner
+
+    pool = runner.get_detector_pool(1)
+    assert runner.get_detector_pool(1) is pool
+
+    resized = runner.get_detector_pool(2)
+    assert resized is not pool
+
+    runner.shutdown_detector_pool()
+    assert runner._detector_pool is None
+    assert runner.get_detector_pool(2) is not resized
+
+
+def test_detector_pool_runs_registered_detectors():
+    """run_detectors() works in a spawned worker with the real registry."""
+    from functions.detect.runner import get_detector_pool, run_detectors
+
+    candidates = get_detector_pool(1).submit(run_detectors, _features("AAPL")).result(timeout=120)
+
+    assert isinstance(candidates, list)
+    assert all(isinstance(c, AlertCandidate) for c in candidates)
+
+
+# ============================================================================
+# RUN_SCAN DETECTOR STAGE
+# ============================================================================
+
+
+@pytest.fixture
+def scan_env(make_db, monkeypatch):
+    """Database with the full schema and feature computation stubbed out."""
+    db = make_db(SCAN_DDL)
+    import scripts.run_scan as run_scan_module
+
+    monkeypatch.setattr(run_scan_module, "init_db", lambda: db)
+    monkeypatch.setattr(run_scan_module, "get_db", lambda: db)
+    monkeypatch.setattr(
+        run_scan_module,
+        "compute_features",
+        lambda snapshot, config_hash: _features(snapshot.ticker),
+    )
+    return db
+
+
+def _config(symbols, detector_processes=0):
+    from functions.config.models import AppConfig
+
+    config = AppConfig()
+    config.scan.symbols = list(symbols)
+    config.scan.detector_processes = detector_processes
+    return config
+
+
+def test_scan_runs_detectors_in_process(scan_env, monkeypatch):
+    """With detector_processes=0 the scan builds detectors once and runs them inline."""
+    import scripts.run_scan as run_scan_module
+
+    stub = StubDetector()
+    monkeypatch.setattr(run_scan_module, "build_detectors", lambda: [stub])
+    monkeypatch.setattr(
+        run_scan_module, "get_detector_pool",
+        lambda workers: pytest.fail("pool used with detector_processes=0"),
+    )
+    provider = StubProvider()
+
+    result = asyncio.run(run_scan_module.run_scan(_config(["AAPL", "MSFT"]), provider))
+
+    assert result.status == "completed"
+    assert result.ticker_count == 2
+    assert sorted(stub.seen) == ["AAPL", "MSFT"]
+    assert sorted(provider.single_calls) == ["AAPL", "MSFT"]
+    rows = scan_env.execute(
+        "SELECT ticker FROM feature_snapshots WHERE scan_id = ? ORDER BY ticker",
+        [result.scan_id],
+    ).fetchall()
+    assert rows == [("AAPL",), ("MSFT",)]
+
+
+def test_scan_runs_detectors_in_pool(scan_env, monkeypatch):
+    """With detector_processes > 0 each ticker is submitted to the detector pool."""
+    import scripts.run_scan as run_scan_module
+    from functions.detect import runner
+
+    stub = StubDetector()
+    runner._process_detectors = [stub]  # what a worker builds for itself
+    pool = ThreadPoolExecutor(max_workers=2)
+    requested = []
+
+    def fake_pool(workers):
+        requested.append(workers)
+        return pool
+
+    monkeypatch.setattr(run_scan_module, "get_detector_pool", fake_pool)
+    monkeypatch.setattr(
+        run_scan_module, "build_detectors",
+        lambda: pytest.fail("in-process detectors built with a pool"),
+    )
+
+    try:
+        result = asyncio.run(run_scan_module.run_scan(
+            _config(["AAPL", "MSFT", "SOFI"], detector_processes=2), StubProvider()
+        ))
+    finally:
+        pool.shutdown(wait=True)
+
+    assert result.status == "completed"
+    assert requested == [2]
+    assert sorted(stub.seen) == ["AAPL", "MSFT", "SOFI"]
+
+
+def test_scan_skips_detectors_for_prefiltered_tickers(scan_env, monkeypatch):
+    """Tickers rejected by ticker_prefilter() are not run through detectors."""
+    import scripts.run_scan as run_scan_module
+    from functions.risk.gate import RiskGate
+
+    stub = StubDetector()
+    monkeypatch.setattr(run_scan_module, "build_detectors", lambda: [stub])
+    monkeypatch.setattr(
+        RiskGate,
+        "ticker_prefilter",
+        lambda self, ticker: (False, "over limit") if ticker == "MSFT" else (True, None),
+    )
+
+    result = asyncio.run(run_scan_module.run_scan(_config(["AAPL", "MSFT"]), StubProvider()))
+
+    assert stub.seen == ["AAPL"]
+    # Prefiltered tickers still count as processed and keep their features
+    assert result.ticker_count == 2
+    count = scan_env.execute(
+        "SELECT COUNT(*) FROM feature_snapshots WHERE scan_id = ?", [result.scan_id]
+    ).fetchone()[0]
+    assert count == 2
+
+
+def test_scan_uses_batch_snapshots_when_overridden(scan_env, monkeypatch):
+    """A provider overriding get_full_snapshots() gets one batch call."""
+    import scripts.run_scan as run_scan_module
+
+    monkeypatch.setattr(run_scan_module, "build_detectors", lambda: [StubDetector()])
+    provider = BatchStubProvider()
+
+    result = asyncio.run(run_scan_module.run_scan(_config(["AAPL", "MSFT"]), provider))
+
+    assert result.status == "completed"
+    assert provider.batch_calls == [["AAPL", "MSFT"]]
+    assert provider.single_calls == []
+
+
+# ============================================================================
+# FEATURE SNAPSHOT BATCH WRITE
+# ============================================================================
+
+
+def test_save_snapshots_batch(make_db):
+    """Feature snapshots are written in one batch and round-trip as JSON."""
+    make_db(SCAN_DDL)
+    from functions.db.repositories import FeatureSnapshotRepository, ScanRepository
+
+    scan_id = ScanRepository().create_scan(config_hash="test")
+    repo = FeatureSnapshotRepository()
+
+    assert repo.save_snapshots_batch([]) == 0
+    written = repo.save_snapshots_batch([
+        {"scan_id": scan_id, "ticker": "AAPL", "features": {"iv_percentile": 65.5}},
+        {"scan_id": scan_id, "ticker": "MSFT", "features": {"iv_percentile": 40.1}},
+    ])
+
+    assert written == 2
+    assert repo.get_snapshot(scan_id, "MSFT")["features"]["iv_percentile"] == 40.1
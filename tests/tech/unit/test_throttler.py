@@ -0,0 +1,163 @@
+"""
+Unit tests for AlertThrottler.
+
+Tests the throttling decisions with focus on:
+- Bulk cooldown lookup via CooldownRepository.get_cooldowns
+- should_alert_bulk cooldown and daily-limit handling
+- Within-batch cooldown and daily count tracking
+- Prefetched cooldowns with buffered record_alert writes
+"""
+
+from datetime import timedelta
+
+import pytest
+
+
+@pytest.fixture
+def db(make_db):
+    """Create a DuckDB database with the throttling tables."""
+    return make_db("""
+        CREATE TABLE IF NOT EXISTS alert_cooldowns (
+            ticker VARCHAR(20) PRIMARY KEY,
+            last_alert_ts TIMESTAMP WITH TIME ZONE,
+            last_score DECIMAL(8, 4)
+        );
+        CREATE TABLE IF NOT EXISTS daily_alert_counts (
+            count_date DATE PRIMARY KEY,
+            alert_count INTEGER NOT NULL DEFAULT 0
+        );
+    """)
+
+
+@pytest.fixture
+def throttler(db):
+    """Create an AlertThrottler with default limits (24h cooldown, 5/day)."""
+    from functions.config.models import AppConfig
+    from functions.scoring.throttler import AlertThrottler
+
+    return AlertThrottler(db_connection=db, config=AppConfig())
+
+
+class TestShouldAlertBulk:
+    """Tests for AlertThrottler.should_alert_bulk."""
+
+    def test_get_cooldowns_returns_only_existing_records(self, db):
+        """Test that one query returns records keyed by ticker."""
+        from functions.db.repositories import CooldownRepository
+
+        repo = CooldownRepository()
+        db.execute("INSERT INTO alert_cooldowns VALUES (?, CURRENT_TIMESTAMP, ?)", ["AAPL", 70.0])
+
+        cooldowns = repo.get_cooldowns(["AAPL", "MSFT", "AAPL"])
+
+        assert list(cooldowns) == ["AAPL"]
+        assert float(cooldowns["AAPL"]["last_score"]) == 70.0
+        assert repo.get_cooldowns([]) == {}
+
+    def test_ticker_in_cooldown_is_throttled(self, throttler, db):
+        """Test that a recent alert puts only that ticker in cooldown."""
+        db.execute("INSERT INTO alert_cooldowns VALUES (?, CURRENT_TIMESTAMP, ?)", ["AAPL", 70.0])
+
+        results = throttler.should_alert_bulk([
+            ("AAPL", "low_iv", 80.0),
+            ("msft", "low_iv", 80.0),
+        ])
+
+        assert results[0][0] is False
+        assert results[0][1].startswith("In cooldown")
+        assert results[1] == (True, "")
+
+    def test_expired_cooldown_allows_alert(self, throttler, db):
+        """Test that a cooldown older than cooldown_hours is ignored."""
+        db.execute(
+            "INSERT INTO alert_cooldowns VALUES (?, CURRENT_TIMESTAMP - INTERVAL 25 HOUR, ?)",
+            ["AAPL", 70.0],
+        )
+
+        assert throttler.should_alert_bulk([("AAPL", "low_iv", 80.0)]) == [(True, "")]
+
+    def test_allowed_alert_starts_cooldown_within_batch(self, throttler):
+        """Test that a second candidate for an alerted ticker is throttled."""
+        results = throttler.should_alert_bulk([
+            ("AAPL", "low_iv", 80.0),
+            ("AAPL", "rich_premium", 90.0),
+        ])
+
+        assert [allowed for allowed, _ in results] == [True, False]
+
+    def test_daily_limit_counts_batch_alerts(self, throttler):
+        """Test that allowed candidates count toward max_alerts_per_day."""
+        throttler.max_alerts_per_day = 2
+
+        results = throttler.should_alert_bulk([
+            ("AAPL", "low_iv", 80.0),
+            ("MSFT", "low_iv", 80.0),
+            ("SOFI", "low_iv", 80.0),
+        ])
+
+        assert [allowed for allowed, _ in results] == [True, True, False]
+        assert results[2][1] == "Daily limit reached (2/2)"
+
+    def test_remaining_cooldown_handles_naive_timestamps(self, db):
+        """Test that naive timestamps are treated as UTC."""
+        from functions.scoring.throttler import AlertThrottler
+        from functions.util.time_utils import get_utc_now
+
+        now = get_utc_now()
+        record = {"last_alert_ts": (now - timedelta(hours=1)).replace(tzinfo=None)}
+
+        remaining = AlertThrottler._remaining_cooldown(record, now, timedelta(hours=24))
+
+        assert timedelta(hours=22) < remaining < timedelta(hours=24)
+
+
+class TestPrefetchedCooldowns:
+    """Tests for AlertThrottler with prefetched_cooldowns."""
+
+    @pytest.fixture
+    def prefetched(self, db):
+        """Create a throttler serving cooldowns from memory."""
+        from functions.config.models import AppConfig
+        from functions.db.repositories import CooldownRepository
+        from functions.scoring.throttler import AlertThrottler
+
+        db.execute("INSERT INTO alert_cooldowns VALUES (?, CURRENT_TIMESTAMP, ?)", ["AAPL", 70.0])
+        cooldowns = CooldownRepository().get_cooldowns(["AAPL", "MSFT"])
+        return AlertThrottler(db_connection=db, config=AppConfig(), prefetched_cooldowns=cooldowns)
+
+    def test_should_alert_uses_prefetched_cooldowns(self, prefetched):
+        """Test that cooldowns come from the prefetched records."""
+        assert prefetched.should_alert("AAPL", "low_iv", 80.0) is False
+        assert prefetched.get_last_throttle_reason().startswith("In cooldown")
+        assert prefetched.should_alert("MSFT", "low_iv", 80.0) is True
+
+    def test_record_alert_buffers_until_flush(self, prefetched, db):
+        """Test that recorded alerts apply in memory and persist on flush."""
+        assert prefetched.record_alert("MSFT", "low_iv", 80.0) is True
+        assert prefetched.should_alert("MSFT", "rich_premium", 90.0) is False
+        assert db.execute("SELECT COUNT(*) FROM alert_cooldowns").fetchone()[0] == 1
+
+        assert prefetched.flush_pending_updates() == 1
+
+        assert prefetched.pending_updates == []
+        assert db.execute(
+            "SELECT last_score FROM alert_cooldowns WHERE ticker = 'MSFT'"
+        ).fetchone()[0] == 80
+        assert prefetched.get_daily_count() == 1
+
+    def test_daily_limit_includes_buffered_alerts(self, prefetched):
+        """Test that buffered alerts count toward max_alerts_per_day."""
+        prefetched.max_alerts_per_day = 1
+        prefetched.record_alert("SOFI", "low_iv", 80.0)
+
+        assert prefetched.should_alert("MSFT", "low_iv", 80.0) is False
+        assert prefetched.get_last_throttle_reason() == "Daily limit reached (1/1)"
+
+    def test_ticker_in_cooldown(self, prefetched):
+        """Test the per-ticker cooldown check used to skip detectors."""
+        assert prefetched.ticker_in_cooldown("aapl") is True
+        assert prefetched.ticker_in_cooldown("MSFT") is False
+
+        prefetched.record_alert("MSFT", "low_iv", 80.0)
+
+        assert prefetched.ticker_in_cooldown("MSFT") is True
@@ -0,0 +1,186 @@
+"""
+Unit tests for the transactions CSV importer.
+
+Tests scripts/api/transaction_import.py with focus on:
+- Importing valid rows with exact decimal values
+- Reporting rows that don't parse or don't fit the DECIMAL columns
+- Writing several batches in one transaction (all or nothing)
+- Restricting imports to data/imports/
+"""
+
+from decimal import Decimal
+
+import pytest
+
+TRANSACTIONS_DDL = """
+CREATE SEQUENCE IF NOT EXISTS transactions_id_seq START 1;
+CREATE TABLE IF NOT EXISTS transactions (
+    id INTEGER PRIMARY KEY DEFAULT nextval('transactions_id_seq'),
+    tx_date DATE NOT NULL,
+    account VARCHAR(100),
+    description TEXT,
+    transaction_type VARCHAR(50),
+    symbol VARCHAR(20),
+    quantity DECIMAL(12, 4),
+    price DECIMAL(12, 4),
+    gross_amount DECIMAL(14, 2),
+    commission DECIMAL(14, 2),
+    net_amount DECIMAL(14, 2),
+    currency VARCHAR(3)
+);
+"""
+
+HEADER = "timestamp,ticker,transaction_type,quantity,price,notes\n"
+
+
+@pytest.fixture
+def db(make_db):
+    """Temporary database with the transactions table."""
+    return make_db(TRANSACTIONS_DDL)
+
+
+@pytest.fixture
+def import_dir(tmp_path, monkeypatch):
+    """Point the importer at a temporary data/imports directory."""
+    from scripts.api import transaction_import
+
+    directory = tmp_path / "imports"
+    directory.mkdir()
+    monkeypatch.setattr(transaction_import, "get_import_dir", lambda: directory)
+    return directory
+
+
+def _count(db):
+    return db.execute("SELECT COUNT(*) FROM transactions").fetchone()[0]
+
+
+def test_imports_valid_rows(db, import_dir):
+    """Valid rows are stored with exact quantities, prices and amounts."""
+    from scripts.api.transaction_import import import_transactions_csv
+
+    (import_dir / "trades.csv").write_text(
+        HEADER
+        + "2026-01-05T14:30:00,aapl,buy,0.5,190.1234,first lot\n"
+        + "2026-01-06,SOFI,sell,100,7.25,\n"
+    )
+
+    result = import_transactions_csv("trades.csv")
+
+    assert result == {"records_imported": 2, "error_count": 0, "errors": []}
+    rows = db.execute(
+        "SELECT symbol, transaction_type, quantity, price, gross_amount, net_amount, description "
+        "FROM transactions ORDER BY tx_date"
+    ).fetchall()
+    assert rows[0] == ("AAPL", "BUY", Decimal("0.5000"), Decimal("190.1234"),
+                       Decimal("95.06"), Decimal("95.06"), "first lot")
+    assert rows[1] == ("SOFI", "SELL", Decimal("100.0000"), Decimal("7.2500"),
+                       Decimal("725.00"), Decimal("725.00"), None)
+
+
+def test_bad_rows_are_reported_and_skipped(db, import_dir):
+    """Unparseable, non-finite and out-of-range values are rejected per row."""
+    from scripts.api.transaction_import import import_transactions_csv
+
+    (import_dir / "trades.csv").write_text(
+        HEADER
+        + "2026-01-05,AAPL,buy,1,100,\n"
+        + "2026-01-05,AAPL,buy,nan,100,\n"
+        + "2026-01-05,AAPL,buy,1,inf,\n"
+        + "2026-01-05,AAPL,buy,100000000,1,\n"
+        + "2026-01-05,AAPL,buy,99999999,99999,\n"
+        + "2026-01-05,AAPL,buy,abc,1,\n"
+        + "not-a-date,AAPL,buy,1,1,\n"
+    )
+
+    result = import_transactions_csv("trades.csv")
+
+    assert result["records_imported"] == 1
+    assert result["error_count"] == 6
+    assert [e.split(":")[0] for e in result["errors"]] == [
+        "line 3", "line 4", "line 5", "line 6", "line 7", "line 8",
+    ]
+    assert "finite" in result["errors"][0]
+    assert "quantity out of range" in result["errors"][2]
+    assert "amount out of range" in result["errors"][3]
+    assert _count(db) == 1
+
+
+def test_rows_are_written_in_batches(db, import_dir, monkeypatch):
+    """Files larger than one batch are fully imported."""
+    from scripts.api import transaction_import
+
+    monkeypatch.setattr(transaction_import, "TRANSACTION_IMPORT_BATCH_SIZE", 3)
+    lines = "".join(f"2026-01-{day:02d},AAPL,buy,{day},10,\n" for day in range(1, 11))
+    (import_dir / "trades.csv").write_text(HEADER + lines)
+
+    result = transaction_import.import_transactions_csv("trades.csv")
+
+    assert result["records_imported"] == 10
+    assert _count(db) == 10
+
+
+def test_failed_batch_rolls_back_whole_import(db, import_dir, monkeypatch):
+    """A database failure in a later batch leaves no rows committed."""
+    from scripts.api import transaction_import
+
+    monkeypatch.setattr(transaction_import, "TRANSACTION_IMPORT_BATCH_SIZE", 2)
+    lines = "".join(f"2026-01-0{day},AAPL,buy,1,10,\n" for day in range(1, 6))
+    (import_dir / "trades.csv").write_text(HEADER + lines)
+
+    calls = []
+    original = db.execute_many_batches
+
+    def failing_batches(sql, batches):
+        def wrapped():
+            for batch in batches:
+                calls.append(len(batch))
+                if len(calls) == 3:
+                    raise OSError("disk full")
+                yield batch
+        return original(sql, wrapped())
+
+    monkeypatch.setattr(db, "execute_many_batches", failing_batches)
+
+    with pytest.raises(RuntimeError):
+        transaction_import.import_transactions_csv("trades.csv")
+    assert calls == [2, 2, 1]
+    assert _count(db) == 0
+
+
+def test_missing_columns_rejected(db, import_dir):
+    """A CSV without the required columns is rejected before importing."""
+    from scripts.api.transaction_import import import_transactions_csv
+
+    (import_dir / "trades.csv").write_text("timestamp,ticker\n2026-01-05,AAPL\n")
+
+    with pytest.raises(ValueError, match="quantity"):
+        import_transactions_csv("trades.csv")
+
+
+@pytest.mark.parametrize("file_path", ["/etc/passwd", "../secrets.csv", "sub/../../x.csv", ""])
+def test_paths_outside_import_dir_rejected(import_dir, file_path):
+    """Absolute paths and '..' components are refused."""
+    from scripts.api.transaction_import import resolve_import_path
+
+    with pytest.raises(ValueError):
+        resolve_import_path(file_path)
+
+
+def test_symlink_escaping_import_dir_rejected(import_dir, tmp_path):
+    """A symlink pointing outside data/imports/ is refused."""
+    from scripts.api.transaction_import import resolve_import_path
+
+    outside = tmp_path / "outside.csv"
+    outside.write_text(HEADER)
+    (import_dir / "link.csv").symlink_to(outside)
+
+    with pytest.raises(ValueError):
+        resolve_import_path("link.csv")
+
+
+def test_missing_file_raises(import_dir):
+    """A relative name that doesn't exist raises FileNotFoundError."""
+    from scripts.api.transaction_import import resolve_import_path
+
+    with pytest.raises(FileNotFoundError):
+        resolve_import_path("nope.csv")